@@ -0,0 +1,197 @@
+"""Scaling benchmarks for DeadlineReminder.
+
+Synthesizes databases of increasing size with realistic status, priority and
+category mixes, times every core operation and writes throughput, p50/p99
+latency and peak memory to JSON. Pass --baseline to compare against an earlier
+run and flag regressions.
+
+    python benchmark.py --sizes 10000 100000 1000000 --output bench.json
+    python benchmark.py --baseline bench.json --output bench-new.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+from main import DeadlineReminder, NotificationManager, Priority, Status
+
+STATUS_WEIGHTS = {Status.PENDING: 55, Status.IN_PROGRESS: 20, Status.COMPLETED: 20, Status.OVERDUE: 5}
+PRIORITY_WEIGHTS = {Priority.LOW: 30, Priority.MEDIUM: 35, Priority.HIGH: 25, Priority.URGENT: 10}
+# Roughly Zipf-distributed: a few categories hold most of the rows
+CATEGORIES = ["Work", "Personal", "Education", "Health", "Finance", "Home", "Travel", "Family",
+              "Shopping", "Legal", "Car", "Garden"]
+CATEGORY_WEIGHTS = [1 / (rank + 1) for rank in range(len(CATEGORIES))]
+
+def synthesize_records(count: int, rng: random.Random, now: datetime):
+    """Yield `count` random deadline records due between 60 days ago and 120 days ahead"""
+    statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+    priorities, priority_weights = zip(*PRIORITY_WEIGHTS.items())
+    for i in range(count):
+        status = rng.choices(statuses, status_weights)[0]
+        if status == Status.OVERDUE:
+            due_date = now - timedelta(seconds=rng.randint(1, 60 * 86400))
+        else:
+            due_date = now + timedelta(seconds=rng.randint(-60 * 86400, 120 * 86400))
+        yield {
+            "title": f"Task {i}",
+            "description": "Synthetic benchmark deadline",
+            "due_date": due_date,
+            "priority": rng.choices(priorities, priority_weights)[0],
+            "category": rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0],
+            "status": status,
+        }
+
+def build_database(path: str, size: int, seed: int) -> float:
+    """Create a database of `size` rows and return the seconds it took"""
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()), DeadlineReminder(path) as reminder:
+        result = reminder.add_deadlines_bulk(synthesize_records(size, rng, datetime.now()), chunk_size=20000)
+    if result.errors:
+        raise RuntimeError(f"synthesis rejected {len(result.errors)} rows: {result.errors[:3]}")
+    return time.perf_counter() - started
+
+def database_bytes(path: str) -> int:
+    """Size of the database file plus its write-ahead log, which may still hold recent pages"""
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+
+def percentile(sorted_values, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure(func, samples: int) -> dict:
+    """Time `samples` calls of func(i), then one extra call under tracemalloc for peak memory"""
+    latencies = []
+    sink = io.StringIO()
+    with redirect_stdout(sink):
+        for i in range(samples):
+            started = time.perf_counter()
+            func(i)
+            latencies.append(time.perf_counter() - started)
+            sink.seek(0)
+            sink.truncate()
+        tracemalloc.start()
+        func(samples)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "samples": samples,
+        "throughput_ops_s": samples / total if total else None,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "peak_memory_bytes": peak,
+    }
+
+def run_size(path: str, size: int, point_samples: int, scan_samples: int, seed: int) -> dict:
+    """Benchmark every operation against a database of `size` rows"""
+    rng = random.Random(seed + 1)
+    now = datetime.now()
+    with redirect_stdout(io.StringIO()):
+        reminder = DeadlineReminder(path)
+    notifier = NotificationManager(reminder)
+    ids = [rng.randint(1, size) for _ in range(point_samples + 1)]
+    # Full scans materialize every row, so sample them less often on big tables
+    scans = max(1, scan_samples if size <= 100000 else scan_samples // 4)
+    operations = {
+        "add_deadline": (lambda i: reminder.add_deadline(
+            f"Bench {i}", now + timedelta(days=rng.randint(-30, 90)), Priority.MEDIUM, "Work"), point_samples),
+        "get_deadline": (lambda i: reminder.get_deadline(ids[i]), point_samples),
+        "update_status": (lambda i: reminder.update_status(
+            ids[i], Status.IN_PROGRESS if i % 2 else Status.PENDING), point_samples),
+        "get_upcoming_deadlines": (lambda i: reminder.get_upcoming_deadlines(7), scans),
+        "get_overdue_deadlines": (lambda i: reminder.get_overdue_deadlines(), scans),
+        "get_all_deadlines": (lambda i: reminder.get_all_deadlines(), scans),
+        "check_upcoming_deadlines": (lambda i: notifier.check_upcoming_deadlines(3), scans),
+    }
+    try:
+        return {name: measure(func, samples) for name, (func, samples) in operations.items()}
+    finally:
+        reminder.close()
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """Return (size, operation, old_p50, new_p50) for every p50 slower than baseline by > threshold"""
+    regressions = []
+    for size, operations in results["results"].items():
+        for name, stats in operations.get("operations", {}).items():
+            old = baseline.get("results", {}).get(size, {}).get("operations", {}).get(name)
+            if old and old["p50_ms"] and stats["p50_ms"] > old["p50_ms"] * (1 + threshold):
+                regressions.append((size, name, old["p50_ms"], stats["p50_ms"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DeadlineReminder as the table grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="row counts to synthesize (up to 10000000)")
+    parser.add_argument("--samples", type=int, default=200, help="calls per single-row operation")
+    parser.add_argument("--scan-samples", type=int, default=20, help="calls per full-window query")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", help="directory for the synthesized databases (default: a temp dir)")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file to write results to")
+    parser.add_argument("--baseline", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="relative p50 slowdown that counts as a regression (default 0.20)")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="deadline-bench-")
+    results = {
+        "meta": {
+            "started_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    try:
+        for size in args.sizes:
+            path = os.path.join(workdir, f"bench_{size}.db")
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            print(f"⏳ Synthesizing {size:,} rows...", file=sys.stderr)
+            build_seconds = build_database(path, size, args.seed)
+            print(f"⏳ Benchmarking {size:,} rows...", file=sys.stderr)
+            results["results"][str(size)] = {
+                "build_seconds": build_seconds,
+                "db_bytes": database_bytes(path),
+                "operations": run_size(path, size, args.samples, args.scan_samples, args.seed),
+            }
+            for name, stats in results["results"][str(size)]["operations"].items():
+                print(f"{size:>10,} {name:<26} p50 {stats['p50_ms']:9.3f}ms  p99 {stats['p99_ms']:9.3f}ms  "
+                      f"peak {stats['peak_memory_bytes'] / 1e6:8.2f}MB", file=sys.stderr)
+    finally:
+        # Synthesized databases reach gigabytes at the largest sizes; keep them only in a chosen --workdir
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results written to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for size, name, old, new in regressions:
+            print(f"❌ Regression at {int(size):,} rows: {name} p50 {old:.3f}ms -> {new:.3f}ms", file=sys.stderr)
+        if regressions:
+            return 1
+        print("✅ No regressions against baseline", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,592 +1,4182 @@
-import sqlite3
-from datetime import datetime, timedelta
-import os
-import sys
-
-class Priority:
-    LOW = 1
-    MEDIUM = 2
-    HIGH = 3
-    URGENT = 4
-    
-    @classmethod
-    def get_name(cls, value):
-        names = {
-            1: "LOW",
-            2: "MEDIUM", 
-            3: "HIGH",
-            4: "URGENT"
-        }
-        return names.get(value, "UNKNOWN")
-
-class Status:
-    PENDING = "Pending"
-    IN_PROGRESS = "In Progress"
-    COMPLETED = "Completed"
-    OVERDUE = "Overdue"
-
-class Deadline:
-    def _init_(self, id, title, description, due_date, priority, status, category, created_at, completed_at=None):
-        self.id = id
-        self.title = title
-        self.description = description
-        self.due_date = due_date
-        self.priority = priority
-        self.status = status
-        self.category = category
-        self.created_at = created_at
-        self.completed_at = completed_at
-
-class DeadlineReminder:
-    def _init_(self, db_name: str = "deadlines.db"):
-        self.db_name = db_name
-        self._init_database()
-    
-    def _init_database(self):
-        """Initialize SQLite database with deadlines table"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS deadlines (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    due_date TEXT NOT NULL,
-                    priority INTEGER NOT NULL,
-                    status TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    completed_at TEXT
-                )
-            ''')
-            conn.commit()
-            conn.close()
-            print(f"✅ Database initialized: {self.db_name}")
-        except Exception as e:
-            print(f"❌ Database error: {e}")
-
-    def add_deadline(self, title: str, due_date: datetime, priority: int, category: str, description: str = "") -> int:
-        """Add a new deadline to the database"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().isoformat()
-            
-            cursor.execute('''
-                INSERT INTO deadlines (title, description, due_date, priority, status, category, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (title, description, due_date.isoformat(), priority, Status.PENDING, category, current_time))
-            
-            deadline_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            print(f"✅ Deadline '{title}' added successfully (ID: {deadline_id})")
-            return deadline_id
-        except Exception as e:
-            print(f"❌ Error adding deadline: {e}")
-            return -1
-
-    def get_all_deadlines(self, include_completed: bool = False):
-        """Get all deadlines"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            if include_completed:
-                cursor.execute('SELECT * FROM deadlines ORDER BY due_date ASC')
-            else:
-                cursor.execute('SELECT * FROM deadlines WHERE status != ? ORDER BY due_date ASC', (Status.COMPLETED,))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            deadlines = []
-            for row in rows:
-                try:
-                    deadline = Deadline(
-                        id=row[0],
-                        title=row[1],
-                        description=row[2],
-                        due_date=datetime.fromisoformat(row[3]),
-                        priority=row[4],
-                        status=row[5],
-                        category=row[6],
-                        created_at=datetime.fromisoformat(row[7]),
-                        completed_at=datetime.fromisoformat(row[8]) if row[8] else None
-                    )
-                    deadlines.append(deadline)
-                except Exception as e:
-                    print(f"❌ Error processing deadline row: {e}")
-                    continue
-            return deadlines
-        except Exception as e:
-            print(f"❌ Error fetching deadlines: {e}")
-            return []
-
-    def get_upcoming_deadlines(self, days: int = 7):
-        """Get deadlines due within the next specified days"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            future_date = (datetime.now() + timedelta(days=days)).isoformat()
-            current_date = datetime.now().isoformat()
-            
-            cursor.execute('''
-                SELECT * FROM deadlines 
-                WHERE due_date BETWEEN ? AND ? 
-                AND status != ?
-                ORDER BY due_date ASC
-            ''', (current_date, future_date, Status.COMPLETED))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            deadlines = []
-            for row in rows:
-                try:
-                    deadline = Deadline(
-                        id=row[0],
-                        title=row[1],
-                        description=row[2],
-                        due_date=datetime.fromisoformat(row[3]),
-                        priority=row[4],
-                        status=row[5],
-                        category=row[6],
-                        created_at=datetime.fromisoformat(row[7]),
-                        completed_at=datetime.fromisoformat(row[8]) if row[8] else None
-                    )
-                    deadlines.append(deadline)
-                except Exception as e:
-                    print(f"❌ Error processing deadline: {e}")
-                    continue
-            return deadlines
-        except Exception as e:
-            print(f"❌ Error fetching upcoming deadlines: {e}")
-            return []
-
-    def get_overdue_deadlines(self):
-        """Get all overdue deadlines"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            current_date = datetime.now().isoformat()
-            
-            cursor.execute('''
-                SELECT * FROM deadlines 
-                WHERE due_date < ? 
-                AND status NOT IN (?, ?)
-                ORDER BY due_date ASC
-            ''', (current_date, Status.COMPLETED, Status.OVERDUE))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            deadlines = []
-            for row in rows:
-                try:
-                    deadline = Deadline(
-                        id=row[0],
-                        title=row[1],
-                        description=row[2],
-                        due_date=datetime.fromisoformat(row[3]),
-                        priority=row[4],
-                        status=row[5],
-                        category=row[6],
-                        created_at=datetime.fromisoformat(row[7]),
-                        completed_at=datetime.fromisoformat(row[8]) if row[8] else None
-                    )
-                    # Mark as overdue
-                    if deadline.status != Status.OVERDUE:
-                        self.update_status(deadline.id, Status.OVERDUE)
-                        deadline.status = Status.OVERDUE
-                    deadlines.append(deadline)
-                except Exception as e:
-                    print(f"❌ Error processing overdue deadline: {e}")
-                    continue
-            return deadlines
-        except Exception as e:
-            print(f"❌ Error fetching overdue deadlines: {e}")
-            return []
-
-    def update_status(self, deadline_id: int, status: str) -> bool:
-        """Update the status of a deadline"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            completed_at = datetime.now().isoformat() if status == Status.COMPLETED else None
-            
-            cursor.execute('''
-                UPDATE deadlines 
-                SET status = ?, completed_at = ?
-                WHERE id = ?
-            ''', (status, completed_at, deadline_id))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            
-            if success:
-                print(f"✅ Status updated to '{status}' for deadline ID {deadline_id}")
-            else:
-                print(f"❌ Failed to update status for deadline ID {deadline_id}")
-            
-            return success
-        except Exception as e:
-            print(f"❌ Error updating status: {e}")
-            return False
-
-    def update_priority(self, deadline_id: int, priority: int) -> bool:
-        """Update the priority of a deadline"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('UPDATE deadlines SET priority = ? WHERE id = ?', (priority, deadline_id))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            
-            if success:
-                print(f"✅ Priority updated to '{Priority.get_name(priority)}' for deadline ID {deadline_id}")
-            else:
-                print(f"❌ Failed to update priority for deadline ID {deadline_id}")
-            
-            return success
-        except Exception as e:
-            print(f"❌ Error updating priority: {e}")
-            return False
-
-    def delete_deadline(self, deadline_id: int) -> bool:
-        """Delete a deadline"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('DELETE FROM deadlines WHERE id = ?', (deadline_id,))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            
-            if success:
-                print(f"✅ Deadline ID {deadline_id} deleted successfully")
-            else:
-                print(f"❌ Failed to delete deadline ID {deadline_id}")
-            
-            return success
-        except Exception as e:
-            print(f"❌ Error deleting deadline: {e}")
-            return False
-
-    def get_deadline(self, deadline_id: int):
-        """Get a specific deadline by ID"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM deadlines WHERE id = ?', (deadline_id,))
-            row = cursor.fetchone()
-            conn.close()
-            
-            if row:
-                return Deadline(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    due_date=datetime.fromisoformat(row[3]),
-                    priority=row[4],
-                    status=row[5],
-                    category=row[6],
-                    created_at=datetime.fromisoformat(row[7]),
-                    completed_at=datetime.fromisoformat(row[8]) if row[8] else None
-                )
-            return None
-        except Exception as e:
-            print(f"❌ Error fetching deadline: {e}")
-            return None
-
-class NotificationManager:
-    def _init_(self, reminder):
-        self.reminder = reminder
-    
-    def check_upcoming_deadlines(self, days: int = 3):
-        """Check and notify about upcoming deadlines"""
-        try:
-            upcoming = self.reminder.get_upcoming_deadlines(days)
-            overdue = self.reminder.get_overdue_deadlines()
-            
-            print("\n" + "🔔" * 20)
-            print("        DEADLINE NOTIFICATIONS")
-            print("🔔" * 20)
-            
-            if overdue:
-                print(f"\n❌ OVERDUE DEADLINES ({len(overdue)}):")
-                for deadline in overdue:
-                    days_overdue = (datetime.now() - deadline.due_date).days
-                    print(f"   ⚠️  '{deadline.title}' - {days_overdue} days overdue!")
-            
-            if upcoming:
-                print(f"\n📅 UPCOMING DEADLINES ({len(upcoming)} in next {days} days):")
-                for deadline in upcoming:
-                    days_until = (deadline.due_date - datetime.now()).days
-                    priority_icon = "🔥" if deadline.priority in [Priority.HIGH, Priority.URGENT] else "⚠️"
-                    print(f"   {priority_icon} '{deadline.title}' - Due in {days_until} days ({deadline.due_date.strftime('%m/%d/%Y')})")
-            
-            if not overdue and not upcoming:
-                print("\n✅ No urgent notifications! You're all caught up!")
-            
-            print("🔔" * 20)
-        except Exception as e:
-            print(f"❌ Error checking notifications: {e}")
-
-def add_sample_data(reminder):
-    """Add sample data for demonstration"""
-    sample_deadlines = [
-        ("Complete Project Proposal", datetime.now() + timedelta(days=2), Priority.HIGH, "Work"),
-        ("Study for Math Exam", datetime.now() + timedelta(days=5), Priority.URGENT, "Education"),
-        ("Pay Electricity Bill", datetime.now() + timedelta(days=1), Priority.MEDIUM, "Personal"),
-        ("Doctor Appointment", datetime.now() + timedelta(days=7), Priority.LOW, "Health"),
-        ("Team Meeting", datetime.now() + timedelta(days=3), Priority.MEDIUM, "Work"),
-        ("Birthday Party", datetime.now() + timedelta(days=10), Priority.LOW, "Personal"),
-    ]
-    
-    print("Adding sample deadlines...")
-    for title, due_date, priority, category in sample_deadlines:
-        reminder.add_deadline(title, due_date, priority, category)
-    print("✅ Sample data added successfully!")
-
-def display_deadlines_table(deadlines, title):
-    """Display deadlines in a nice table format"""
-    if not deadlines:
-        print(f"No {title} found!")
-        return
-    
-    print(f"\n{title}")
-    print("=" * 100)
-    print(f"{'ID':<3} {'Priority':<8} {'Due Date':<12} {'Status':<12} {'Category':<10} {'Title':<30}")
-    print("=" * 100)
-    
-    for deadline in deadlines:
-        days_until = (deadline.due_date - datetime.now()).days
-        status_icon = "✅" if deadline.status == Status.COMPLETED else "❌" if deadline.status == Status.OVERDUE else "⏳"
-        priority_name = Priority.get_name(deadline.priority)
-        
-        # Color coding for priority
-        if deadline.priority == Priority.URGENT:
-            priority_display = f"🔴{priority_name}"
-        elif deadline.priority == Priority.HIGH:
-            priority_display = f"🟠{priority_name}"
-        elif deadline.priority == Priority.MEDIUM:
-            priority_display = f"🟡{priority_name}"
-        else:
-            priority_display = f"🟢{priority_name}"
-        
-        # Truncate long titles
-        display_title = deadline.title[:27] + "..." if len(deadline.title) > 30 else deadline.title
-        
-        time_display = f"Overdue {abs(days_until)}d" if days_until < 0 else f"In {days_until}d"
-        
-        print(f"{deadline.id:<3} {priority_display:<8} {deadline.due_date.strftime('%m/%d/%Y'):<12} "
-              f"{deadline.status:<12} {deadline.category:<10} {display_title:<30} {time_display}")
-
-def main():
-    """Main function to run the deadline reminder application"""
-    print("📅 DEADLINE REMINDER & TRACKING SYSTEM")
-    print("=" * 60)
-    
-    # Initialize reminder and notifier
-    reminder = DeadlineReminder()
-    notifier = NotificationManager(reminder)
-    
-    # Ask if user wants sample data
-    try:
-        add_samples = input("Do you want to load sample data for testing? (y/n): ").strip().lower()
-        if add_samples == 'y':
-            add_sample_data(reminder)
-    except:
-        pass
-    
-    while True:
-        print("\n" + "=" * 60)
-        print("📅 DEADLINE REMINDER MENU")
-        print("=" * 60)
-        print("1. Add New Deadline")
-        print("2. View All Deadlines")
-        print("3. View Upcoming Deadlines")
-        print("4. View Overdue Deadlines")
-        print("5. Update Deadline Status")
-        print("6. Update Deadline Priority")
-        print("7. Delete Deadline")
-        print("8. Check Notifications")
-        print("9. Exit")
-        print("-" * 60)
-        
-        try:
-            choice = input("Enter your choice (1-9): ").strip()
-            
-            if choice == '1':
-                print("\n➕ ADD NEW DEADLINE")
-                try:
-                    title = input("Enter title: ").strip()
-                    if not title:
-                        print("❌ Title cannot be empty!")
-                        continue
-                    
-                    due_date_str = input("Enter due date (YYYY-MM-DD): ").strip()
-                    due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
-                    
-                    print("\nPriority Levels:")
-                    print("  1. LOW 🟢")
-                    print("  2. MEDIUM 🟡") 
-                    print("  3. HIGH 🟠")
-                    print("  4. URGENT 🔴")
-                    
-                    priority_choice = int(input("Enter priority (1-4): "))
-                    if priority_choice not in [1, 2, 3, 4]:
-                        print("❌ Invalid priority! Please enter 1-4.")
-                        continue
-                    
-                    category = input("Enter category: ").strip()
-                    description = input("Enter description (optional): ").strip()
-                    
-                    reminder.add_deadline(title, due_date, priority_choice, category, description)
-                    
-                except ValueError as e:
-                    print(f"❌ Invalid input: {e}")
-                except Exception as e:
-                    print(f"❌ Error adding deadline: {e}")
-            
-            elif choice == '2':
-                print("\n📋 ALL DEADLINES")
-                include_completed = input("Include completed deadlines? (y/n): ").strip().lower() == 'y'
-                deadlines = reminder.get_all_deadlines(include_completed)
-                display_deadlines_table(deadlines, "ALL DEADLINES")
-            
-            elif choice == '3':
-                print("\n📅 UPCOMING DEADLINES")
-                try:
-                    days = int(input("Enter number of days to look ahead (default 7): ") or "7")
-                    deadlines = reminder.get_upcoming_deadlines(days)
-                    display_deadlines_table(deadlines, f"UPCOMING DEADLINES (Next {days} days)")
-                except ValueError:
-                    print("❌ Invalid number of days!")
-            
-            elif choice == '4':
-                print("\n❌ OVERDUE DEADLINES")
-                deadlines = reminder.get_overdue_deadlines()
-                display_deadlines_table(deadlines, "OVERDUE DEADLINES")
-            
-            elif choice == '5':
-                print("\n🔄 UPDATE DEADLINE STATUS")
-                try:
-                    deadline_id = int(input("Enter deadline ID: "))
-                    deadline = reminder.get_deadline(deadline_id)
-                    
-                    if not deadline:
-                        print("❌ Deadline not found!")
-                        continue
-                    
-                    print(f"\nCurrent status: {deadline.status}")
-                    print("Available statuses:")
-                    print(f"  1. {Status.PENDING}")
-                    print(f"  2. {Status.IN_PROGRESS}")
-                    print(f"  3. {Status.COMPLETED}")
-                    
-                    status_choice = input("Enter status (1-3 or type the status name): ").strip()
-                    
-                    if status_choice == "1":
-                        new_status = Status.PENDING
-                    elif status_choice == "2":
-                        new_status = Status.IN_PROGRESS
-                    elif status_choice == "3":
-                        new_status = Status.COMPLETED
-                    else:
-                        new_status = status_choice
-                    
-                    # Validate status
-                    valid_statuses = [Status.PENDING, Status.IN_PROGRESS, Status.COMPLETED, Status.OVERDUE]
-                    if new_status not in valid_statuses:
-                        print("❌ Invalid status!")
-                        continue
-                    
-                    reminder.update_status(deadline_id, new_status)
-                    
-                except (ValueError, KeyError):
-                    print("❌ Invalid deadline ID or status!")
-            
-            elif choice == '6':
-                print("\n🎯 UPDATE DEADLINE PRIORITY")
-                try:
-                    deadline_id = int(input("Enter deadline ID: "))
-                    deadline = reminder.get_deadline(deadline_id)
-                    
-                    if not deadline:
-                        print("❌ Deadline not found!")
-                        continue
-                    
-                    print(f"\nCurrent priority: {Priority.get_name(deadline.priority)}")
-                    print("Available priorities:")
-                    print("  1. LOW 🟢")
-                    print("  2. MEDIUM 🟡")
-                    print("  3. HIGH 🟠")
-                    print("  4. URGENT 🔴")
-                    
-                    new_priority = int(input("Enter new priority (1-4): "))
-                    if new_priority not in [1, 2, 3, 4]:
-                        print("❌ Invalid priority! Please enter 1-4.")
-                        continue
-                    
-                    reminder.update_priority(deadline_id, new_priority)
-                    
-                except (ValueError, KeyError):
-                    print("❌ Invalid deadline ID or priority!")
-            
-            elif choice == '7':
-                print("\n🗑️ DELETE DEADLINE")
-                try:
-                    deadline_id = int(input("Enter deadline ID to delete: "))
-                    deadline = reminder.get_deadline(deadline_id)
-                    
-                    if not deadline:
-                        print("❌ Deadline not found!")
-                        continue
-                    
-                    confirm = input(f"Are you sure you want to delete '{deadline.title}'? (y/n): ").strip().lower()
-                    if confirm == 'y':
-                        reminder.delete_deadline(deadline_id)
-                    else:
-                        print("Deletion cancelled.")
-                        
-                except ValueError:
-                    print("❌ Invalid deadline ID!")
-            
-            elif choice == '8':
-                print("\n🔔 NOTIFICATIONS")
-                try:
-                    days = int(input("Enter days to check for upcoming deadlines (default 3): ") or "3")
-                    notifier.check_upcoming_deadlines(days)
-                except ValueError:
-                    print("❌ Invalid number of days!")
-            
-            elif choice == '9':
-                print("\n👋 Thank you for using Deadline Reminder! Stay productive! 🚀")
-                break
-            
-            else:
-                print("❌ Invalid choice! Please enter a number between 1-9.")
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Program interrupted by user. Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-
-if _name_ == "_main_":
+import sqlite3
+from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from email.message import EmailMessage
+from operator import attrgetter
+from itertools import chain, cycle, islice, zip_longest
+import argparse
+import asyncio
+import bisect
+import calendar
+import copy
+import csv
+import heapq
+import inspect
+import json
+import logging
+import mailbox
+import multiprocessing
+import os
+import queue
+import shlex
+import sys
+import threading
+import time
+import urllib.request
+import zlib
+
+logger = logging.getLogger("deadline_reminder")
+
+class Priority:
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    URGENT = 4
+    
+    @classmethod
+    def get_name(cls, value):
+        names = {
+            1: "LOW",
+            2: "MEDIUM", 
+            3: "HIGH",
+            4: "URGENT"
+        }
+        return names.get(value, "UNKNOWN")
+    
+    @classmethod
+    def parse(cls, value):
+        """Parse a priority given as 1-4 or as a name such as 'HIGH'"""
+        if isinstance(value, str):
+            value = value.strip()
+            if not value.isdigit():
+                name, value = value, getattr(cls, value.upper(), None)
+                if not isinstance(value, int):
+                    raise ValueError(f"unknown priority {name!r}")
+        priority = int(value)
+        if priority not in (cls.LOW, cls.MEDIUM, cls.HIGH, cls.URGENT):
+            raise ValueError(f"priority must be 1-4, got {priority}")
+        return priority
+
+class Status:
+    PENDING = "Pending"
+    IN_PROGRESS = "In Progress"
+    COMPLETED = "Completed"
+    OVERDUE = "Overdue"
+    ALL = (PENDING, IN_PROGRESS, COMPLETED, OVERDUE)
+
+# Column order shared by every deadline query and the Deadline constructor, so
+# rows are materialized with a plain Deadline(*row)
+DEADLINE_COLUMNS = ("id", "title", "description", "due_date", "priority", "status", "category",
+                    "created_at", "completed_at")
+DEADLINE_SELECT = f"SELECT {', '.join(DEADLINE_COLUMNS)} FROM deadlines"
+
+def _lazy_datetime(slot: str):
+    """Property that parses an ISO-8601 string on first access and caches the datetime"""
+    def getter(self):
+        value = getattr(self, slot)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            setattr(self, slot, value)
+        return value
+    
+    def setter(self, value):
+        setattr(self, slot, value or None)
+    
+    return property(getter, setter)
+
+class Deadline:
+    __slots__ = ("id", "title", "description", "_due_date", "priority", "status", "category",
+                 "_created_at", "_completed_at")
+    
+    def __init__(self, id, title=None, description=None, due_date=None, priority=None, status=None, category=None,
+                 created_at=None, completed_at=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        # Timestamps may be datetimes or raw ISO strings from the database
+        self._due_date = due_date
+        self.priority = priority
+        self.status = status
+        self.category = category
+        self._created_at = created_at
+        self._completed_at = completed_at or None
+    
+    due_date = _lazy_datetime("_due_date")
+    created_at = _lazy_datetime("_created_at")
+    completed_at = _lazy_datetime("_completed_at")
+    
+    def to_dict(self) -> dict:
+        """Plain dict with ISO-8601 timestamps, for JSON/CSV output"""
+        record = {}
+        for column in DEADLINE_COLUMNS:
+            value = getattr(self, "_" + column, None) if column.endswith(("_date", "_at")) else getattr(self, column)
+            record[column] = value.isoformat() if isinstance(value, datetime) else value
+        return record
+
+def deadline_select(columns=None, extra=(), table: str = "deadlines") -> str:
+    """Build a SELECT whose rows map positionally onto Deadline(*row).
+
+    Columns left out of a projection are selected as NULL, so every query
+    shares the same row shape and the constructor is the only row factory.
+    `extra` expressions are appended after the Deadline columns. `table` may
+    be "deadlines_archive", which has the same columns.
+    """
+    if columns is None and not extra and table == "deadlines":
+        return DEADLINE_SELECT
+    if columns is None:
+        columns = DEADLINE_COLUMNS
+    unknown = set(columns) - set(DEADLINE_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown deadline columns: {sorted(unknown)}")
+    selected = [c if c in columns else "NULL" for c in DEADLINE_COLUMNS] + list(extra)
+    return "SELECT " + ", ".join(selected) + " FROM " + table
+
+def _deadline_query(include_completed: bool = False, start: datetime = None, end: datetime = None,
+                    category: str = None, after=None, limit: int = None, columns=None, extra=(),
+                    table: str = "deadlines"):
+    """(sql, params) for deadlines matching iter_deadlines' filters, ordered by (due_ts, id)"""
+    sql = deadline_select(columns, extra, table)
+    clauses, params = [], []
+    if not include_completed:
+        clauses.append('status != ?')
+        params.append(Status.COMPLETED)
+    if start is not None:
+        clauses.append('due_ts >= ?')
+        params.append(to_epoch(start))
+    if end is not None:
+        clauses.append('due_ts < ?')
+        params.append(to_epoch(end))
+    if category is not None:
+        clauses.append('category = ?')
+        params.append(category)
+    if after is not None:
+        after_due, after_id = after
+        clauses.append('(due_ts, id) > (?, ?)')
+        params.extend((to_epoch(after_due), after_id))
+    if clauses:
+        sql += ' WHERE ' + ' AND '.join(clauses)
+    sql += ' ORDER BY due_ts ASC, id ASC'
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params.append(limit)
+    return sql, params
+
+class BulkInsertResult:
+    """Outcome of a bulk insert: inserted ID ranges plus a per-row error report"""
+    def __init__(self):
+        self.inserted = 0
+        self.id_ranges = []  # (first_id, last_id) per committed chunk
+        self.errors = []     # (row_number, message)
+    
+    @property
+    def first_id(self):
+        return self.id_ranges[0][0] if self.id_ranges else None
+    
+    @property
+    def last_id(self):
+        return self.id_ranges[-1][1] if self.id_ranges else None
+
+def to_epoch(value):
+    """Convert a datetime or ISO-8601 string to integer UTC epoch seconds.
+
+    Naive values are taken as local time, matching datetime.now() elsewhere.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp() // 1)
+
+def _parse_datetime(value):
+    """Accept a datetime or an ISO-8601 string, as naive local time.
+
+    Timezone-aware values are converted to local time and stored without an
+    offset, like every other timestamp, so they compare with datetime.now().
+    """
+    if isinstance(value, str) and value.strip():
+        value = datetime.fromisoformat(value.strip())
+    if not isinstance(value, datetime):
+        raise ValueError(f"invalid date {value!r}")
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+def _deadline_params(record, created_at: str):
+    """Validate one import record and build the INSERT parameters for it.
+
+    A record is either a mapping with title/due_date/priority/category and optional
+    description/status keys, or a tuple in add_deadline argument order.
+    """
+    if isinstance(record, dict):
+        title = record.get("title")
+        due_date = record.get("due_date")
+        priority = record.get("priority")
+        category = record.get("category")
+        description = record.get("description") or ""
+        status = record.get("status") or Status.PENDING
+    else:
+        title, due_date, priority, category, *rest = record
+        description = rest[0] if rest else ""
+        status = Status.PENDING
+    title = (title or "").strip()
+    category = (category or "").strip()
+    if not title:
+        raise ValueError("title cannot be empty")
+    if not category:
+        raise ValueError("category cannot be empty")
+    if status not in Status.ALL:
+        raise ValueError(f"invalid status {status!r}")
+    due_date = _parse_datetime(due_date)
+    completed_at = created_at if status == Status.COMPLETED else None
+    return (title, description, due_date.isoformat(), Priority.parse(priority), status, category,
+            created_at, completed_at, to_epoch(due_date), to_epoch(created_at), to_epoch(completed_at))
+
+def iter_csv_records(path: str):
+    """Lazily read deadline records from a CSV file with a header row"""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+def iter_import_records(path: str, file_format: str = None):
+    """Records from a CSV or JSON Lines file; the format defaults from the extension"""
+    if file_format is None:
+        file_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if file_format == "csv":
+        return iter_csv_records(path)
+    if file_format in ("jsonl", "ndjson"):
+        return iter_jsonl_records(path)
+    raise ValueError(f"unsupported import format {file_format!r}")
+
+def iter_jsonl_records(path: str):
+    """Lazily read deadline records from a JSON Lines file.
+
+    Malformed lines are yielded as ValueError instances so the importer can
+    report them against their line number without stopping.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                yield ValueError("blank line")
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"invalid JSON: {e}")
+                continue
+            yield record if isinstance(record, dict) else ValueError("expected a JSON object")
+
+def _backfill_epoch_columns(conn):
+    """Fill the *_ts columns from the ISO text columns in one set-based UPDATE"""
+    conn.create_function("to_epoch", 1, to_epoch, deterministic=True)
+    conn.execute('''
+        UPDATE deadlines
+        SET due_ts = to_epoch(due_date), created_ts = to_epoch(created_at), completed_ts = to_epoch(completed_at)
+    ''')
+
+def _create_search_index(conn):
+    """Create the FTS5 index over title/description/category and the triggers that sync it.
+
+    SQLite builds without FTS5 skip this step; search() then reports that it is
+    unavailable and rebuild_search_index() can create the index later.
+    """
+    try:
+        conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS deadlines_fts USING fts5(
+                title, description, category,
+                content='deadlines', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        logger.warning("❌ Full-text search unavailable (%s); skipping search index", e)
+        return
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadlines_fts_insert AFTER INSERT ON deadlines BEGIN
+            INSERT INTO deadlines_fts (rowid, title, description, category)
+            VALUES (new.id, new.title, new.description, new.category);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadlines_fts_delete AFTER DELETE ON deadlines BEGIN
+            INSERT INTO deadlines_fts (deadlines_fts, rowid, title, description, category)
+            VALUES ('delete', old.id, old.title, old.description, old.category);
+        END
+    ''')
+    # Only text changes touch the index; status/priority updates skip it
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadlines_fts_update AFTER UPDATE OF title, description, category ON deadlines
+        BEGIN
+            INSERT INTO deadlines_fts (deadlines_fts, rowid, title, description, category)
+            VALUES ('delete', old.id, old.title, old.description, old.category);
+            INSERT INTO deadlines_fts (rowid, title, description, category)
+            VALUES (new.id, new.title, new.description, new.category);
+        END
+    ''')
+    conn.execute("INSERT INTO deadlines_fts (deadlines_fts) VALUES ('rebuild')")
+
+def fts_query(text: str, prefix: bool = True) -> str:
+    """Turn free text into an FTS5 query that ANDs every word, optionally as prefixes"""
+    terms = []
+    for word in text.split():
+        term = '"' + word.replace('"', '""') + '"'
+        terms.append(term + "*" if prefix else term)
+    return " ".join(terms)
+
+# Columns reports may group by; also the key of the deadline_counts summary table
+REPORT_FIELDS = ("category", "status", "priority")
+
+def _create_summary_table(conn):
+    """Create deadline_counts, kept current by triggers, and fill it from deadlines"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS deadline_counts (
+            category TEXT NOT NULL,
+            status TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (category, status, priority)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadline_counts_insert AFTER INSERT ON deadlines BEGIN
+            INSERT INTO deadline_counts (category, status, priority, count)
+            VALUES (new.category, new.status, new.priority, 1)
+            ON CONFLICT (category, status, priority) DO UPDATE SET count = count + 1;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadline_counts_delete AFTER DELETE ON deadlines BEGIN
+            UPDATE deadline_counts SET count = count - 1
+            WHERE category = old.category AND status = old.status AND priority = old.priority;
+            DELETE FROM deadline_counts
+            WHERE category = old.category AND status = old.status AND priority = old.priority AND count <= 0;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS deadline_counts_update AFTER UPDATE OF category, status, priority ON deadlines
+        WHEN old.category IS NOT new.category OR old.status IS NOT new.status OR old.priority IS NOT new.priority
+        BEGIN
+            UPDATE deadline_counts SET count = count - 1
+            WHERE category = old.category AND status = old.status AND priority = old.priority;
+            DELETE FROM deadline_counts
+            WHERE category = old.category AND status = old.status AND priority = old.priority AND count <= 0;
+            INSERT INTO deadline_counts (category, status, priority, count)
+            VALUES (new.category, new.status, new.priority, 1)
+            ON CONFLICT (category, status, priority) DO UPDATE SET count = count + 1;
+        END
+    ''')
+    _fill_summary_table(conn)
+
+def _fill_summary_table(conn):
+    conn.execute('DELETE FROM deadline_counts')
+    conn.execute('''
+        INSERT INTO deadline_counts (category, status, priority, count)
+        SELECT category, status, priority, COUNT(*) FROM deadlines GROUP BY category, status, priority
+    ''')
+
+def _report_fields(fields):
+    fields = tuple(fields)
+    unknown = set(fields) - set(REPORT_FIELDS)
+    if unknown:
+        raise ValueError(f"cannot group by {sorted(unknown)}; choose from {', '.join(REPORT_FIELDS)}")
+    return fields
+
+RECURRENCE_COLUMNS = ("id", "title", "description", "category", "priority", "first_due", "frequency", "interval",
+                      "until", "max_occurrences", "created_at")
+RECURRENCE_SELECT = "SELECT {} FROM recurrences".format(", ".join(RECURRENCE_COLUMNS))
+OVERRIDE_SELECT = '''
+    SELECT recurrence_id, occurrence, status, due_date, due_ts, priority, completed_at, deleted
+    FROM recurrence_overrides
+'''
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Shift a datetime by whole months, clamping the day to the end of shorter months"""
+    month = value.month - 1 + months
+    year, month = value.year + month // 12, month % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, calendar.monthrange(year, month)[1]))
+
+def occurrence_id(recurrence_id: int, index: int) -> str:
+    """ID of the index-th occurrence of a recurrence, e.g. 'R12:3'"""
+    return f"R{recurrence_id}:{index}"
+
+def parse_occurrence_id(value):
+    """(recurrence_id, index) for an occurrence ID, or None for a plain deadline ID"""
+    if not isinstance(value, str) or not value.startswith("R"):
+        return None
+    recurrence_id, _, index = value[1:].partition(":")
+    try:
+        return int(recurrence_id), int(index)
+    except ValueError:
+        return None
+
+def _deadline_order(deadline):
+    """Sort key for merged streams: due time, then plain deadlines by ID before occurrences"""
+    parsed = parse_occurrence_id(deadline.id)
+    if parsed is None:
+        return to_epoch(deadline.due_date), 0, deadline.id, 0
+    return (to_epoch(deadline.due_date), 1) + parsed
+
+class RecurrenceRule:
+    """A deadline that repeats every `interval` days, weeks or months, optionally until a date or count.
+
+    Occurrence k falls due at first_due + k intervals; monthly rules are
+    computed from first_due each time so a 31st never drifts to the 28th.
+    """
+    FREQUENCIES = ("daily", "weekly", "monthly")
+    
+    def __init__(self, id, title, description, category, priority, first_due, frequency, interval=1, until=None,
+                 max_occurrences=None, created_at=None):
+        if frequency not in self.FREQUENCIES:
+            raise ValueError(f"invalid frequency {frequency!r} (choose from {', '.join(self.FREQUENCIES)})")
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.id = id
+        self.title = title
+        self.description = description
+        self.category = category
+        self.priority = priority
+        self.first_due = _parse_datetime(first_due)
+        self.frequency = frequency
+        self.interval = interval
+        self.until = _parse_datetime(until) if until else None
+        self.max_occurrences = max_occurrences
+        self.created_at = created_at
+        self._step = timedelta(days=interval * (7 if frequency == "weekly" else 1))
+    
+    def due(self, index: int) -> datetime:
+        if self.frequency == "monthly":
+            return _add_months(self.first_due, index * self.interval)
+        return self.first_due + index * self._step
+    
+    def index_at(self, moment: datetime) -> int:
+        """Index of the first occurrence due at or after `moment`"""
+        if moment <= self.first_due:
+            return 0
+        if self.frequency == "monthly":
+            months = (moment.year - self.first_due.year) * 12 + moment.month - self.first_due.month
+            index = months // self.interval
+        else:
+            index, remainder = divmod(moment - self.first_due, self._step)
+            index += remainder > timedelta(0)
+        while self.due(index) < moment:
+            index += 1
+        return index
+    
+    @property
+    def last_index(self):
+        """Index of the final occurrence, or None for an open-ended rule"""
+        last = None if self.max_occurrences is None else self.max_occurrences - 1
+        if self.until is not None:
+            index = self.index_at(self.until)
+            if self.due(index) > self.until:
+                index -= 1
+            last = index if last is None else min(last, index)
+        return last
+    
+    def occurrences(self, start: datetime = None, end: datetime = None, first_index: int = 0):
+        """Lazily yield (index, due) for start <= due < end; unbounded without `end` or a rule end"""
+        index = max(first_index, self.index_at(start) if start is not None else 0)
+        last = self.last_index
+        while last is None or index <= last:
+            due = self.due(index)
+            if end is not None and due >= end:
+                return
+            yield index, due
+            index += 1
+
+def _create_recurrence_tables(conn):
+    """Recurrence rules are stored once; per-occurrence changes live in a sparse override table"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recurrences (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            category TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            first_due TEXT NOT NULL,
+            frequency TEXT NOT NULL,
+            interval INTEGER NOT NULL DEFAULT 1,
+            until TEXT,
+            max_occurrences INTEGER,
+            created_at TEXT NOT NULL,
+            first_due_ts INTEGER NOT NULL,
+            last_due_ts INTEGER
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recurrence_overrides (
+            recurrence_id INTEGER NOT NULL,
+            occurrence INTEGER NOT NULL,
+            occurrence_ts INTEGER NOT NULL,
+            status TEXT,
+            due_date TEXT,
+            due_ts INTEGER,
+            priority INTEGER,
+            completed_at TEXT,
+            completed_ts INTEGER,
+            deleted INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (recurrence_id, occurrence)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_recurrence_overrides_occurrence_ts '
+                 'ON recurrence_overrides(occurrence_ts)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_recurrence_overrides_due_ts ON recurrence_overrides(due_ts)')
+
+def _create_archive_table(conn):
+    """Cold storage for old completed deadlines, keeping their original IDs.
+
+    deadlines uses AUTOINCREMENT, so an archived ID is never handed out again.
+    The archive is not covered by the search index or the summary table.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS deadlines_archive (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT,
+            due_date TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            category TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            due_ts INTEGER,
+            created_ts INTEGER,
+            completed_ts INTEGER,
+            archived_at TEXT NOT NULL
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_deadlines_archive_due_ts ON deadlines_archive (due_ts)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_deadlines_archive_category_due_ts '
+                 'ON deadlines_archive (category, due_ts)')
+    # Only completed rows have a completed_ts, so archiving walks just the candidates
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_deadlines_completed_ts ON deadlines (completed_ts)')
+
+def _create_notification_log(conn):
+    """One row per notification already sent, keyed by deadline, stage and the due time it announced"""
+    # deadline_id has no declared type so plain IDs stay integers next to 'R<rule>:<index>' occurrence IDs
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS notification_log (
+            deadline_id NOT NULL,
+            stage TEXT NOT NULL,
+            due_ts INTEGER NOT NULL,
+            notified_at TEXT NOT NULL,
+            PRIMARY KEY (deadline_id, stage, due_ts)
+        ) WITHOUT ROWID
+    ''')
+
+def _create_change_log(conn):
+    """Trigger-fed log of every insert, update and delete on deadlines, numbered by a growing seq"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS deadline_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            deadline_id INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            changed_ts INTEGER NOT NULL
+        )
+    ''')
+    # Highest seq removed by compaction; cursors below it can no longer be resumed
+    conn.execute('CREATE TABLE IF NOT EXISTS deadline_changes_state (compacted_seq INTEGER NOT NULL)')
+    conn.execute('INSERT INTO deadline_changes_state (compacted_seq) VALUES (0)')
+    for op, event, row in (("insert", "INSERT", "NEW"), ("update", "UPDATE", "NEW"), ("delete", "DELETE", "OLD")):
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS deadline_changes_{op} AFTER {event} ON deadlines BEGIN
+                INSERT INTO deadline_changes (deadline_id, op, changed_ts)
+                VALUES ({row}.id, '{op}', CAST(strftime('%s', 'now') AS INTEGER));
+            END
+        ''')
+
+class CursorExpiredError(ValueError):
+    """The change-feed cursor points at entries that were compacted away; bootstrap from a snapshot"""
+
+# Ordered schema upgrades applied at startup. Each entry is (version, description, steps)
+# where a step is an SQL statement or a callable taking the connection. Append new
+# versions here instead of editing earlier ones so existing databases upgrade in place.
+SCHEMA_MIGRATIONS = [
+    (1, "Create deadlines table", [
+        '''
+        CREATE TABLE IF NOT EXISTS deadlines (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            due_date TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            category TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            completed_at TEXT
+        )
+        ''',
+    ]),
+    (2, "Index status/category/due_date query paths", [
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_status_due ON deadlines (status, due_date)',
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_category_due ON deadlines (category, due_date)',
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_due ON deadlines (due_date)',
+        'ANALYZE deadlines',
+    ]),
+    (3, "Store timestamps as UTC epoch integers alongside the ISO text", [
+        'ALTER TABLE deadlines ADD COLUMN due_ts INTEGER',
+        'ALTER TABLE deadlines ADD COLUMN created_ts INTEGER',
+        'ALTER TABLE deadlines ADD COLUMN completed_ts INTEGER',
+        _backfill_epoch_columns,
+        'DROP INDEX IF EXISTS idx_deadlines_status_due',
+        'DROP INDEX IF EXISTS idx_deadlines_category_due',
+        'DROP INDEX IF EXISTS idx_deadlines_due',
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_status_due_ts ON deadlines (status, due_ts)',
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_category_due_ts ON deadlines (category, due_ts)',
+        'CREATE INDEX IF NOT EXISTS idx_deadlines_due_ts ON deadlines (due_ts)',
+        'ANALYZE deadlines',
+    ]),
+    (4, "Full-text search index over title/description/category", [
+        _create_search_index,
+    ]),
+    (5, "Trigger-maintained deadline_counts summary table", [
+        _create_summary_table,
+    ]),
+    (6, "Recurrence rules with sparse per-occurrence overrides", [
+        _create_recurrence_tables,
+    ]),
+    (7, "Archive table for old completed deadlines", [
+        _create_archive_table,
+    ]),
+    (8, "Notification log for once-only delivery", [
+        _create_notification_log,
+    ]),
+    (9, "Trigger-fed change log for incremental sync", [
+        _create_change_log,
+    ]),
+]
+
+class ConnectionManager:
+    """Small thread-safe pool of long-lived, pre-configured SQLite connections"""
+
+    def __init__(self, db_name: str, pool_size: int = 4, busy_timeout: float = 5.0,
+                 synchronous: str = "NORMAL", cached_statements: int = 256, trace_callback=None):
+        self.db_name = db_name
+        # Every connection to an in-memory database sees its own private copy
+        if db_name == ":memory:":
+            pool_size = 1
+        self.pool_size = max(1, pool_size)
+        self.busy_timeout = busy_timeout
+        self.synchronous = synchronous
+        self.cached_statements = cached_statements
+        self.trace_callback = trace_callback
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(self.pool_size)
+        self._connections = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    def _connect(self):
+        """Open and configure a new connection"""
+        # isolation_level=None: transactions are managed explicitly by transaction()
+        conn = sqlite3.connect(self.db_name, timeout=self.busy_timeout, isolation_level=None,
+                               check_same_thread=False, cached_statements=self.cached_statements)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        if self.db_name != ":memory:":
+            # Only takes effect while the file is still empty, and setting it takes the write lock,
+            # so leave existing files alone; they switch with one VACUUM (see enable_incremental_vacuum)
+            if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        if self.trace_callback is not None:
+            conn.set_trace_callback(self.trace_callback)
+        return conn
+
+    def _acquire(self):
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            conn = self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        if self._closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection; nested use on the same thread shares it"""
+        local = self._local
+        # Reference-counted: interleaved generators on one thread (e.g. two async iter_* loops)
+        # may finish in any order, so only the last user returns the connection to the pool
+        if not getattr(local, "depth", 0):
+            local.conn, local.depth, local.tx_depth = self._acquire(), 0, 0
+        local.depth += 1
+        conn = local.conn
+        try:
+            yield conn
+        finally:
+            local.depth -= 1
+            if local.depth == 0:
+                local.conn = None
+                self._release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Run a block in a write transaction; nested blocks become savepoints"""
+        with self.connection() as conn:
+            local = self._local
+            depth = local.tx_depth
+            conn.execute("BEGIN IMMEDIATE" if depth == 0 else f"SAVEPOINT sp_{depth}")
+            local.tx_depth = depth + 1
+            try:
+                yield conn
+            except BaseException:
+                local.tx_depth = depth
+                if depth == 0:
+                    conn.rollback()
+                else:
+                    conn.execute(f"ROLLBACK TO sp_{depth}")
+                    conn.execute(f"RELEASE sp_{depth}")
+                raise
+            local.tx_depth = depth
+            conn.execute("COMMIT" if depth == 0 else f"RELEASE sp_{depth}")
+
+    def close(self):
+        """Close every pooled connection"""
+        self._closed = True
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+class DeadlineCache:
+    """Bounded LRU of deadlines by ID plus short-TTL results for windowed queries.
+
+    Query results remember the due_ts window they cover and the IDs they
+    contain, so a write only drops the entries it can actually affect.
+    """
+    def __init__(self, max_items: int = 1024, query_ttl: float = 2.0):
+        self.max_items = max_items
+        self.query_ttl = query_ttl
+        self.generation = 0
+        self._items = OrderedDict()
+        self._queries = {}  # key -> (expires_at, lo_ts, hi_ts, ids, result)
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("hits", "misses", "evictions", "query_hits", "query_misses",
+                                        "query_expired", "invalidations"), 0)
+    
+    def get(self, deadline_id: int):
+        with self._lock:
+            deadline = self._items.get(deadline_id)
+            if deadline is None:
+                self._counters["misses"] += 1
+                return None
+            self._items.move_to_end(deadline_id)
+            self._counters["hits"] += 1
+            return deadline
+    
+    def put(self, deadline, generation: int):
+        with self._lock:
+            # A write since the caller started reading may have made this row stale
+            if generation != self.generation:
+                return
+            self._items[deadline.id] = deadline
+            self._items.move_to_end(deadline.id)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+                self._counters["evictions"] += 1
+    
+    def get_query(self, key):
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None:
+                self._counters["query_misses"] += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self._queries[key]
+                self._counters["query_expired"] += 1
+                self._counters["query_misses"] += 1
+                return None
+            self._counters["query_hits"] += 1
+            return entry[4]
+    
+    def put_query(self, key, lo_ts, hi_ts, result, generation: int):
+        with self._lock:
+            if generation != self.generation:
+                return
+            ids = {deadline.id for deadline in result}
+            self._queries[key] = (time.monotonic() + self.query_ttl, lo_ts, hi_ts, ids, result)
+    
+    def invalidate(self, deadline_id: int, due_ts=None):
+        """Drop one deadline and every cached query whose window or rows it touches.
+
+        An unknown due_ts (None) conservatively drops all cached queries.
+        """
+        with self._lock:
+            self.generation += 1
+            self._counters["invalidations"] += 1
+            self._items.pop(deadline_id, None)
+            for key, (_, lo_ts, hi_ts, ids, _) in list(self._queries.items()):
+                if (due_ts is None or deadline_id in ids
+                        or ((lo_ts is None or lo_ts <= due_ts) and (hi_ts is None or due_ts <= hi_ts))):
+                    del self._queries[key]
+    
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._items.clear()
+            self._queries.clear()
+    
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters plus current sizes"""
+        with self._lock:
+            return dict(self._counters, items=len(self._items), queries=len(self._queries))
+
+class Instrumentation:
+    """Per-operation call, error, row and SQL counters with latency histograms.
+
+    Methods are wrapped on the instance only when instrumentation is enabled,
+    so a DeadlineReminder created without it runs the plain methods.
+    """
+    LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                       0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        self._ops = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def _op(self, name: str) -> dict:
+        op = self._ops.get(name)
+        if op is None:
+            op = self._ops.setdefault(name, {"calls": 0, "errors": 0, "rows": 0, "sql_statements": 0,
+                                             "latency_sum": 0.0,
+                                             "buckets": [0] * (len(self.LATENCY_BUCKETS) + 1)})
+        return op
+    
+    def record(self, name: str, seconds: float, rows: int = 0, error: bool = False):
+        with self._lock:
+            op = self._op(name)
+            op["calls"] += 1
+            op["errors"] += error
+            op["rows"] += rows
+            op["latency_sum"] += seconds
+            op["buckets"][bisect.bisect_left(self.LATENCY_BUCKETS, seconds)] += 1
+    
+    def record_error(self, name: str):
+        with self._lock:
+            self._op(name)["errors"] += 1
+    
+    def trace_sql(self, statement: str):
+        """sqlite3 trace callback: attribute each executed statement to the running operation"""
+        name = getattr(self._local, "operation", None) or "(unattributed)"
+        with self._lock:
+            self._op(name)["sql_statements"] += 1
+    
+    def wrap(self, name: str, func):
+        """Wrap a bound method (or generator method) so every call is recorded"""
+        local = self._local
+        
+        if inspect.isgeneratorfunction(func):
+            def wrapper(*args, **kwargs):
+                started, rows, failed = time.perf_counter(), 0, False
+                outer = getattr(local, "operation", None)
+                generator = func(*args, **kwargs)
+                try:
+                    while True:
+                        # Attribute SQL to this operation only while it is producing rows
+                        local.operation = name
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                        finally:
+                            local.operation = outer
+                        rows += 1
+                        yield item
+                except BaseException as e:
+                    failed = not isinstance(e, GeneratorExit)
+                    raise
+                finally:
+                    generator.close()
+                    self.record(name, time.perf_counter() - started, rows, failed)
+        else:
+            def wrapper(*args, **kwargs):
+                started, failed, result = time.perf_counter(), True, None
+                outer = getattr(local, "operation", None)
+                local.operation = name
+                try:
+                    result = func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    local.operation = outer
+                    self.record(name, time.perf_counter() - started, _rows_touched(name, result), failed)
+        
+        wrapper.__name__ = name
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    
+    def stats(self) -> dict:
+        """Snapshot of every operation's counters and latency histogram"""
+        with self._lock:
+            snapshot = {}
+            for name, op in self._ops.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.LATENCY_BUCKETS + (float("inf"),), op["buckets"]):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[name] = dict(op, buckets=buckets,
+                                      latency_avg=op["latency_sum"] / op["calls"] if op["calls"] else 0.0)
+            return snapshot
+    
+    def to_prometheus(self, prefix: str = "deadline_reminder") -> str:
+        """Render the counters and histograms in the Prometheus text exposition format"""
+        stats = self.stats()
+        lines = []
+        for metric, key, help_text in (("calls_total", "calls", "Operation calls"),
+                                       ("errors_total", "errors", "Operation errors"),
+                                       ("rows_total", "rows", "Rows returned or modified"),
+                                       ("sql_statements_total", "sql_statements", "SQL statements executed")):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, op in sorted(stats.items()):
+                lines.append(f'{prefix}_{metric}{{operation="{name}"}} {op[key]}')
+        lines.append(f"# HELP {prefix}_latency_seconds Operation latency")
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for name, op in sorted(stats.items()):
+            if not op["calls"]:
+                continue
+            for bound, count in op["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_latency_seconds_bucket{{operation="{name}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{operation="{name}"}} {op["latency_sum"]}')
+            lines.append(f'{prefix}_latency_seconds_count{{operation="{name}"}} {op["calls"]}')
+        return "\n".join(lines) + "\n"
+    
+    def export_prometheus(self, path: str):
+        """Atomically write the Prometheus text format to `path` (e.g. for node_exporter's textfile collector)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+def _rows_touched(operation: str, result) -> int:
+    """Best-effort row count for an instrumented call's return value"""
+    if operation in ("add_deadline", "add_recurrence"):
+        return 1 if isinstance(result, int) and result > 0 else 0
+    if isinstance(result, bool):
+        return int(result)
+    if isinstance(result, int):
+        return max(result, 0)
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, BulkInsertResult):
+        return result.inserted
+    return 0 if result is None else 1
+
+class PeriodicTask(threading.Thread):
+    """Daemon thread that calls `func` immediately and then every `interval` seconds"""
+    def __init__(self, interval: float, func, name: str = None):
+        super().__init__(name=name, daemon=True)
+        self.interval = interval
+        self.func = func
+        self._stopped = threading.Event()
+    
+    def run(self):
+        while True:
+            try:
+                self.func()
+            except Exception as e:
+                logger.error("❌ Background task %s failed: %s", self.name, e)
+            if self._stopped.wait(self.interval):
+                return
+    
+    def stop(self, timeout: float = None):
+        """Signal the thread to stop and wait for the current run to finish"""
+        self._stopped.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+class WriteBehindWriter(threading.Thread):
+    """Single writer thread that commits queued write calls in groups.
+
+    Calls are collected until `max_batch` are pending or the first has waited
+    `max_delay` seconds, then run in one transaction, each in its own
+    savepoint so a failing call does not undo the others. A call's Future
+    resolves with the method's return value only after its group commits.
+    submit() blocks while `max_pending` calls are queued.
+    """
+    def __init__(self, transaction, max_delay: float = 0.005, max_batch: int = 500, max_pending: int = 10000):
+        super().__init__(name="write-behind", daemon=True)
+        self.transaction = transaction
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._queue = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._stopped = False
+    
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Queue func(*args, **kwargs) and return a Future for its result"""
+        future = Future()
+        # The lock keeps anything from being queued behind the stop marker
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("the write-behind writer is stopped")
+            self._queue.put((future, func, args, kwargs))
+        return future
+    
+    def flush(self, timeout: float = None):
+        """Wait until every call queued so far is committed"""
+        self.submit(None).result(timeout)
+    
+    def stop(self, timeout: float = None):
+        """Commit everything already queued, then end the thread"""
+        with self._lock:
+            if not self._stopped:
+                self._stopped = True
+                self._queue.put((None, None, (), {}))
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+    
+    def run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            # A flush or stop marker (func None) closes the group early
+            while len(batch) < self.max_batch and batch[-1][1] is not None:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._commit(batch)
+            if batch[-1][0] is None:
+                return
+    
+    def _commit(self, batch):
+        calls = [item for item in batch if item[1] is not None and item[0].set_running_or_notify_cancel()]
+        outcomes = []
+        try:
+            if calls:
+                with self.transaction():
+                    for future, func, args, kwargs in calls:
+                        try:
+                            outcomes.append((future, func(*args, **kwargs), None))
+                        except Exception as e:
+                            outcomes.append((future, None, e))
+        except Exception as e:
+            logger.error("❌ Write-behind group of %s calls failed: %s", len(calls), e)
+            outcomes = [(future, None, e) for future, _, _, _ in calls]
+            markers_error = e
+        else:
+            markers_error = None
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        for future, func, _, _ in batch:
+            if func is None and future is not None and future.set_running_or_notify_cancel():
+                if markers_error is not None:
+                    future.set_exception(markers_error)
+                else:
+                    future.set_result(None)
+
+class DeadlineReminder:
+    # Public operations recorded when instrumentation is enabled
+    INSTRUMENTED_METHODS = ("add_deadline", "add_deadlines_bulk", "import_deadlines", "iter_deadlines",
+                            "iter_due_times", "get_all_deadlines", "get_upcoming_deadlines",
+                            "get_overdue_deadlines", "sweep_overdue", "update_status", "update_priority",
+                            "delete_deadline", "get_deadline", "search", "report_counts", "completion_stats",
+                            "summary_counts", "add_recurrence", "iter_occurrences", "reschedule_occurrence",
+                            "update_status_many", "update_priority_many", "delete_many", "archive_completed",
+                            "run_maintenance", "claim_notifications", "release_notifications",
+                            "changes_since",
+                            "compact_changes")
+    # Bound parameters per IN (...) list in bulk writes; below SQLite's historical limit of 999
+    BULK_CHUNK_SIZE = 500
+    # Writes that return Futures while write-behind is on
+    WRITE_BEHIND_METHODS = ("add_deadline", "update_status", "update_priority", "delete_deadline")
+    
+    def __init__(self, db_name: str = "deadlines.db", pool_size: int = 4, busy_timeout: float = 5.0,
+                 synchronous: str = "NORMAL", cache_size: int = 0, query_ttl: float = 2.0,
+                 instrument=False):
+        self.db_name = db_name
+        # Opt-in metrics; when off no method is wrapped and no SQL is traced.
+        # An Instrumentation instance may be passed to share counters between stores.
+        if isinstance(instrument, Instrumentation):
+            self._metrics = instrument
+        else:
+            self._metrics = Instrumentation() if instrument else None
+        if self._metrics is not None:
+            for name in self.INSTRUMENTED_METHODS:
+                setattr(self, name, self._metrics.wrap(name, getattr(self, name)))
+        self._db = ConnectionManager(db_name, pool_size=pool_size, busy_timeout=busy_timeout,
+                                     synchronous=synchronous,
+                                     trace_callback=self._metrics and self._metrics.trace_sql)
+        # Opt-in read-through cache; cache_size=0 disables it
+        self._cache = DeadlineCache(cache_size, query_ttl) if cache_size > 0 else None
+        self._background_tasks = []
+        self._listeners = ()
+        self._writer = None
+        self._group_writes = threading.local()
+        try:
+            self._init_database()
+        except Exception:
+            self._db.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop background tasks and close all database connections"""
+        for task in self._background_tasks:
+            task.stop()
+        self._background_tasks = []
+        self._db.close()
+
+    def transaction(self):
+        """Group several operations into one transaction on one connection"""
+        return self._db.transaction()
+
+    def start_write_behind(self, max_delay: float = 0.005, max_batch: int = 500, max_pending: int = 10000):
+        """Send add_deadline/update_status/update_priority/delete_deadline to a group-committing writer thread.
+
+        Those methods then return Futures of their usual results (the new ID for
+        add_deadline), resolved once the group holding the call commits. Reads
+        only see a write after its Future is done; use flush() to wait for all.
+        """
+        if self._writer is not None:
+            raise RuntimeError("write-behind is already on")
+        self._writer = WriteBehindWriter(self._write_group, max_delay, max_batch, max_pending)
+        for name in self.WRITE_BEHIND_METHODS:
+            setattr(self, name, partial(self._writer.submit, getattr(self, name)))
+        self._background_tasks.append(self._writer)
+        self._writer.start()
+        return self._writer
+
+    @contextmanager
+    def _write_group(self):
+        """Transaction for one write-behind group; its cache invalidations and listener
+        events are held back until it commits, and dropped if it rolls back"""
+        self._group_writes.pending = pending = []
+        try:
+            with self._db.transaction() as conn:
+                yield conn
+        finally:
+            self._group_writes.pending = None
+        for write in pending:
+            self._after_write(*write)
+
+    def stop_write_behind(self, timeout: float = None):
+        """Commit every queued write, stop the writer and make the write methods synchronous again"""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.stop(timeout)
+        for name in self.WRITE_BEHIND_METHODS:
+            setattr(self, name, getattr(self, name).args[0])
+        self._background_tasks.remove(writer)
+
+    def flush(self, timeout: float = None):
+        """Wait until every write queued in write-behind mode so far is committed"""
+        if self._writer is not None:
+            self._writer.flush(timeout)
+    
+    def stats(self) -> dict:
+        """Get per-operation call/error/row/SQL counters and latency histograms (empty when off)"""
+        return self._metrics.stats() if self._metrics is not None else {}
+
+    def export_metrics(self, path: str):
+        """Write the instrumentation counters to `path` in Prometheus text format"""
+        if self._metrics is None:
+            raise RuntimeError("instrumentation is not enabled; pass instrument=True")
+        self._metrics.export_prometheus(path)
+
+    def _log_error(self, operation: str, message: str, *args):
+        logger.error(message, *args)
+        if self._metrics is not None:
+            self._metrics.record_error(operation)
+
+    def cache_stats(self) -> dict:
+        """Get cache hit/miss/eviction counters (empty when caching is off)"""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def add_listener(self, callback):
+        """Register callback(event, deadline_id, due_ts, status) for committed writes.
+
+        Events are 'add', 'status', 'priority', 'reschedule' and 'delete'; status
+        is None when the write did not change it. Recurrence occurrences are
+        reported with their 'R<rule>:<index>' IDs.
+        """
+        self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback):
+        self._listeners = tuple(listener for listener in self._listeners if listener is not callback)
+
+    def _write_due_ts(self, conn, deadline_id: int):
+        """Look up a row's due_ts for the write hooks, only when cache or listeners need it"""
+        if self._cache is None and not self._listeners:
+            return None
+        row = conn.execute('SELECT due_ts FROM deadlines WHERE id = ?', (deadline_id,)).fetchone()
+        return row[0] if row else None
+
+    def _after_write(self, event: str, deadline_id: int, due_ts=None, status: str = None):
+        """Invalidate cached entries and notify listeners about one changed deadline"""
+        deferred = getattr(self._group_writes, "pending", None)
+        if deferred is not None:
+            deferred.append((event, deadline_id, due_ts, status))
+            return
+        if self._cache is not None:
+            self._cache.invalidate(deadline_id, due_ts)
+        self._notify_listeners(event, deadline_id, due_ts, status)
+
+    def _notify_listeners(self, event: str, deadline_id: int, due_ts=None, status: str = None):
+        for listener in self._listeners:
+            try:
+                listener(event, deadline_id, due_ts, status)
+            except Exception as e:
+                logger.error("❌ Write listener failed: %s", e)
+
+    def _cached_query(self, key, lo_ts, hi_ts, load):
+        """Serve a windowed query from the result cache, loading it on a miss"""
+        if self._cache is None:
+            return load()
+        result = self._cache.get_query(key)
+        if result is None:
+            generation = self._cache.generation
+            result = load()
+            self._cache.put_query(key, lo_ts, hi_ts, result, generation)
+        return list(result)
+
+    def _init_database(self):
+        """Initialize SQLite database and apply pending schema migrations.
+
+        A failing step rolls back its version and the error is raised, so the
+        store never runs on a partly upgraded schema.
+        """
+        try:
+            with self._db.transaction() as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS schema_version (
+                        version INTEGER PRIMARY KEY,
+                        description TEXT NOT NULL,
+                        applied_at TEXT NOT NULL
+                    )
+                ''')
+            for version, description, steps in SCHEMA_MIGRATIONS:
+                # One transaction per step so a failed upgrade leaves the last good version
+                with self._db.transaction() as conn:
+                    current = conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+                    if version <= current:
+                        continue
+                    for step in steps:
+                        if callable(step):
+                            step(conn)
+                        else:
+                            conn.execute(step)
+                    conn.execute('INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                                 (version, description, datetime.now().isoformat()))
+                logger.info("✅ Schema upgraded to version %s: %s", version, description)
+            logger.info("✅ Database initialized: %s", self.db_name)
+        except Exception as e:
+            self._log_error("init_database", "❌ Database error: %s", e)
+            raise
+
+    def get_schema_version(self) -> int:
+        """Get the schema version the database has been migrated to"""
+        with self._db.connection() as conn:
+            return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+    def add_deadline(self, title: str, due_date: datetime, priority: int, category: str, description: str = "") -> int:
+        """Add a new deadline to the database"""
+        try:
+            current_time = datetime.now()
+            due_date = _parse_datetime(due_date)
+            
+            with self._db.transaction() as conn:
+                cursor = conn.execute('''
+                    INSERT INTO deadlines (title, description, due_date, priority, status, category, created_at,
+                                           due_ts, created_ts)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (title, description, due_date.isoformat(), priority, Status.PENDING, category,
+                      current_time.isoformat(), to_epoch(due_date), to_epoch(current_time)))
+                deadline_id = cursor.lastrowid
+            self._after_write("add", deadline_id, to_epoch(due_date), Status.PENDING)
+            
+            logger.info("✅ Deadline '%s' added successfully (ID: %s)", title, deadline_id)
+            return deadline_id
+        except Exception as e:
+            self._log_error("add_deadline", "❌ Error adding deadline: %s", e)
+            return -1
+
+    def add_deadlines_bulk(self, records, chunk_size: int = 5000) -> BulkInsertResult:
+        """Insert many deadlines with executemany, committing once per chunk.
+
+        Records are validated lazily, so any iterable (including a streaming
+        importer) can be passed without materializing it. Invalid rows are
+        skipped and reported in the result instead of aborting the load.
+        """
+        result = BulkInsertResult()
+        created_at = datetime.now().isoformat()
+        
+        def valid_rows():
+            for row_number, record in enumerate(records, start=1):
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    yield row_number, _deadline_params(record, created_at)
+                except Exception as e:
+                    result.errors.append((row_number, str(e)))
+        
+        rows = valid_rows()
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            try:
+                self._insert_chunk([params for _, params in chunk], result)
+            except sqlite3.Error:
+                # Fall back to row-by-row inserts so one bad row is pinpointed
+                for row_number, params in chunk:
+                    try:
+                        self._insert_chunk([params], result)
+                    except sqlite3.Error as e:
+                        result.errors.append((row_number, str(e)))
+        return result
+
+    def _insert_chunk(self, params, result: BulkInsertResult):
+        with self._db.transaction() as conn:
+            conn.executemany('''
+                INSERT INTO deadlines (title, description, due_date, priority, status, category, created_at, completed_at,
+                                       due_ts, created_ts, completed_ts)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', params)
+            # AUTOINCREMENT ids are contiguous while we hold the write lock
+            last_id = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'deadlines'").fetchone()[0]
+        first_id = last_id - len(params) + 1
+        result.id_ranges.append((first_id, last_id))
+        if self._cache is not None:
+            self._cache.clear()
+        if self._listeners:
+            for deadline_id, row in enumerate(params, start=first_id):
+                self._notify_listeners("add", deadline_id, row[8], row[4])
+        result.inserted += len(params)
+
+    def import_deadlines(self, path: str, file_format: str = None, chunk_size: int = 5000) -> BulkInsertResult:
+        """Stream deadlines from a CSV or JSON Lines file into the database"""
+        return self.add_deadlines_bulk(iter_import_records(path, file_format), chunk_size=chunk_size)
+
+    def iter_deadlines(self, include_completed: bool = False, start: datetime = None, end: datetime = None,
+                       category: str = None, after=None, limit: int = None, columns=None, batch_size: int = 500,
+                       include_archived: bool = None):
+        """Stream deadlines ordered by (due_date, id), fetching rows in batches.
+
+        `start`/`end` bound due_date as start <= due_date < end. For keyset
+        pagination pass `after=(due_date, id)` of the last row already seen;
+        `limit` caps the number of rows yielded. `columns` restricts the fetched
+        fields; the others are left as None on the returned deadlines.
+        
+        With an `end` bound, occurrences of recurring deadlines due in the window
+        are merged in; at equal due times plain deadlines come first. Archived
+        deadlines are merged in when `include_archived` is true, which defaults
+        to `include_completed`.
+        """
+        if include_archived is None:
+            include_archived = include_completed
+        occurrences = self.iter_occurrences(start, end, include_completed, category) if end is not None else iter(())
+        first = next(occurrences, None)
+        if first is not None:
+            occurrences = chain([first], occurrences)
+        archived = include_archived and self._has_archived()
+        if first is not None or archived:
+            yield from self._merge_deadlines(occurrences if first is not None else None, archived, include_completed,
+                                             start, end, category, after, limit, columns, batch_size)
+            return
+        
+        sql, params = _deadline_query(include_completed, start, end, category, after, limit, columns)
+        with self._db.connection() as conn:
+            cursor = conn.execute(sql, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield Deadline(*row)
+            finally:
+                cursor.close()
+
+    def _merge_deadlines(self, occurrences, archived, include_completed, start, end, category, after, limit,
+                         columns, batch_size):
+        """Merge expanded occurrences and archived rows into the deadline rows of one iter_deadlines window"""
+        queries = [_deadline_query(include_completed, start, end, category, after, limit, columns, extra=("due_ts",))]
+        if archived:
+            queries.append(_deadline_query(True, start, end, category, after, limit, columns, extra=("due_ts",),
+                                           table="deadlines_archive"))
+        streams = []
+        if occurrences is not None:
+            if after is not None:
+                after_key = _deadline_order(Deadline(after[1], due_date=after[0]))
+                occurrences = (occurrence for occurrence in occurrences if _deadline_order(occurrence) > after_key)
+            streams.append((_deadline_order(occurrence), occurrence) for occurrence in occurrences)
+        
+        def rows(cursor):
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                for row in batch:
+                    yield (row[-1], 0, row[0], 0), row
+        
+        with self._db.connection() as conn:
+            cursors = [conn.execute(sql, params) for sql, params in queries]
+            try:
+                for _, item in islice(heapq.merge(*map(rows, cursors), *streams), limit):
+                    yield item if isinstance(item, Deadline) else Deadline(*item[:-1])
+            finally:
+                for cursor in cursors:
+                    cursor.close()
+
+    def _has_archived(self) -> bool:
+        with self._db.connection() as conn:
+            return conn.execute('SELECT 1 FROM deadlines_archive LIMIT 1').fetchone() is not None
+
+    def iter_due_times(self, batch_size: int = 5000):
+        """Stream (id, due_ts, status) for every unfinished deadline, cheaply.
+
+        Each recurrence contributes only its next unfinished occurrence.
+        """
+        with self._db.connection() as conn:
+            cursor = conn.execute('SELECT id, due_ts, status FROM deadlines WHERE status != ?', (Status.COMPLETED,))
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+        yield from self._iter_next_occurrences()
+
+    def iter_upcoming_deadlines(self, days: int = 7, **kwargs):
+        """Stream unfinished deadlines due within the next `days` days"""
+        now = datetime.now()
+        return self.iter_deadlines(start=now, end=now + timedelta(days=days), **kwargs)
+
+    def iter_overdue_deadlines(self, **kwargs):
+        """Stream unfinished deadlines that are past due, reported as Overdue"""
+        for deadline in self.iter_deadlines(end=datetime.now(), **kwargs):
+            deadline.status = Status.OVERDUE
+            yield deadline
+
+    def get_all_deadlines(self, include_completed: bool = False, include_archived: bool = None):
+        """Get all deadlines; archived ones are included along with completed ones unless include_archived=False"""
+        try:
+            return list(self.iter_deadlines(include_completed=include_completed, include_archived=include_archived))
+        except Exception as e:
+            self._log_error("get_all_deadlines", "❌ Error fetching deadlines: %s", e)
+            return []
+
+    def get_upcoming_deadlines(self, days: int = 7):
+        """Get deadlines due within the next specified days"""
+        try:
+            now = datetime.now()
+            return self._cached_query(("upcoming", days), to_epoch(now), to_epoch(now + timedelta(days=days)),
+                                      lambda: list(self.iter_upcoming_deadlines(days)))
+        except Exception as e:
+            self._log_error("get_upcoming_deadlines", "❌ Error fetching upcoming deadlines: %s", e)
+            return []
+
+    def get_overdue_deadlines(self):
+        """Get all overdue deadlines without modifying the database.
+
+        Rows past due that the sweeper has not flipped yet are reported with
+        status Overdue; call sweep_overdue() to persist that.
+        """
+        try:
+            return self._cached_query(("overdue",), None, to_epoch(datetime.now()),
+                                      lambda: list(self.iter_overdue_deadlines()))
+        except Exception as e:
+            self._log_error("get_overdue_deadlines", "❌ Error fetching overdue deadlines: %s", e)
+            return []
+
+    def sweep_overdue(self, now: datetime = None):
+        """Mark every past-due, unfinished deadline Overdue in one statement.
+
+        Returns the rows that changed status, ordered by due date.
+        """
+        try:
+            params = (Status.OVERDUE, to_epoch(now or datetime.now()), Status.COMPLETED, Status.OVERDUE)
+            
+            with self._db.transaction() as conn:
+                if sqlite3.sqlite_version_info >= (3, 35, 0):
+                    rows = conn.execute('''
+                        UPDATE deadlines SET status = ?
+                        WHERE due_ts < ? AND status NOT IN (?, ?)
+                        RETURNING {}
+                    '''.format(', '.join(DEADLINE_COLUMNS)), params).fetchall()
+                else:
+                    # No RETURNING before SQLite 3.35: stage the affected ids in a temp table
+                    conn.execute('CREATE TEMP TABLE IF NOT EXISTS swept_ids (id INTEGER PRIMARY KEY)')
+                    conn.execute('DELETE FROM swept_ids')
+                    conn.execute('''
+                        INSERT INTO swept_ids
+                        SELECT id FROM deadlines WHERE due_ts < ? AND status NOT IN (?, ?)
+                    ''', params[1:])
+                    conn.execute('UPDATE deadlines SET status = ? WHERE id IN (SELECT id FROM swept_ids)',
+                                 (Status.OVERDUE,))
+                    rows = conn.execute(DEADLINE_SELECT + ' WHERE id IN (SELECT id FROM swept_ids)').fetchall()
+            
+            rows.sort(key=lambda row: (to_epoch(row[3]), row[0]))
+            for row in rows:
+                self._after_write("status", row[0], to_epoch(row[3]), Status.OVERDUE)
+            return [Deadline(*row) for row in rows]
+        except Exception as e:
+            self._log_error("sweep_overdue", "❌ Error sweeping overdue deadlines: %s", e)
+            return []
+
+    def start_overdue_sweeper(self, interval: float = 60.0):
+        """Run sweep_overdue() in a background thread every `interval` seconds"""
+        sweeper = PeriodicTask(interval, self.sweep_overdue, name="overdue-sweeper")
+        self._background_tasks.append(sweeper)
+        sweeper.start()
+        return sweeper
+
+    def archive_completed(self, older_than: timedelta = timedelta(days=90), batch_size: int = 1000,
+                          now: datetime = None) -> int:
+        """Move deadlines completed more than `older_than` ago into deadlines_archive.
+
+        Rows move `batch_size` at a time, one transaction per batch, so writers
+        are never blocked for long. Returns the number archived, or -1 on error.
+        """
+        try:
+            cutoff = to_epoch((now or datetime.now()) - older_than)
+            archived_at = datetime.now().isoformat()
+            columns = ", ".join(DEADLINE_COLUMNS + ("due_ts", "created_ts", "completed_ts"))
+            batch = ('SELECT id FROM deadlines WHERE completed_ts < ? AND status = ? '
+                     'ORDER BY completed_ts, id LIMIT ?')
+            params = (cutoff, Status.COMPLETED, batch_size)
+            total = 0
+            while True:
+                with self._db.transaction() as conn:
+                    moved = conn.execute(f'INSERT INTO deadlines_archive ({columns}, archived_at) '
+                                         f'SELECT {columns}, ? FROM deadlines WHERE id IN ({batch})',
+                                         (archived_at,) + params).rowcount
+                    if moved:
+                        conn.execute(f'DELETE FROM deadlines WHERE id IN ({batch})', params)
+                # Archived rows keep their data, so cached copies stay valid and nothing is invalidated
+                total += moved
+                if moved < batch_size:
+                    break
+            if total:
+                logger.info("✅ %s completed deadlines archived", total)
+            return total
+        except Exception as e:
+            self._log_error("archive_completed", "❌ Error archiving deadlines: %s", e)
+            return -1
+
+    def run_maintenance(self, older_than: timedelta = timedelta(days=90), batch_size: int = 1000,
+                        vacuum_pages: int = 1000, change_retention: timedelta = timedelta(days=30)) -> int:
+        """Archive old completed deadlines, compact the change log, return free pages to the OS and
+        refresh planner statistics.
+
+        Free pages are only reclaimed on databases with auto_vacuum=INCREMENTAL
+        (see enable_incremental_vacuum). Returns the number of rows archived.
+        """
+        archived = self.archive_completed(older_than, batch_size)
+        self.compact_changes(change_retention)
+        try:
+            with self._db.connection() as conn:
+                # executescript steps the pragma to completion; execute() would free a single page.
+                # It also commits first, so skip the vacuum inside a caller's transaction.
+                if not conn.in_transaction and conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+                    conn.executescript(f'PRAGMA incremental_vacuum({int(vacuum_pages)})')
+                # Bounded sampling keeps ANALYZE cheap on large tables
+                conn.execute('PRAGMA analysis_limit = 400')
+                conn.execute('ANALYZE')
+        except Exception as e:
+            self._log_error("run_maintenance", "❌ Error running maintenance: %s", e)
+        return archived
+
+    def start_maintenance(self, interval: float = 86400.0, **options):
+        """Run run_maintenance(**options) in a background thread every `interval` seconds"""
+        task = PeriodicTask(interval, partial(self.run_maintenance, **options), name="maintenance")
+        self._background_tasks.append(task)
+        task.start()
+        return task
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch the database to auto_vacuum=INCREMENTAL, rewriting it once with VACUUM"""
+        try:
+            with self._db.connection() as conn:
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.execute('VACUUM')
+            logger.info("✅ Incremental vacuum enabled for %s", self.db_name)
+            return True
+        except Exception as e:
+            self._log_error("enable_incremental_vacuum", "❌ Error enabling incremental vacuum: %s", e)
+            return False
+
+    def update_status(self, deadline_id: int, status: str) -> bool:
+        """Update the status of a deadline"""
+        try:
+            completed_at = datetime.now() if status == Status.COMPLETED else None
+            parsed = parse_occurrence_id(deadline_id)
+            
+            if parsed is not None:
+                success, due_ts = self._write_override(parsed, status=status,
+                                                       completed_at=completed_at and completed_at.isoformat(),
+                                                       completed_ts=to_epoch(completed_at))
+            else:
+                with self._db.transaction() as conn:
+                    cursor = conn.execute('''
+                        UPDATE deadlines 
+                        SET status = ?, completed_at = ?, completed_ts = ?
+                        WHERE id = ?
+                    ''', (status, completed_at and completed_at.isoformat(), to_epoch(completed_at), deadline_id))
+                    success = cursor.rowcount > 0
+                    due_ts = self._write_due_ts(conn, deadline_id)
+            
+            if success:
+                self._after_write("status", deadline_id, due_ts, status)
+                logger.info("✅ Status updated to '%s' for deadline ID %s", status, deadline_id)
+            else:
+                logger.warning("❌ Failed to update status for deadline ID %s", deadline_id)
+            
+            return success
+        except Exception as e:
+            self._log_error("update_status", "❌ Error updating status: %s", e)
+            return False
+
+    def update_priority(self, deadline_id: int, priority: int) -> bool:
+        """Update the priority of a deadline"""
+        try:
+            parsed = parse_occurrence_id(deadline_id)
+            if parsed is not None:
+                success, due_ts = self._write_override(parsed, priority=priority)
+            else:
+                with self._db.transaction() as conn:
+                    cursor = conn.execute('UPDATE deadlines SET priority = ? WHERE id = ?', (priority, deadline_id))
+                    success = cursor.rowcount > 0
+                    due_ts = self._write_due_ts(conn, deadline_id)
+            
+            if success:
+                self._after_write("priority", deadline_id, due_ts)
+                logger.info("✅ Priority updated to '%s' for deadline ID %s", Priority.get_name(priority), deadline_id)
+            else:
+                logger.warning("❌ Failed to update priority for deadline ID %s", deadline_id)
+            
+            return success
+        except Exception as e:
+            self._log_error("update_priority", "❌ Error updating priority: %s", e)
+            return False
+
+    def delete_deadline(self, deadline_id: int) -> bool:
+        """Delete a deadline, or skip one occurrence of a recurring deadline"""
+        try:
+            parsed = parse_occurrence_id(deadline_id)
+            if parsed is not None:
+                success, due_ts = self._write_override(parsed, deleted=1)
+            else:
+                with self._db.transaction() as conn:
+                    due_ts = self._write_due_ts(conn, deadline_id)
+                    cursor = conn.execute('DELETE FROM deadlines WHERE id = ?', (deadline_id,))
+                    success = cursor.rowcount > 0
+            
+            if success:
+                self._after_write("delete", deadline_id, due_ts)
+                logger.info("✅ Deadline ID %s deleted successfully", deadline_id)
+            else:
+                logger.warning("❌ Failed to delete deadline ID %s", deadline_id)
+            
+            return success
+        except Exception as e:
+            self._log_error("delete_deadline", "❌ Error deleting deadline: %s", e)
+            return False
+
+    def _write_many(self, event: str, statement: str, set_params, ids, category, start, end, current_status,
+                    new_status: str = None, **override_fields) -> int:
+        """Apply one UPDATE/DELETE to every deadline matching ids and filters, in a single transaction.
+
+        IDs are sent in chunks of BULK_CHUNK_SIZE bound parameters; filters alone
+        run as one set-based statement. Occurrence IDs get override rows instead,
+        and the filters do not apply to them. Returns the number of rows affected.
+        """
+        clauses, params = [], []
+        if category is not None:
+            clauses.append('category = ?')
+            params.append(category)
+        if start is not None:
+            clauses.append('due_ts >= ?')
+            params.append(to_epoch(start))
+        if end is not None:
+            clauses.append('due_ts < ?')
+            params.append(to_epoch(end))
+        if current_status is not None:
+            statuses = [current_status] if isinstance(current_status, str) else list(current_status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if ids is None and not clauses:
+            raise ValueError("pass IDs or at least one filter")
+        
+        occurrences, chunks = [], [None]
+        if ids is not None:
+            ids = list(ids)
+            occurrences = [parsed for parsed in map(parse_occurrence_id, ids) if parsed is not None]
+            plain = [deadline_id for deadline_id in ids if parse_occurrence_id(deadline_id) is None]
+            chunks = [plain[i:i + self.BULK_CHUNK_SIZE] for i in range(0, len(plain), self.BULK_CHUNK_SIZE)]
+        # Only look up which rows change when a cache or listener needs to know
+        hooks = self._cache is not None or bool(self._listeners)
+        changed, count = [], 0
+        
+        with self._db.transaction() as conn:
+            for chunk in chunks:
+                where, where_params = list(clauses), list(params)
+                if chunk is not None:
+                    where.append(f"id IN ({', '.join('?' * len(chunk))})")
+                    where_params.extend(chunk)
+                where_sql = ' WHERE ' + ' AND '.join(where)
+                if hooks:
+                    changed.extend(conn.execute('SELECT id, due_ts FROM deadlines' + where_sql, where_params))
+                count += conn.execute(statement + where_sql, list(set_params) + where_params).rowcount
+            for parsed in occurrences:
+                found, due_ts = self._write_override(parsed, **override_fields)
+                if found:
+                    count += 1
+                    changed.append((occurrence_id(*parsed), due_ts))
+        
+        if changed:
+            if self._cache is not None:
+                self._cache.clear()
+            for deadline_id, due_ts in changed:
+                self._notify_listeners(event, deadline_id, due_ts, new_status)
+        return count
+
+    def update_status_many(self, ids, status: str, category: str = None, start: datetime = None,
+                           end: datetime = None, current_status=None) -> int:
+        """Update the status of many deadlines in one transaction.
+
+        Select them by `ids`, by filters (category, start <= due_date < end,
+        current status or statuses), or both; pass ids=None to use filters only.
+        completed_at is set exactly as update_status() does. Returns the number
+        of deadlines changed, or -1 on error.
+        """
+        try:
+            completed_at = datetime.now() if status == Status.COMPLETED else None
+            completed = (completed_at and completed_at.isoformat(), to_epoch(completed_at))
+            count = self._write_many("status", 'UPDATE deadlines SET status = ?, completed_at = ?, completed_ts = ?',
+                                     (status,) + completed, ids, category, start, end, current_status, status,
+                                     status=status, completed_at=completed[0], completed_ts=completed[1])
+            logger.info("✅ Status updated to '%s' for %s deadlines", status, count)
+            return count
+        except Exception as e:
+            self._log_error("update_status_many", "❌ Error updating statuses: %s", e)
+            return -1
+
+    def update_priority_many(self, ids, priority: int, category: str = None, start: datetime = None,
+                             end: datetime = None, current_status=None) -> int:
+        """Update the priority of many deadlines in one transaction; see update_status_many"""
+        try:
+            count = self._write_many("priority", 'UPDATE deadlines SET priority = ?', (priority,), ids, category,
+                                     start, end, current_status, priority=priority)
+            logger.info("✅ Priority updated to '%s' for %s deadlines", Priority.get_name(priority), count)
+            return count
+        except Exception as e:
+            self._log_error("update_priority_many", "❌ Error updating priorities: %s", e)
+            return -1
+
+    def delete_many(self, ids=None, category: str = None, start: datetime = None, end: datetime = None,
+                    current_status=None) -> int:
+        """Delete many deadlines in one transaction; see update_status_many"""
+        try:
+            count = self._write_many("delete", 'DELETE FROM deadlines', (), ids, category, start, end,
+                                     current_status, deleted=1)
+            logger.info("✅ %s deadlines deleted successfully", count)
+            return count
+        except Exception as e:
+            self._log_error("delete_many", "❌ Error deleting deadlines: %s", e)
+            return -1
+
+    def get_deadline(self, deadline_id: int):
+        """Get a specific deadline by ID"""
+        try:
+            parsed = parse_occurrence_id(deadline_id)
+            if parsed is not None:
+                return self._get_occurrence(parsed)
+            if self._cache is not None:
+                deadline = self._cache.get(deadline_id)
+                if deadline is not None:
+                    return deadline
+                generation = self._cache.generation
+            
+            with self._db.connection() as conn:
+                row = conn.execute(DEADLINE_SELECT + ' WHERE id = ?', (deadline_id,)).fetchone()
+                if row is None:
+                    row = conn.execute(deadline_select(table="deadlines_archive") + ' WHERE id = ?',
+                                       (deadline_id,)).fetchone()
+            
+            if row:
+                deadline = Deadline(*row)
+                if self._cache is not None:
+                    self._cache.put(deadline, generation)
+                return deadline
+            return None
+        except Exception as e:
+            self._log_error("get_deadline", "❌ Error fetching deadline: %s", e)
+            return None
+
+    def search(self, query: str, status=None, start: datetime = None, end: datetime = None, limit: int = 50,
+               prefix: bool = True, raw: bool = False):
+        """Full-text search over title, description and category, best matches first.
+
+        Every word must match (as a prefix unless prefix=False). `status` may be
+        one status or a list; `start`/`end` bound due_date as start <= due < end.
+        With raw=True the query is passed to FTS5 unchanged (phrases, OR, NEAR...).
+        """
+        try:
+            match = query if raw else fts_query(query, prefix)
+            if not match:
+                return []
+            clauses, params = ['deadlines_fts MATCH ?'], [match]
+            if status is not None:
+                statuses = [status] if isinstance(status, str) else list(status)
+                clauses.append(f"d.status IN ({', '.join('?' * len(statuses))})")
+                params.extend(statuses)
+            if start is not None:
+                clauses.append('d.due_ts >= ?')
+                params.append(to_epoch(start))
+            if end is not None:
+                clauses.append('d.due_ts < ?')
+                params.append(to_epoch(end))
+            params.append(limit)
+            columns = ", ".join("d." + column for column in DEADLINE_COLUMNS)
+            with self._db.connection() as conn:
+                # bm25 weights: title matches count most, then category, then description
+                rows = conn.execute(f'''
+                    SELECT {columns} FROM deadlines_fts
+                    JOIN deadlines d ON d.id = deadlines_fts.rowid
+                    WHERE {' AND '.join(clauses)}
+                    ORDER BY bm25(deadlines_fts, 10.0, 1.0, 2.0)
+                    LIMIT ?
+                ''', params).fetchall()
+            return [Deadline(*row) for row in rows]
+        except Exception as e:
+            self._log_error("search", "❌ Error searching deadlines: %s", e)
+            return []
+
+    def rebuild_search_index(self) -> bool:
+        """Create the search index if missing, then rebuild and optimize it from the deadlines table"""
+        try:
+            with self._db.transaction() as conn:
+                _create_search_index(conn)
+                conn.execute("INSERT INTO deadlines_fts (deadlines_fts) VALUES ('optimize')")
+            logger.info("✅ Search index rebuilt")
+            return True
+        except Exception as e:
+            self._log_error("rebuild_search_index", "❌ Error rebuilding search index: %s", e)
+            return False
+
+    def report_counts(self, group_by=("status",), include_completed: bool = True):
+        """Count deadlines grouped by any of category/status/priority with SQL GROUP BY"""
+        fields = _report_fields(group_by)
+        where = '' if include_completed else 'WHERE status != ?'
+        select = ', '.join(fields + ('COUNT(*)',))
+        group = f"GROUP BY {', '.join(fields)} ORDER BY {', '.join(fields)}" if fields else ''
+        with self._db.connection() as conn:
+            rows = conn.execute(f'SELECT {select} FROM deadlines {where} {group}',
+                                () if include_completed else (Status.COMPLETED,)).fetchall()
+        return [dict(zip(fields + ("count",), row)) for row in rows]
+
+    def completion_stats(self, group_by=()):
+        """Completion latency (completed_at - created_at) in seconds: count, average, min and max"""
+        fields = _report_fields(group_by)
+        select = ', '.join(fields + ('COUNT(*)', 'AVG(completed_ts - created_ts)',
+                                     'MIN(completed_ts - created_ts)', 'MAX(completed_ts - created_ts)'))
+        group = f"GROUP BY {', '.join(fields)} ORDER BY {', '.join(fields)}" if fields else ''
+        with self._db.connection() as conn:
+            rows = conn.execute(f'''
+                SELECT {select} FROM deadlines
+                WHERE status = ? AND completed_ts IS NOT NULL AND created_ts IS NOT NULL
+                {group}
+            ''', (Status.COMPLETED,)).fetchall()
+        keys = fields + ("count", "avg_seconds", "min_seconds", "max_seconds")
+        return [dict(zip(keys, row)) for row in rows if row[len(fields)]]
+
+    def summary_counts(self, group_by=("category",), category: str = None, status: str = None,
+                       priority: int = None):
+        """Read hot counters from the trigger-maintained summary table.
+
+        Cost is proportional to the number of (category, status, priority)
+        combinations, not rows. Statuses are as stored, so past-due rows count
+        as Overdue only once sweep_overdue() has run.
+        """
+        fields = _report_fields(group_by)
+        clauses, params = [], []
+        for field, value in (("category", category), ("status", status), ("priority", priority)):
+            if value is not None:
+                clauses.append(f'{field} = ?')
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        group = f"GROUP BY {', '.join(fields)} ORDER BY {', '.join(fields)}" if fields else ''
+        with self._db.connection() as conn:
+            rows = conn.execute(f"SELECT {', '.join(fields + ('SUM(count)',))} FROM deadline_counts {where} {group}",
+                                params).fetchall()
+        return [dict(zip(fields + ("count",), row)) for row in rows if row[-1]]
+
+    def check_summary(self, repair: bool = False):
+        """Compare the summary table with a full GROUP BY and return the drifted keys.
+
+        Each entry is (category, status, priority, summary_count, actual_count).
+        With repair=True the summary table is rebuilt when drift is found.
+        """
+        with self._db.transaction() as conn:
+            drift = conn.execute('''
+                WITH actual AS (
+                    SELECT category, status, priority, COUNT(*) AS count
+                    FROM deadlines GROUP BY category, status, priority
+                ), keys AS (
+                    SELECT category, status, priority FROM actual
+                    UNION SELECT category, status, priority FROM deadline_counts
+                )
+                SELECT k.category, k.status, k.priority, COALESCE(s.count, 0), COALESCE(a.count, 0)
+                FROM keys k
+                LEFT JOIN deadline_counts s
+                    ON s.category = k.category AND s.status = k.status AND s.priority = k.priority
+                LEFT JOIN actual a
+                    ON a.category = k.category AND a.status = k.status AND a.priority = k.priority
+                WHERE COALESCE(s.count, 0) != COALESCE(a.count, 0)
+            ''').fetchall()
+            if drift and repair:
+                _fill_summary_table(conn)
+        if drift:
+            logger.warning("❌ Summary table drifted on %s keys%s", len(drift), " (rebuilt)" if repair else "")
+        return drift
+
+    def rebuild_summary(self):
+        """Recompute the summary table from the deadlines table"""
+        with self._db.transaction() as conn:
+            _fill_summary_table(conn)
+        logger.info("✅ Summary table rebuilt")
+
+    def claim_notifications(self, keys, chunk_size: int = 1000) -> list:
+        """Record (deadline_id, stage, due_ts) notifications as sent and return the ones not sent before.
+
+        Claims are atomic, so concurrent notifiers never both get the same key.
+        A deadline moved to a new due time can be announced again.
+        """
+        try:
+            notified_at = datetime.now().isoformat()
+            claimed = []
+            keys = iter(keys)
+            while True:
+                chunk = list(islice(keys, chunk_size))
+                if not chunk:
+                    break
+                with self._db.transaction() as conn:
+                    for key in chunk:
+                        if conn.execute('''
+                            INSERT OR IGNORE INTO notification_log (deadline_id, stage, due_ts, notified_at)
+                            VALUES (?, ?, ?, ?)
+                        ''', (*key, notified_at)).rowcount:
+                            claimed.append(key)
+            return claimed
+        except Exception as e:
+            self._log_error("claim_notifications", "❌ Error recording notifications: %s", e)
+            return []
+
+    def release_notifications(self, keys) -> int:
+        """Forget claimed (deadline_id, stage, due_ts) notifications so they can be claimed again"""
+        try:
+            with self._db.transaction() as conn:
+                cursor = conn.executemany('DELETE FROM notification_log WHERE deadline_id = ? AND stage = ? AND due_ts = ?',
+                                          keys)
+            return cursor.rowcount
+        except Exception as e:
+            self._log_error("release_notifications", "❌ Error releasing notifications: %s", e)
+            return -1
+
+    def changes_since(self, cursor: int = 0, limit: int = 1000):
+        """Get up to `limit` changes after `cursor` as (changes, next_cursor).
+
+        Each change is a dict with seq, op ('insert', 'update', 'delete' or
+        'archive'), id and deadline: the row as it is now, None once deleted.
+        Pass next_cursor back to continue. Raises CursorExpiredError when
+        compaction has removed entries the cursor has not seen yet.
+        """
+        with self._db.connection() as conn:
+            compacted = conn.execute('SELECT compacted_seq FROM deadline_changes_state').fetchone()[0]
+            if cursor < compacted:
+                raise CursorExpiredError(f"change cursor {cursor} was compacted (oldest kept: {compacted + 1})")
+            live = ", ".join("d." + column for column in DEADLINE_COLUMNS)
+            archived = ", ".join("a." + column for column in DEADLINE_COLUMNS)
+            rows = conn.execute(f'''
+                SELECT c.seq, c.op, c.deadline_id, {live}, {archived}
+                FROM deadline_changes c
+                LEFT JOIN deadlines d ON d.id = c.deadline_id
+                LEFT JOIN deadlines_archive a ON c.op = 'delete' AND a.id = c.deadline_id
+                WHERE c.seq > ?
+                ORDER BY c.seq
+                LIMIT ?
+            ''', (cursor, limit)).fetchall()
+        n = len(DEADLINE_COLUMNS)
+        changes = []
+        for row in rows:
+            seq, op, deadline_id = row[:3]
+            deadline = None
+            if row[3] is not None:
+                deadline = Deadline(*row[3:3 + n])
+            elif row[3 + n] is not None:
+                # Deleted by archive_completed: the row lives on in deadlines_archive
+                op, deadline = "archive", Deadline(*row[3 + n:])
+            changes.append({"seq": seq, "op": op, "id": deadline_id, "deadline": deadline})
+        return changes, changes[-1]["seq"] if changes else cursor
+
+    def iter_changes(self, cursor: int = 0, batch_size: int = 1000):
+        """Stream every change after `cursor`, fetching `batch_size` entries per query"""
+        while True:
+            changes, cursor = self.changes_since(cursor, batch_size)
+            if not changes:
+                return
+            yield from changes
+
+    def snapshot(self):
+        """Get (cursor, deadlines) for bootstrapping a mirror: every live deadline plus the feed position.
+
+        Both are read in one transaction, so following changes_since(cursor)
+        misses nothing and repeats nothing.
+        """
+        with self._db.connection() as conn:
+            # A deferred read transaction pins one WAL snapshot without blocking writers
+            own_transaction = not conn.in_transaction
+            if own_transaction:
+                conn.execute('BEGIN')
+            try:
+                cursor = conn.execute('SELECT COALESCE(MAX(seq), 0) FROM deadline_changes').fetchone()[0]
+                compacted = conn.execute('SELECT compacted_seq FROM deadline_changes_state').fetchone()[0]
+                rows = conn.execute(_deadline_query(include_completed=True)[0]).fetchall()
+            finally:
+                if own_transaction:
+                    conn.execute('COMMIT')
+        return max(cursor, compacted), [Deadline(*row) for row in rows]
+
+    def compact_changes(self, older_than: timedelta = timedelta(days=7)) -> int:
+        """Drop change entries older than `older_than`; returns how many were removed, or -1 on error.
+
+        Consumers whose cursor falls in the removed range get CursorExpiredError
+        and must bootstrap again from snapshot().
+        """
+        try:
+            cutoff = to_epoch(datetime.now() - older_than)
+            with self._db.transaction() as conn:
+                last = conn.execute('SELECT MAX(seq) FROM deadline_changes WHERE changed_ts < ?',
+                                    (cutoff,)).fetchone()[0]
+                if last is None:
+                    return 0
+                removed = conn.execute('DELETE FROM deadline_changes WHERE seq <= ?', (last,)).rowcount
+                conn.execute('UPDATE deadline_changes_state SET compacted_seq = MAX(compacted_seq, ?)', (last,))
+            logger.info("✅ %s change log entries compacted", removed)
+            return removed
+        except Exception as e:
+            self._log_error("compact_changes", "❌ Error compacting change log: %s", e)
+            return -1
+
+    def add_recurrence(self, title: str, first_due: datetime, frequency: str, priority: int, category: str,
+                       description: str = "", interval: int = 1, until: datetime = None, count: int = None) -> int:
+        """Store a recurring deadline once; its occurrences are expanded only when queried"""
+        try:
+            rule = RecurrenceRule(None, title, description, category, priority, first_due, frequency, interval,
+                                  until, count)
+            last = rule.last_index
+            if last is not None and last < 0:
+                raise ValueError("the recurrence ends before its first occurrence")
+            created_at = datetime.now().isoformat()
+            
+            with self._db.transaction() as conn:
+                cursor = conn.execute('''
+                    INSERT INTO recurrences (title, description, category, priority, first_due, frequency, interval,
+                                             until, max_occurrences, created_at, first_due_ts, last_due_ts)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (title, description, category, priority, rule.first_due.isoformat(), frequency, interval,
+                      rule.until and rule.until.isoformat(), count, created_at, to_epoch(rule.first_due),
+                      None if last is None else to_epoch(rule.due(last))))
+                rule.id = cursor.lastrowid
+            rule.created_at = created_at
+            
+            if self._cache is not None:
+                self._cache.clear()
+            if self._listeners:
+                upcoming = self._first_open_occurrence(rule, {}, rule.index_at(datetime.now()))
+                if upcoming is not None:
+                    self._notify_listeners("add", upcoming.id, to_epoch(upcoming.due_date), Status.PENDING)
+            logger.info("✅ Recurring deadline '%s' added successfully (ID: R%s)", title, rule.id)
+            return rule.id
+        except Exception as e:
+            self._log_error("add_recurrence", "❌ Error adding recurring deadline: %s", e)
+            return -1
+
+    def get_recurrences(self, category: str = None):
+        """Get every recurrence rule, optionally for one category"""
+        sql, params = RECURRENCE_SELECT, ()
+        if category is not None:
+            sql, params = sql + ' WHERE category = ?', (category,)
+        with self._db.connection() as conn:
+            return [RecurrenceRule(*row) for row in conn.execute(sql + ' ORDER BY id', params)]
+
+    def delete_recurrence(self, recurrence_id: int) -> bool:
+        """Delete a recurrence rule together with its occurrence overrides"""
+        try:
+            with self._db.transaction() as conn:
+                success = conn.execute('DELETE FROM recurrences WHERE id = ?', (recurrence_id,)).rowcount > 0
+                conn.execute('DELETE FROM recurrence_overrides WHERE recurrence_id = ?', (recurrence_id,))
+            
+            if success:
+                if self._cache is not None:
+                    self._cache.clear()
+                logger.info("✅ Recurring deadline R%s deleted successfully", recurrence_id)
+            else:
+                logger.warning("❌ Failed to delete recurring deadline R%s", recurrence_id)
+            return success
+        except Exception as e:
+            self._log_error("delete_recurrence", "❌ Error deleting recurring deadline: %s", e)
+            return False
+
+    def reschedule_occurrence(self, deadline_id: str, due_date: datetime) -> bool:
+        """Move one occurrence of a recurrence to a new due date"""
+        try:
+            parsed = parse_occurrence_id(deadline_id)
+            if parsed is None:
+                raise ValueError(f"{deadline_id!r} is not an occurrence ID")
+            due_date = _parse_datetime(due_date)
+            success, due_ts = self._write_override(parsed, due_date=due_date.isoformat(), due_ts=to_epoch(due_date))
+            
+            if success:
+                self._after_write("reschedule", deadline_id, due_ts)
+                logger.info("✅ Occurrence %s moved to %s", deadline_id, due_date.strftime('%m/%d/%Y %H:%M'))
+            else:
+                logger.warning("❌ Failed to reschedule occurrence %s", deadline_id)
+            return success
+        except Exception as e:
+            self._log_error("reschedule_occurrence", "❌ Error rescheduling occurrence: %s", e)
+            return False
+
+    def iter_occurrences(self, start: datetime = None, end: datetime = None, include_completed: bool = False,
+                         category: str = None):
+        """Expand recurrences into occurrences due in start <= due < end, lazily and in due order.
+
+        Only the rules and overrides touching the window are read, and no
+        occurrence is ever stored unless it is overridden. Occurrences carry
+        IDs like 'R12:3' (the fourth occurrence of recurrence 12).
+        """
+        if end is None:
+            raise ValueError("expanding recurrences needs an end bound")
+        lo, hi = to_epoch(start), to_epoch(end)
+        
+        def in_window(column):
+            if lo is None:
+                return f'{column} < ?', [hi]
+            return f'{column} >= ? AND {column} < ?', [lo, hi]
+        
+        due_clause, due_params = in_window('due_ts')
+        occurrence_clause, occurrence_params = in_window('occurrence_ts')
+        sql = RECURRENCE_SELECT + f'''
+            WHERE ((first_due_ts < ? AND (last_due_ts IS NULL OR ? IS NULL OR last_due_ts >= ?))
+                   OR id IN (SELECT recurrence_id FROM recurrence_overrides WHERE {due_clause}))
+        '''
+        params = [hi, lo, lo] + due_params
+        if category is not None:
+            sql += ' AND category = ?'
+            params.append(category)
+        
+        with self._db.connection() as conn:
+            rules = {row[0]: RecurrenceRule(*row) for row in conn.execute(sql, params)}
+            if not rules:
+                return
+            overrides = {(row[0], row[1]): row for row in conn.execute(
+                OVERRIDE_SELECT + f' WHERE ({occurrence_clause}) OR ({due_clause})', occurrence_params + due_params)}
+        
+        def natural(rule):
+            for index, due in rule.occurrences(start, end):
+                override = overrides.get((rule.id, index))
+                if override is None or override[4] is None:
+                    yield to_epoch(due), rule.id, index, due, override
+        
+        # Rescheduled occurrences are placed at their new due time instead
+        moved = sorted((row[4], row[0], row[1], row[3], row) for row in overrides.values()
+                       if row[4] is not None and (lo is None or row[4] >= lo) and row[4] < hi and row[0] in rules)
+        for _, recurrence_id, index, due, override in heapq.merge(*map(natural, rules.values()), moved):
+            if override is not None and (override[7] or (override[2] == Status.COMPLETED and not include_completed)):
+                continue
+            yield self._occurrence(rules[recurrence_id], index, due, override)
+
+    def next_occurrence(self, deadline_id: str):
+        """The first unfinished occurrence after the given one, or None when the rule has ended"""
+        parsed = parse_occurrence_id(deadline_id)
+        if parsed is None:
+            return None
+        recurrence_id, index = parsed
+        with self._db.connection() as conn:
+            rule = self._load_rule(conn, recurrence_id)
+            if rule is None:
+                return None
+            overrides = {row[1]: row for row in conn.execute(
+                OVERRIDE_SELECT + ' WHERE recurrence_id = ? AND occurrence > ?', (recurrence_id, index))}
+        return self._first_open_occurrence(rule, overrides, index + 1)
+
+    def _first_open_occurrence(self, rule, overrides: dict, first_index: int):
+        # Terminates: every skipped occurrence has an override row
+        for index, due in rule.occurrences(first_index=first_index):
+            override = overrides.get(index)
+            if override is None or not (override[7] or override[2] == Status.COMPLETED):
+                return self._occurrence(rule, index, due, override)
+        return None
+
+    def _iter_next_occurrences(self):
+        """(id, due_ts, status) of each recurrence's next unfinished occurrence at or after now"""
+        now = datetime.now()
+        with self._db.connection() as conn:
+            rules = [RecurrenceRule(*row) for row in conn.execute(
+                RECURRENCE_SELECT + ' WHERE last_due_ts IS NULL OR last_due_ts >= ?', (to_epoch(now),))]
+            overrides = {}
+            for row in conn.execute(OVERRIDE_SELECT + ' WHERE occurrence_ts >= ?', (to_epoch(now),)):
+                overrides.setdefault(row[0], {})[row[1]] = row
+        for rule in rules:
+            upcoming = self._first_open_occurrence(rule, overrides.get(rule.id, {}), rule.index_at(now))
+            if upcoming is not None:
+                yield upcoming.id, to_epoch(upcoming.due_date), upcoming.status
+
+    @staticmethod
+    def _load_rule(conn, recurrence_id: int):
+        row = conn.execute(RECURRENCE_SELECT + ' WHERE id = ?', (recurrence_id,)).fetchone()
+        return RecurrenceRule(*row) if row else None
+
+    @staticmethod
+    def _occurrence(rule, index: int, due: datetime, override=None):
+        """Build the Deadline for one occurrence, applying its override row if any"""
+        if override is None:
+            return Deadline(occurrence_id(rule.id, index), rule.title, rule.description, due, rule.priority,
+                            Status.PENDING, rule.category, rule.created_at)
+        return Deadline(occurrence_id(rule.id, index), rule.title, rule.description, override[3] or due,
+                        override[5] or rule.priority, override[2] or Status.PENDING, rule.category, rule.created_at,
+                        override[6])
+
+    def _get_occurrence(self, parsed):
+        recurrence_id, index = parsed
+        with self._db.connection() as conn:
+            rule = self._load_rule(conn, recurrence_id)
+            if rule is None or not self._valid_occurrence(rule, index):
+                return None
+            override = conn.execute(OVERRIDE_SELECT + ' WHERE recurrence_id = ? AND occurrence = ?',
+                                    (recurrence_id, index)).fetchone()
+        if override is not None and override[7]:
+            return None
+        return self._occurrence(rule, index, rule.due(index), override)
+
+    @staticmethod
+    def _valid_occurrence(rule, index: int) -> bool:
+        last = rule.last_index
+        return index >= 0 and (last is None or index <= last)
+
+    def _write_override(self, parsed, **fields):
+        """Upsert the sparse override row of one occurrence; returns (found, effective due_ts)"""
+        recurrence_id, index = parsed
+        columns = list(fields)
+        with self._db.transaction() as conn:
+            rule = self._load_rule(conn, recurrence_id)
+            if rule is None or not self._valid_occurrence(rule, index):
+                return False, None
+            conn.execute(f'''
+                INSERT INTO recurrence_overrides (recurrence_id, occurrence, occurrence_ts, {', '.join(columns)})
+                VALUES (?, ?, ?{', ?' * len(columns)})
+                ON CONFLICT (recurrence_id, occurrence) DO UPDATE SET
+                    {', '.join(f'{column} = excluded.{column}' for column in columns)}
+            ''', (recurrence_id, index, to_epoch(rule.due(index)), *fields.values()))
+            due_ts = conn.execute('''
+                SELECT COALESCE(due_ts, occurrence_ts) FROM recurrence_overrides
+                WHERE recurrence_id = ? AND occurrence = ?
+            ''', (recurrence_id, index)).fetchone()[0]
+        return True, due_ts
+
+class NotificationScheduler:
+    """Fires reminder and overdue callbacks at their exact times from an in-memory heap.
+
+    Pending deadlines are loaded once; afterwards the scheduler follows the
+    reminder's write listeners instead of re-querying. Superseded heap entries
+    are skipped lazily by comparing a per-deadline version number. Each
+    recurrence has only its next occurrence queued; the one after it is
+    scheduled once that occurrence falls due, completes or is skipped.
+    """
+    def __init__(self, reminder, offsets=(timedelta(days=1),), on_reminder=None, on_overdue=None,
+                 fire_missed: bool = False):
+        self.reminder = reminder
+        self.offsets = sorted((int(offset.total_seconds()) for offset in offsets), reverse=True)
+        self.on_reminder = on_reminder
+        self.on_overdue = on_overdue
+        self.fire_missed = fire_missed
+        self._heap = []      # (fire_ts, seq, deadline_id, offset_seconds or None, version)
+        self._versions = {}  # deadline_id -> version of its live heap entries
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+    
+    def __len__(self):
+        return len(self._versions)
+    
+    def start(self):
+        """Load pending deadlines and start the scheduler thread"""
+        self.reminder.add_listener(self._on_write)
+        now = time.time()
+        with self._cond:
+            for deadline_id, due_ts, status in self.reminder.iter_due_times():
+                self._schedule(deadline_id, due_ts, now, catch_up=self.fire_missed)
+            heapq.heapify(self._heap)
+        self._thread = threading.Thread(target=self._run, name="notification-scheduler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self, timeout: float = None):
+        self.reminder.remove_listener(self._on_write)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    def _schedule(self, deadline_id, due_ts, now, catch_up=False, push=list.append):
+        """Queue the future reminder/overdue events of one deadline; caller holds the lock"""
+        self._versions.pop(deadline_id, None)
+        if due_ts is None:
+            return
+        events = [(due_ts - offset, offset) for offset in self.offsets] + [(due_ts, None)]
+        # due_ts is truncated to whole seconds, so an event is only certainly past once its second
+        # has ended; _fire() re-queues events that wake up before the exact due time
+        missed = [event for event in events if event[0] + 1 <= now]
+        pending = [event for event in events if event[0] + 1 > now]
+        # Only the latest missed stage is worth announcing on catch-up
+        if catch_up and missed:
+            pending.append((now, missed[-1][1]))
+        if not pending:
+            return
+        # Versions come from the global sequence so they never repeat for an ID
+        self._seq += 1
+        version = self._versions[deadline_id] = self._seq
+        for fire_ts, offset in pending:
+            self._seq += 1
+            push(self._heap, (fire_ts, self._seq, deadline_id, offset, version))
+    
+    def _on_write(self, event, deadline_id, due_ts, status):
+        if event == "priority":
+            return
+        finished = event == "delete" or status == Status.COMPLETED
+        with self._cond:
+            if finished:
+                self._versions.pop(deadline_id, None)
+            else:
+                self._schedule(deadline_id, due_ts, time.time(), push=heapq.heappush)
+            self._cond.notify()
+        if finished and isinstance(deadline_id, str):
+            self._schedule_next_occurrence(deadline_id)
+    
+    def _schedule_next_occurrence(self, deadline_id):
+        upcoming = self.reminder.next_occurrence(deadline_id)
+        if upcoming is not None:
+            with self._cond:
+                self._schedule(upcoming.id, to_epoch(upcoming.due_date), time.time(), push=heapq.heappush)
+                self._cond.notify()
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    delay = self._heap[0][0] - time.time() if self._heap else None
+                    if delay is not None and delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+                now = time.time()
+                due_events = []
+                while self._heap and self._heap[0][0] <= now:
+                    fire_ts, _, deadline_id, offset, version = heapq.heappop(self._heap)
+                    if self._versions.get(deadline_id) == version:
+                        due_events.append((deadline_id, offset, version))
+            for deadline_id, offset, version in due_events:
+                if self._fire(deadline_id, offset, version) and offset is None and isinstance(deadline_id, str):
+                    self._schedule_next_occurrence(deadline_id)
+    
+    def _fire(self, deadline_id, offset, version) -> bool:
+        """Run the callback of one event; returns False if it was re-queued for its exact time instead"""
+        deadline = self.reminder.get_deadline(deadline_id)
+        exact = deadline.due_date.timestamp() - (offset or 0) if deadline is not None else None
+        with self._cond:
+            if self._versions.get(deadline_id) != version:
+                return False
+            if exact is not None and exact > time.time():
+                # Heap keys are whole seconds; wait out the rest of the second at the exact time
+                self._seq += 1
+                heapq.heappush(self._heap, (exact, self._seq, deadline_id, offset, version))
+                self._cond.notify()
+                return False
+            if offset is None:
+                del self._versions[deadline_id]
+        if deadline is None or deadline.status == Status.COMPLETED:
+            return True
+        try:
+            if offset is None:
+                if self.on_overdue:
+                    self.on_overdue(deadline)
+            elif self.on_reminder:
+                self.on_reminder(deadline, timedelta(seconds=offset))
+        except Exception as e:
+            logger.error("❌ Notification callback failed for deadline ID %s: %s", deadline_id, e)
+        return True
+
+def notification_payload(deadline, stage: str, now: datetime = None) -> dict:
+    """JSON-ready notification for one deadline; `stage` is 'upcoming', 'overdue' or 'reminder:<seconds>'"""
+    now = now or datetime.now()
+    if stage == "overdue":
+        message = f"'{deadline.title}' - {(now - deadline.due_date).days} days overdue!"
+    else:
+        message = f"'{deadline.title}' - Due in {(deadline.due_date - now).days} days " \
+                  f"({deadline.due_date.strftime('%m/%d/%Y')})"
+    return {
+        "deadline_id": deadline.id,
+        "stage": stage,
+        "title": deadline.title,
+        "category": deadline.category,
+        "priority": Priority.get_name(deadline.priority),
+        "due_date": deadline.due_date.isoformat(),
+        "due_ts": to_epoch(deadline.due_date),
+        "message": message,
+    }
+
+class RateLimiter:
+    """Token bucket allowing `rate` units per second with bursts of up to `burst`"""
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = burst or rate
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, units: int = 1):
+        """Take `units` tokens, sleeping until the bucket has paid them back"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Going into debt lets a batch larger than the burst through at the average rate
+            self._tokens -= units
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+class NotificationSink:
+    """Destination for batches of notification payloads.
+
+    Subclasses implement deliver(batch) and raise on failure; the dispatcher
+    retries. `rate` caps notifications per second for this sink (None: no cap).
+    """
+    def __init__(self, name: str = None, rate: float = None):
+        self.name = name or type(self).__name__
+        self.rate = rate
+        self._lock = threading.Lock()
+    
+    def deliver(self, batch):
+        raise NotImplementedError
+
+class FileSink(NotificationSink):
+    """Append one human-readable line per notification to a text file"""
+    def __init__(self, path: str, **options):
+        super().__init__(**options)
+        self.path = path
+    
+    def deliver(self, batch):
+        lines = "".join(f"[{item['stage']}] {item['message']}\n" for item in batch)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+class JsonlSpoolSink(NotificationSink):
+    """Write each batch as a new JSON Lines file in a spool directory for another process to pick up.
+
+    Files appear atomically via rename, so a reader never sees a partial batch.
+    """
+    def __init__(self, directory: str, **options):
+        super().__init__(**options)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def deliver(self, batch):
+        name = f"{time.time_ns()}-{threading.get_ident()}.jsonl"
+        temp = os.path.join(self.directory, "." + name + ".tmp")
+        with open(temp, "w", encoding="utf-8") as f:
+            for item in batch:
+                f.write(json.dumps(item) + "\n")
+        os.replace(temp, os.path.join(self.directory, name))
+
+class WebhookSink(NotificationSink):
+    """POST each batch as a JSON array to an HTTP endpoint"""
+    def __init__(self, url: str, timeout: float = 10.0, headers: dict = None, **options):
+        super().__init__(**options)
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+    
+    def deliver(self, batch):
+        request = urllib.request.Request(self.url, data=json.dumps(batch).encode("utf-8"), headers=self.headers,
+                                         method="POST")
+        # urlopen raises HTTPError for non-2xx responses, which triggers a retry
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+class MaildirSink(NotificationSink):
+    """Drop one email per notification into a Maildir for a local mail agent to deliver"""
+    def __init__(self, path: str, to: str, sender: str = "deadline-reminder@localhost", **options):
+        super().__init__(**options)
+        self.path = path
+        self.to = to
+        self.sender = sender
+    
+    def deliver(self, batch):
+        with self._lock:
+            maildir = mailbox.Maildir(self.path, create=True)
+            for item in batch:
+                message = EmailMessage()
+                message["From"] = self.sender
+                message["To"] = self.to
+                message["Subject"] = f"[{item['stage']}] {item['title']}"
+                message.set_content(item["message"] + "\n")
+                maildir.add(message)
+
+class NotificationDispatcher:
+    """Batch notifications and deliver them to every sink from a worker pool.
+
+    submit() only buffers, so callers never wait on delivery. Full batches go
+    to the pool, one task per sink; each task waits on the sink's rate limit
+    and retries with exponential backoff. A batch that still fails after
+    `max_retries` is logged, counted and passed to on_failure(sink, batch).
+    """
+    def __init__(self, sinks, workers: int = 4, batch_size: int = 500, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 30.0, on_failure=None):
+        self.sinks = list(sinks)
+        self.on_failure = on_failure
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._limiters = {sink: RateLimiter(sink.rate) for sink in self.sinks if sink.rate}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notification-sink")
+        self._pending = []
+        self._futures = set()
+        # Reentrant: a future that is already done runs its callback inside _dispatch
+        self._lock = threading.RLock()
+        self._counters = {sink.name: {"delivered": 0, "failed": 0, "retries": 0} for sink in self.sinks}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def submit(self, notification: dict):
+        """Queue one notification; it is sent once its batch fills or on flush()"""
+        with self._lock:
+            self._pending.append(notification)
+            if len(self._pending) >= self.batch_size:
+                self._dispatch()
+    
+    def _dispatch(self):
+        """Hand the pending batch to the pool; caller holds the lock"""
+        batch, self._pending = self._pending, []
+        for sink in self.sinks:
+            future = self._executor.submit(self._deliver, sink, batch)
+            self._futures.add(future)
+            future.add_done_callback(self._discard)
+    
+    def _discard(self, future):
+        with self._lock:
+            self._futures.discard(future)
+    
+    def _deliver(self, sink, batch):
+        limiter = self._limiters.get(sink)
+        if limiter is not None:
+            limiter.acquire(len(batch))
+        counters = self._counters[sink.name]
+        for attempt in range(self.max_retries + 1):
+            try:
+                sink.deliver(batch)
+                with self._lock:
+                    counters["delivered"] += len(batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    with self._lock:
+                        counters["failed"] += len(batch)
+                    logger.error("❌ %s dropped %s notifications after %s attempts: %s", sink.name, len(batch),
+                                 attempt + 1, e)
+                    if self.on_failure is not None:
+                        try:
+                            self.on_failure(sink, batch)
+                        except Exception as callback_error:
+                            logger.error("❌ Delivery failure callback failed: %s", callback_error)
+                    return
+                with self._lock:
+                    counters["retries"] += 1
+                time.sleep(min(self.max_backoff, self.backoff * 2 ** attempt))
+    
+    def flush(self, wait_for_delivery: bool = True):
+        """Send the partial batch now and optionally wait until every queued batch is delivered or dropped"""
+        with self._lock:
+            if self._pending:
+                self._dispatch()
+            futures = list(self._futures)
+        if wait_for_delivery:
+            wait(futures)
+    
+    def stats(self) -> dict:
+        """Per-sink delivered/failed/retries counters"""
+        with self._lock:
+            return {name: dict(counters) for name, counters in self._counters.items()}
+    
+    def close(self):
+        """Deliver everything still queued, then stop the workers"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+class NotificationManager:
+    def __init__(self, reminder, dispatcher: NotificationDispatcher = None):
+        self.reminder = reminder
+        self.dispatcher = dispatcher
+        self.scheduler = None
+        # Claims are written before delivery; give back the ones a sink finally failed on
+        if dispatcher is not None and dispatcher.on_failure is None:
+            dispatcher.on_failure = self._release_failed
+    
+    def start_scheduler(self, offsets=(timedelta(days=1),), on_reminder=None, on_overdue=None,
+                        fire_missed: bool = False):
+        """Switch to event-driven mode: fire callbacks when deadlines enter a reminder window or fall due"""
+        self.stop_scheduler()
+        if self.dispatcher is not None:
+            on_reminder = on_reminder or self._dispatch_reminder
+            on_overdue = on_overdue or partial(self._dispatch, "overdue")
+        self.scheduler = NotificationScheduler(self.reminder, offsets, on_reminder or self._print_reminder,
+                                               on_overdue or self._print_overdue, fire_missed)
+        return self.scheduler.start()
+    
+    def stop_scheduler(self):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
+    
+    @staticmethod
+    def _print_reminder(deadline, offset):
+        print(f"🔔 '{deadline.title}' is due in {offset} ({deadline.due_date.strftime('%m/%d/%Y %H:%M')})")
+    
+    @staticmethod
+    def _print_overdue(deadline):
+        print(f"❌ '{deadline.title}' is now overdue!")
+    
+    def _release_failed(self, sink, batch):
+        """Forget the claims of a dropped batch so the next cycle retries it.
+
+        Retried notifications go to every sink again, so sinks that already
+        succeeded may see them twice; a failed sink never loses one.
+        """
+        self.reminder.release_notifications([(item["deadline_id"], item["stage"], item["due_ts"]) for item in batch])
+    
+    def _dispatch_reminder(self, deadline, offset):
+        self._dispatch(f"reminder:{int(offset.total_seconds())}", deadline)
+    
+    def _dispatch(self, stage, deadline):
+        """Queue one scheduler event through the dispatcher unless it was already sent"""
+        if self.reminder.claim_notifications([(deadline.id, stage, to_epoch(deadline.due_date))]):
+            self.dispatcher.submit(notification_payload(deadline, stage))
+    
+    def deliver_notifications(self, days: int = 3, chunk_size: int = 1000) -> int:
+        """Queue overdue and upcoming notifications that were not sent before; returns how many were queued.
+
+        Each deadline is announced once per stage and due time; one whose
+        delivery finally failed is queued again by a later call. Delivery runs
+        on the dispatcher's workers, so this returns as soon as all are queued.
+        """
+        if self.dispatcher is None:
+            raise RuntimeError("no dispatcher; pass one to NotificationManager")
+        now = datetime.now()
+        queued = 0
+        for stage, deadlines in (("overdue", self.reminder.iter_overdue_deadlines()),
+                                 ("upcoming", self.reminder.iter_upcoming_deadlines(days))):
+            for chunk in iter(lambda: list(islice(deadlines, chunk_size)), []):
+                by_key = {(deadline.id, stage, to_epoch(deadline.due_date)): deadline for deadline in chunk}
+                for key in self.reminder.claim_notifications(by_key, chunk_size):
+                    self.dispatcher.submit(notification_payload(by_key[key], stage, now))
+                    queued += 1
+        return queued
+    
+    def check_upcoming_deadlines(self, days: int = 3):
+        """Check and notify about upcoming deadlines"""
+        try:
+            upcoming = self.reminder.get_upcoming_deadlines(days)
+            overdue = self.reminder.get_overdue_deadlines()
+            
+            print("\n" + "🔔" * 20)
+            print("        DEADLINE NOTIFICATIONS")
+            print("🔔" * 20)
+            
+            if overdue:
+                print(f"\n❌ OVERDUE DEADLINES ({len(overdue)}):")
+                for deadline in overdue:
+                    days_overdue = (datetime.now() - deadline.due_date).days
+                    print(f"   ⚠️  '{deadline.title}' - {days_overdue} days overdue!")
+            
+            if upcoming:
+                print(f"\n📅 UPCOMING DEADLINES ({len(upcoming)} in next {days} days):")
+                for deadline in upcoming:
+                    days_until = (deadline.due_date - datetime.now()).days
+                    priority_icon = "🔥" if deadline.priority in [Priority.HIGH, Priority.URGENT] else "⚠️"
+                    print(f"   {priority_icon} '{deadline.title}' - Due in {days_until} days ({deadline.due_date.strftime('%m/%d/%Y')})")
+            
+            if not overdue and not upcoming:
+                print("\n✅ No urgent notifications! You're all caught up!")
+            
+            print("🔔" * 20)
+        except Exception as e:
+            print(f"❌ Error checking notifications: {e}")
+
+# Per-process connection pools used by shard fan-out workers
+_SHARD_CONNECTIONS = {}
+
+def _shard_rows(db, filters: dict):
+    """Raw rows for _deadline_query(**filters) with due_ts appended, ready to merge and pickle.
+
+    With include_archived=True the shard's archived rows are merged in as well.
+    """
+    filters = dict(filters)
+    include_archived = filters.pop("include_archived", False)
+    with db.connection() as conn:
+        rows = conn.execute(*_deadline_query(extra=("due_ts",), **filters)).fetchall()
+        if include_archived:
+            filters["include_completed"] = True
+            archived = conn.execute(*_deadline_query(extra=("due_ts",), table="deadlines_archive",
+                                                     **filters)).fetchall()
+            if archived:
+                rows = list(heapq.merge(rows, archived, key=lambda row: (row[-1], row[0])))
+        return rows
+
+def _shard_worker_rows(db_name: str, filters: dict):
+    """Process-pool entry point: run one fan-out query against one shard file"""
+    db = _SHARD_CONNECTIONS.get(db_name)
+    if db is None:
+        db = _SHARD_CONNECTIONS[db_name] = ConnectionManager(db_name, pool_size=1)
+    return _shard_rows(db, filters)
+
+def _map_future(future: Future, func) -> Future:
+    """Future resolving to func(result) once `future` completes"""
+    mapped = Future()
+    
+    def done(source):
+        try:
+            mapped.set_result(func(source.result()))
+        except Exception as e:
+            mapped.set_exception(e)
+    
+    future.add_done_callback(done)
+    return mapped
+
+class ShardedDeadlineReminder:
+    """DeadlineReminder partitioned across several SQLite files by category.
+
+    Shard i of N lives in "<name>-<i>.db". A deadline's global ID is
+    local_id * N + shard, so single-item operations are routed by ID % N with
+    no lookup table. get_all/get_upcoming/get_overdue fan out over a process
+    pool and are k-way merged by due date; everything else runs in-process.
+    """
+    # Whole-table reads that are fanned out over the process pool
+    FAN_OUT_METHODS = ("get_all_deadlines", "get_upcoming_deadlines", "get_overdue_deadlines")
+    
+    def __init__(self, db_name: str = "deadlines.db", shards: int = 4, processes: int = None, **kwargs):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        root, ext = os.path.splitext(db_name)
+        self.db_name = db_name
+        self.shard_count = shards
+        self.shard_paths = [f"{root}-{i}{ext or '.db'}" for i in range(shards)]
+        # processes=0 runs fan-out queries sequentially in this process; a pool only pays off with spare cores
+        if processes is None:
+            processes = min(shards, os.cpu_count() or 1)
+        self.processes = processes if processes > 1 else 0
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+        self._background_tasks = []
+        self._listeners = {}
+        # All shards share one Instrumentation so stats() covers the whole store
+        self._metrics = Instrumentation() if kwargs.pop("instrument", False) else None
+        self.shards = [DeadlineReminder(path, instrument=self._metrics or False, **kwargs)
+                       for path in self.shard_paths]
+        if self._metrics is not None:
+            for name in self.FAN_OUT_METHODS:
+                setattr(self, name, self._metrics.wrap(name, getattr(self, name)))
+        for index, shard in enumerate(self.shards):
+            self._check_shard_info(shard, index)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Stop background tasks, the process pool and every shard"""
+        for task in self._background_tasks:
+            task.stop()
+        self._background_tasks = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        for shard in self.shards:
+            shard.close()
+    
+    def _check_shard_info(self, shard, index: int):
+        """Stamp a new shard with its position, and refuse files from a different layout"""
+        with shard.transaction() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS shard_info (shard INTEGER NOT NULL, shards INTEGER NOT NULL)')
+            row = conn.execute('SELECT shard, shards FROM shard_info').fetchone()
+            if row is None:
+                conn.execute('INSERT INTO shard_info (shard, shards) VALUES (?, ?)', (index, self.shard_count))
+            elif tuple(row) != (index, self.shard_count):
+                raise ValueError(f"{shard.db_name} is shard {row[0]} of {row[1]}, not {index} of {self.shard_count}")
+    
+    def shard_for(self, category: str) -> int:
+        """Index of the shard that stores deadlines in `category`"""
+        return zlib.crc32((category or "").strip().encode("utf-8")) % self.shard_count
+    
+    def _route(self, deadline_id):
+        """(shard index, local ID) for a global deadline or occurrence ID"""
+        parsed = parse_occurrence_id(deadline_id)
+        if parsed is not None:
+            recurrence_id, occurrence = parsed
+            return recurrence_id % self.shard_count, occurrence_id(recurrence_id // self.shard_count, occurrence)
+        return deadline_id % self.shard_count, deadline_id // self.shard_count
+    
+    def _global_id(self, deadline_id, index: int):
+        parsed = parse_occurrence_id(deadline_id)
+        if parsed is not None:
+            return occurrence_id(parsed[0] * self.shard_count + index, parsed[1])
+        return deadline_id * self.shard_count + index
+    
+    def _global(self, deadlines, index: int, shared: bool = False):
+        """Rewrite shard-local IDs to global ones, copying objects a shard cache may still hold"""
+        for deadline in deadlines:
+            if shared:
+                deadline = copy.copy(deadline)
+            deadline.id = self._global_id(deadline.id, index)
+            yield deadline
+    
+    @contextmanager
+    def transaction(self):
+        """Hold a transaction on every shard.
+
+        Each shard commits atomically, but not all shards together: a failed
+        commit on one shard rolls back the shards not yet committed.
+        """
+        with ExitStack() as stack:
+            connections = [stack.enter_context(shard.transaction()) for shard in self.shards]
+            self._local.depth = getattr(self._local, "depth", 0) + 1
+            try:
+                yield connections
+            finally:
+                self._local.depth -= 1
+    
+    def _fan_out(self, status: str = None, **filters):
+        """Query every shard with the same filters and k-way merge the rows by (due_ts, global id).
+
+        Shards return plain tuples, which pickle cheaply and merge without a
+        key function; Deadline objects are only built once, here. Recurrence
+        occurrences in the window are expanded in-process and merged in.
+        """
+        # Inside transaction() the pool could not see uncommitted writes, so stay in-process
+        if not self.processes or getattr(self._local, "depth", 0):
+            results = [_shard_rows(shard._db, filters) for shard in self.shards]
+        else:
+            with self._pool_lock:
+                if self._pool is None:
+                    # spawn, not fork: children must not inherit open SQLite handles or our threads
+                    self._pool = ProcessPoolExecutor(max_workers=self.processes,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            futures = [self._pool.submit(_shard_worker_rows, path, filters) for path in self.shard_paths]
+            results = [future.result() for future in futures]
+        n = self.shard_count
+        
+        def keyed(rows, index):
+            for row in rows:
+                yield (row[-1], 0, row[0] * n + index, 0), row
+        
+        streams = [keyed(rows, index) for index, rows in enumerate(results)]
+        if filters.get("end") is not None:
+            streams.extend(((_deadline_order(occurrence), occurrence) for occurrence in self._global(
+                shard.iter_occurrences(filters.get("start"), filters["end"], filters.get("include_completed", False)),
+                index)) for index, shard in enumerate(self.shards))
+        deadlines = []
+        for key, row in heapq.merge(*streams):
+            if isinstance(row, Deadline):
+                row.status = status or row.status
+                deadlines.append(row)
+            else:
+                deadlines.append(Deadline(key[2], row[1], row[2], row[3], row[4], status or row[5], *row[6:9]))
+        return deadlines
+    
+    def stats(self) -> dict:
+        """Get per-operation counters across all shards (empty when off)"""
+        return self._metrics.stats() if self._metrics is not None else {}
+    
+    def export_metrics(self, path: str):
+        """Write the instrumentation counters to `path` in Prometheus text format"""
+        if self._metrics is None:
+            raise RuntimeError("instrumentation is not enabled; pass instrument=True")
+        self._metrics.export_prometheus(path)
+    
+    def cache_stats(self) -> dict:
+        """Get cache counters summed over the shards (empty when caching is off)"""
+        totals = {}
+        for shard in self.shards:
+            for key, value in shard.cache_stats().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+    
+    def add_listener(self, callback):
+        """Register callback(event, deadline_id, due_ts, status) for committed writes, with global IDs"""
+        wrappers = []
+        for index, shard in enumerate(self.shards):
+            def wrapper(event, deadline_id, due_ts, status, index=index):
+                callback(event, self._global_id(deadline_id, index), due_ts, status)
+            shard.add_listener(wrapper)
+            wrappers.append(wrapper)
+        self._listeners.setdefault(callback, []).append(wrappers)
+    
+    def remove_listener(self, callback):
+        for wrappers in self._listeners.pop(callback, []):
+            for shard, wrapper in zip(self.shards, wrappers):
+                shard.remove_listener(wrapper)
+    
+    def start_write_behind(self, max_delay: float = 0.005, max_batch: int = 500, max_pending: int = 10000):
+        """Give every shard its own group-committing writer; see DeadlineReminder.start_write_behind"""
+        return [shard.start_write_behind(max_delay, max_batch, max_pending) for shard in self.shards]
+    
+    def stop_write_behind(self, timeout: float = None):
+        for shard in self.shards:
+            shard.stop_write_behind(timeout)
+    
+    def flush(self, timeout: float = None):
+        """Wait until every shard has committed the writes queued so far"""
+        for shard in self.shards:
+            shard.flush(timeout)
+    
+    def get_schema_version(self) -> int:
+        """Get the lowest schema version among the shards"""
+        return min(shard.get_schema_version() for shard in self.shards)
+    
+    def add_deadline(self, title: str, due_date: datetime, priority: int, category: str, description: str = "") -> int:
+        """Add a new deadline to its category's shard and return its global ID (a Future in write-behind mode)"""
+        index = self.shard_for(category)
+        deadline_id = self.shards[index].add_deadline(title, due_date, priority, category, description)
+        
+        def to_global(local_id):
+            return local_id * self.shard_count + index if local_id > 0 else local_id
+        
+        return _map_future(deadline_id, to_global) if isinstance(deadline_id, Future) else to_global(deadline_id)
+    
+    def add_deadlines_bulk(self, records, chunk_size: int = 5000) -> BulkInsertResult:
+        """Route records to their shards and bulk insert them a chunk per shard at a time.
+
+        Row numbers in the error report refer to the input; ID ranges are
+        global, so IDs within one range step by the shard count.
+        """
+        result = BulkInsertResult()
+        buffers = [[] for _ in self.shards]
+        
+        def flush(index):
+            batch, buffers[index] = buffers[index], []
+            inserted = self.shards[index].add_deadlines_bulk((record for _, record in batch), chunk_size)
+            result.inserted += inserted.inserted
+            result.id_ranges.extend((first * self.shard_count + index, last * self.shard_count + index)
+                                    for first, last in inserted.id_ranges)
+            result.errors.extend((batch[row_number - 1][0], message) for row_number, message in inserted.errors)
+        
+        for row_number, record in enumerate(records, start=1):
+            category = record.get("category") if isinstance(record, dict) else None
+            if isinstance(record, (tuple, list)) and len(record) > 3:
+                category = record[3]
+            index = self.shard_for(category if isinstance(category, str) else None)
+            buffers[index].append((row_number, record))
+            if len(buffers[index]) >= chunk_size:
+                flush(index)
+        for index, batch in enumerate(buffers):
+            if batch:
+                flush(index)
+        result.errors.sort()
+        return result
+    
+    def import_deadlines(self, path: str, file_format: str = None, chunk_size: int = 5000) -> BulkInsertResult:
+        """Stream deadlines from a CSV or JSON Lines file into the shards"""
+        return self.add_deadlines_bulk(iter_import_records(path, file_format), chunk_size=chunk_size)
+    
+    def iter_deadlines(self, include_completed: bool = False, start: datetime = None, end: datetime = None,
+                       category: str = None, after=None, limit: int = None, columns=None, batch_size: int = 500,
+                       include_archived: bool = None):
+        """Stream deadlines from every shard merged by (due_date, id); see DeadlineReminder.iter_deadlines"""
+        if columns is not None:
+            # The merge needs both sort keys
+            columns = set(columns) | {"id", "due_date"}
+        indexes = [self.shard_for(category)] if category is not None else range(self.shard_count)
+        streams = []
+        for index in indexes:
+            shard_after = None
+            if after is not None:
+                # (due, local * N + index) > (after_due, after_id)  <=>  local > (after_id - index) // N
+                parsed = parse_occurrence_id(after[1])
+                if parsed is None:
+                    shard_after = (after[0], (after[1] - index) // self.shard_count)
+                elif (parsed[0] - index) % self.shard_count:
+                    # No rule of this shard has that ID: resume after every occurrence of the nearest lower one
+                    shard_after = (after[0], occurrence_id((parsed[0] - index) // self.shard_count, sys.maxsize))
+                else:
+                    shard_after = (after[0], occurrence_id((parsed[0] - index) // self.shard_count, parsed[1]))
+            streams.append(self._global(self.shards[index].iter_deadlines(
+                include_completed, start, end, category, shard_after, limit, columns, batch_size, include_archived),
+                index))
+        return islice(heapq.merge(*streams, key=_deadline_order), limit)
+    
+    def iter_due_times(self, batch_size: int = 5000):
+        """Stream (id, due_ts, status) for every unfinished deadline on every shard"""
+        for index, shard in enumerate(self.shards):
+            for deadline_id, due_ts, status in shard.iter_due_times(batch_size):
+                yield self._global_id(deadline_id, index), due_ts, status
+    
+    def iter_upcoming_deadlines(self, days: int = 7, **kwargs):
+        """Stream unfinished deadlines due within the next `days` days"""
+        now = datetime.now()
+        return self.iter_deadlines(start=now, end=now + timedelta(days=days), **kwargs)
+    
+    def iter_overdue_deadlines(self, **kwargs):
+        """Stream unfinished deadlines that are past due, reported as Overdue"""
+        for deadline in self.iter_deadlines(end=datetime.now(), **kwargs):
+            deadline.status = Status.OVERDUE
+            yield deadline
+    
+    def get_all_deadlines(self, include_completed: bool = False, include_archived: bool = None):
+        """Get all deadlines; archived ones are included along with completed ones unless include_archived=False"""
+        try:
+            return self._fan_out(include_completed=include_completed,
+                                 include_archived=include_completed if include_archived is None else include_archived)
+        except Exception as e:
+            logger.error("❌ Error fetching deadlines: %s", e)
+            return []
+    
+    def get_upcoming_deadlines(self, days: int = 7):
+        """Get deadlines due within the next specified days"""
+        try:
+            now = datetime.now()
+            return self._fan_out(start=now, end=now + timedelta(days=days))
+        except Exception as e:
+            logger.error("❌ Error fetching upcoming deadlines: %s", e)
+            return []
+    
+    def get_overdue_deadlines(self):
+        """Get all overdue deadlines without modifying the database"""
+        try:
+            return self._fan_out(Status.OVERDUE, end=datetime.now())
+        except Exception as e:
+            logger.error("❌ Error fetching overdue deadlines: %s", e)
+            return []
+    
+    def sweep_overdue(self, now: datetime = None):
+        """Mark past-due deadlines Overdue on every shard; returns the changed rows by due date"""
+        now = now or datetime.now()
+        return list(heapq.merge(*(self._global(shard.sweep_overdue(now), index)
+                                  for index, shard in enumerate(self.shards)), key=_deadline_order))
+    
+    def start_overdue_sweeper(self, interval: float = 60.0):
+        """Run sweep_overdue() in a background thread every `interval` seconds"""
+        sweeper = PeriodicTask(interval, self.sweep_overdue, name="overdue-sweeper")
+        self._background_tasks.append(sweeper)
+        sweeper.start()
+        return sweeper
+    
+    def archive_completed(self, older_than: timedelta = timedelta(days=90), batch_size: int = 1000,
+                          now: datetime = None) -> int:
+        """Archive old completed deadlines on every shard; returns the total archived, or -1 on error"""
+        now = now or datetime.now()
+        total = 0
+        for shard in self.shards:
+            count = shard.archive_completed(older_than, batch_size, now)
+            if count < 0:
+                return -1
+            total += count
+        return total
+    
+    def run_maintenance(self, older_than: timedelta = timedelta(days=90), batch_size: int = 1000,
+                        vacuum_pages: int = 1000, change_retention: timedelta = timedelta(days=30)) -> int:
+        """Run maintenance on every shard in turn; returns the number of rows archived"""
+        counts = [shard.run_maintenance(older_than, batch_size, vacuum_pages, change_retention)
+                  for shard in self.shards]
+        return -1 if min(counts) < 0 else sum(counts)
+    
+    def start_maintenance(self, interval: float = 86400.0, **options):
+        """Run run_maintenance(**options) in a background thread every `interval` seconds"""
+        task = PeriodicTask(interval, partial(self.run_maintenance, **options), name="maintenance")
+        self._background_tasks.append(task)
+        task.start()
+        return task
+    
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch every shard to auto_vacuum=INCREMENTAL"""
+        return all([shard.enable_incremental_vacuum() for shard in self.shards])
+    
+    def update_status(self, deadline_id: int, status: str) -> bool:
+        """Update the status of a deadline"""
+        index, local_id = self._route(deadline_id)
+        return self.shards[index].update_status(local_id, status)
+    
+    def update_priority(self, deadline_id: int, priority: int) -> bool:
+        """Update the priority of a deadline"""
+        index, local_id = self._route(deadline_id)
+        return self.shards[index].update_priority(local_id, priority)
+    
+    def delete_deadline(self, deadline_id: int) -> bool:
+        """Delete a deadline"""
+        index, local_id = self._route(deadline_id)
+        return self.shards[index].delete_deadline(local_id)
+    
+    def get_deadline(self, deadline_id: int):
+        """Get a specific deadline by ID"""
+        index, local_id = self._route(deadline_id)
+        deadline = self.shards[index].get_deadline(local_id)
+        if deadline is None:
+            return None
+        return next(self._global([deadline], index, self.shards[index]._cache is not None))
+    
+    def _write_many(self, method: str, ids, category: str, *args, **filters) -> int:
+        """Split IDs by shard and run a bulk write on each shard involved; each shard commits on its own"""
+        local_ids = {}
+        for deadline_id in ids or ():
+            index, local_id = self._route(deadline_id)
+            local_ids.setdefault(index, []).append(local_id)
+        indexes = range(self.shard_count) if ids is None else sorted(local_ids)
+        if category is not None:
+            indexes = [index for index in indexes if index == self.shard_for(category)]
+        total = 0
+        for index in indexes:
+            count = getattr(self.shards[index], method)(None if ids is None else local_ids[index], *args,
+                                                        category=category, **filters)
+            if count < 0:
+                return -1
+            total += count
+        return total
+    
+    def update_status_many(self, ids, status: str, category: str = None, start: datetime = None,
+                           end: datetime = None, current_status=None) -> int:
+        """Update the status of many deadlines; see DeadlineReminder.update_status_many"""
+        return self._write_many("update_status_many", ids, category, status, start=start, end=end,
+                                current_status=current_status)
+    
+    def update_priority_many(self, ids, priority: int, category: str = None, start: datetime = None,
+                             end: datetime = None, current_status=None) -> int:
+        """Update the priority of many deadlines; see DeadlineReminder.update_priority_many"""
+        return self._write_many("update_priority_many", ids, category, priority, start=start, end=end,
+                                current_status=current_status)
+    
+    def delete_many(self, ids=None, category: str = None, start: datetime = None, end: datetime = None,
+                    current_status=None) -> int:
+        """Delete many deadlines; see DeadlineReminder.delete_many"""
+        return self._write_many("delete_many", ids, category, start=start, end=end, current_status=current_status)
+    
+    def add_recurrence(self, title: str, first_due: datetime, frequency: str, priority: int, category: str,
+                       description: str = "", interval: int = 1, until: datetime = None, count: int = None) -> int:
+        """Store a recurring deadline on its category's shard and return its global rule ID"""
+        index = self.shard_for(category)
+        recurrence_id = self.shards[index].add_recurrence(title, first_due, frequency, priority, category,
+                                                          description, interval, until, count)
+        return recurrence_id * self.shard_count + index if recurrence_id > 0 else recurrence_id
+    
+    def get_recurrences(self, category: str = None):
+        """Get every recurrence rule, with global IDs"""
+        indexes = [self.shard_for(category)] if category is not None else range(self.shard_count)
+        rules = []
+        for index in indexes:
+            for rule in self.shards[index].get_recurrences(category):
+                rule.id = rule.id * self.shard_count + index
+                rules.append(rule)
+        return sorted(rules, key=lambda rule: rule.id)
+    
+    def delete_recurrence(self, recurrence_id: int) -> bool:
+        """Delete a recurrence rule together with its occurrence overrides"""
+        return self.shards[recurrence_id % self.shard_count].delete_recurrence(recurrence_id // self.shard_count)
+    
+    def reschedule_occurrence(self, deadline_id: str, due_date: datetime) -> bool:
+        """Move one occurrence of a recurrence to a new due date"""
+        index, local_id = self._route(deadline_id)
+        return self.shards[index].reschedule_occurrence(local_id, due_date)
+    
+    def iter_occurrences(self, start: datetime = None, end: datetime = None, include_completed: bool = False,
+                         category: str = None):
+        """Expand the recurrences of every shard, merged in due order"""
+        indexes = [self.shard_for(category)] if category is not None else range(self.shard_count)
+        return heapq.merge(*(self._global(self.shards[index].iter_occurrences(start, end, include_completed,
+                                                                              category), index)
+                             for index in indexes), key=_deadline_order)
+    
+    def next_occurrence(self, deadline_id: str):
+        """The first unfinished occurrence after the given one, or None when the rule has ended"""
+        if parse_occurrence_id(deadline_id) is None:
+            return None
+        index, local_id = self._route(deadline_id)
+        upcoming = self.shards[index].next_occurrence(local_id)
+        return None if upcoming is None else next(self._global([upcoming], index))
+    
+    def search(self, query: str, status=None, start: datetime = None, end: datetime = None, limit: int = 50,
+               prefix: bool = True, raw: bool = False):
+        """Full-text search on every shard, interleaving each shard's ranked results.
+
+        bm25 scores depend on per-shard statistics and are not comparable
+        across files, so results are taken round-robin rather than re-ranked.
+        """
+        ranked = [list(self._global(shard.search(query, status, start, end, limit, prefix, raw), index))
+                  for index, shard in enumerate(self.shards)]
+        interleaved = (deadline for group in zip_longest(*ranked) for deadline in group if deadline is not None)
+        return list(islice(interleaved, limit))
+    
+    def rebuild_search_index(self) -> bool:
+        """Rebuild the search index on every shard"""
+        return all([shard.rebuild_search_index() for shard in self.shards])
+    
+    def report_counts(self, group_by=("status",), include_completed: bool = True):
+        """Count deadlines grouped by category/status/priority, summed over the shards"""
+        fields = _report_fields(group_by)
+        totals = {}
+        for shard in self.shards:
+            for row in shard.report_counts(fields, include_completed):
+                key = tuple(row[field] for field in fields)
+                totals[key] = totals.get(key, 0) + row["count"]
+        return [dict(zip(fields + ("count",), key + (count,))) for key, count in sorted(totals.items())]
+    
+    def completion_stats(self, group_by=()):
+        """Completion latency in seconds, combined over the shards"""
+        fields = _report_fields(group_by)
+        combined = {}
+        for shard in self.shards:
+            for row in shard.completion_stats(fields):
+                key = tuple(row[field] for field in fields)
+                total = combined.get(key)
+                if total is None:
+                    combined[key] = dict(row, seconds=row["avg_seconds"] * row["count"])
+                    continue
+                total["count"] += row["count"]
+                total["seconds"] += row["avg_seconds"] * row["count"]
+                total["min_seconds"] = min(total["min_seconds"], row["min_seconds"])
+                total["max_seconds"] = max(total["max_seconds"], row["max_seconds"])
+        results = []
+        for key, total in sorted(combined.items()):
+            total["avg_seconds"] = total.pop("seconds") / total["count"]
+            results.append(total)
+        return results
+    
+    def summary_counts(self, group_by=("category",), category: str = None, status: str = None,
+                       priority: int = None):
+        """Read the summary tables of the shards and sum them"""
+        fields = _report_fields(group_by)
+        shards = [self.shards[self.shard_for(category)]] if category is not None else self.shards
+        totals = {}
+        for shard in shards:
+            for row in shard.summary_counts(fields, category, status, priority):
+                key = tuple(row[field] for field in fields)
+                totals[key] = totals.get(key, 0) + row["count"]
+        return [dict(zip(fields + ("count",), key + (count,))) for key, count in sorted(totals.items())]
+    
+    def check_summary(self, repair: bool = False):
+        """Check every shard's summary table; returns the drifted keys of all shards"""
+        return [row for shard in self.shards for row in shard.check_summary(repair)]
+    
+    def rebuild_summary(self):
+        """Recompute every shard's summary table"""
+        for shard in self.shards:
+            shard.rebuild_summary()
+    
+    def claim_notifications(self, keys, chunk_size: int = 1000) -> list:
+        """Claim notifications in their deadlines' shards; see DeadlineReminder.claim_notifications"""
+        by_shard = {}
+        for deadline_id, stage, due_ts in keys:
+            index, local_id = self._route(deadline_id)
+            by_shard.setdefault(index, {})[(local_id, stage, due_ts)] = deadline_id
+        claimed = []
+        for index, local_keys in by_shard.items():
+            claimed.extend((local_keys[key], key[1], key[2])
+                           for key in self.shards[index].claim_notifications(local_keys, chunk_size))
+        return claimed
+    
+    def release_notifications(self, keys) -> int:
+        """Release claims in their deadlines' shards; returns the number released, or -1 on error"""
+        by_shard = {}
+        for deadline_id, stage, due_ts in keys:
+            index, local_id = self._route(deadline_id)
+            by_shard.setdefault(index, []).append((local_id, stage, due_ts))
+        counts = [self.shards[index].release_notifications(local_keys) for index, local_keys in by_shard.items()]
+        return -1 if any(count < 0 for count in counts) else sum(counts)
+    
+    def changes_since(self, cursor=None, limit: int = 1000):
+        """Get up to `limit` changes after `cursor` as (changes, next_cursor), with global IDs.
+
+        The cursor is a tuple of per-shard sequence numbers (None to start
+        from the beginning). Shards are drained in order, so one call may
+        return changes from only some of them.
+        """
+        cursor = list(cursor or (0,) * self.shard_count)
+        if len(cursor) != self.shard_count:
+            raise ValueError(f"cursor has {len(cursor)} positions for {self.shard_count} shards")
+        changes = []
+        for index, shard in enumerate(self.shards):
+            if len(changes) >= limit:
+                break
+            shard_changes, cursor[index] = shard.changes_since(cursor[index], limit - len(changes))
+            for change in shard_changes:
+                change["id"] = self._global_id(change["id"], index)
+                if change["deadline"] is not None:
+                    change["deadline"] = next(self._global([change["deadline"]], index))
+                changes.append(change)
+        return changes, tuple(cursor)
+    
+    def iter_changes(self, cursor=None, batch_size: int = 1000):
+        """Stream every change after `cursor` from every shard"""
+        while True:
+            changes, cursor = self.changes_since(cursor, batch_size)
+            if not changes:
+                return
+            yield from changes
+    
+    def snapshot(self):
+        """Get (cursor, deadlines) for bootstrapping a mirror; each shard is read in its own snapshot"""
+        cursor, deadlines = [], []
+        for index, shard in enumerate(self.shards):
+            position, rows = shard.snapshot()
+            cursor.append(position)
+            deadlines.append(self._global(rows, index))
+        return tuple(cursor), list(heapq.merge(*deadlines, key=_deadline_order))
+    
+    def compact_changes(self, older_than: timedelta = timedelta(days=7)) -> int:
+        """Compact every shard's change log; returns the total removed, or -1 on error"""
+        counts = [shard.compact_changes(older_than) for shard in self.shards]
+        return -1 if min(counts) < 0 else sum(counts)
+
+class AsyncDeadlineReminder:
+    """asyncio front-end that runs DeadlineReminder calls off the event loop.
+
+    Each worker is a single dedicated database thread, so a connection never
+    hops threads. Every public DeadlineReminder method is available as a
+    coroutine, and iter_* methods become async iterators that pull batches on
+    the worker they started on.
+    """
+    def __init__(self, db_name: str = "deadlines.db", workers: int = 1, **kwargs):
+        self._executors = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"deadline-db-{i}")
+                           for i in range(max(1, workers))]
+        self._next_executor = cycle(self._executors)
+        # One pooled connection per worker thread at least
+        kwargs["pool_size"] = max(kwargs.get("pool_size", 4), len(self._executors))
+        # Open the database on a worker thread too, since it runs migrations
+        self.reminder = self._executors[0].submit(DeadlineReminder, db_name, **kwargs).result()
+        self.notifier = NotificationManager(self.reminder)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def run(self, func, *args, executor=None, **kwargs):
+        """Run func(*args, **kwargs) on a database thread and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor or next(self._next_executor),
+                                          partial(func, *args, **kwargs))
+    
+    def __getattr__(self, name):
+        attr = getattr(self.reminder, name)
+        if name.startswith("_") or name == "transaction" or not callable(attr):
+            raise AttributeError(name)
+        if name.startswith("iter_"):
+            return partial(self._aiter, attr)
+        
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+        
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+    
+    async def _aiter(self, method, *args, fetch_size: int = 500, **kwargs):
+        """Async iterator over a DeadlineReminder iter_* method, pulled in batches"""
+        executor = next(self._next_executor)
+        iterator = await self.run(method, *args, executor=executor, **kwargs)
+        try:
+            while True:
+                batch = await self.run(lambda: list(islice(iterator, fetch_size)), executor=executor)
+                if not batch:
+                    return
+                for item in batch:
+                    yield item
+        finally:
+            await self.run(iterator.close, executor=executor)
+    
+    async def check_upcoming_deadlines(self, days: int = 3):
+        """Async version of NotificationManager.check_upcoming_deadlines"""
+        await self.run(self.notifier.check_upcoming_deadlines, days)
+    
+    async def close(self):
+        """Wait for queued calls, then close the database"""
+        await self.run(self.reminder.close)
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+
+def add_sample_data(reminder):
+    """Add sample data for demonstration"""
+    sample_deadlines = [
+        ("Complete Project Proposal", datetime.now() + timedelta(days=2), Priority.HIGH, "Work"),
+        ("Study for Math Exam", datetime.now() + timedelta(days=5), Priority.URGENT, "Education"),
+        ("Pay Electricity Bill", datetime.now() + timedelta(days=1), Priority.MEDIUM, "Personal"),
+        ("Doctor Appointment", datetime.now() + timedelta(days=7), Priority.LOW, "Health"),
+        ("Team Meeting", datetime.now() + timedelta(days=3), Priority.MEDIUM, "Work"),
+        ("Birthday Party", datetime.now() + timedelta(days=10), Priority.LOW, "Personal"),
+    ]
+    
+    print("Adding sample deadlines...")
+    result = reminder.add_deadlines_bulk(sample_deadlines)
+    for row_number, error in result.errors:
+        print(f"❌ Sample row {row_number}: {error}")
+    print("✅ Sample data added successfully!")
+
+class TableRenderer:
+    """Writes deadlines as a fixed-width table, buffered and optionally paged.
+
+    Everything that does not depend on the row (the current time, priority
+    labels, the row format) is worked out once, and lines are joined into
+    large chunks before being written, so big dumps are not dominated by
+    per-line print calls. Rows are pulled from any iterator, and each page is
+    flushed as soon as it is complete.
+    """
+    # name -> (header, width)
+    COLUMNS = {
+        "id": ("ID", 3),
+        "priority": ("Priority", 8),
+        "due_date": ("Due Date", 12),
+        "status": ("Status", 12),
+        "category": ("Category", 10),
+        "title": ("Title", 30),
+        "due_in": ("", 0),
+    }
+    PRIORITY_ICONS = {Priority.URGENT: "🔴", Priority.HIGH: "🟠", Priority.MEDIUM: "🟡", Priority.LOW: "🟢"}
+    
+    def __init__(self, columns=None, plain: bool = False, page_size: int = None, out=None,
+                 chunk_size: int = 65536, pause=None):
+        columns = tuple(columns or self.COLUMNS)
+        unknown = set(columns) - set(self.COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown table columns: {sorted(unknown)}; choose from {', '.join(self.COLUMNS)}")
+        self.columns = columns
+        self.plain = plain
+        self.page_size = page_size if page_size and page_size > 0 else None
+        self.out = out
+        self.chunk_size = chunk_size
+        # pause() is called between pages; returning False stops the output
+        self.pause = pause
+        self.priority_labels = {value: ("" if plain else icon) + Priority.get_name(value)
+                                for value, icon in self.PRIORITY_ICONS.items()}
+        self._format = " ".join(f"{{:<{self.COLUMNS[column][1]}}}" for column in columns)
+        self._header = " ".join(f"{header:<{width}}" for header, width in map(self.COLUMNS.get, columns) if header)
+    
+    def _getters(self, now: datetime):
+        """One function per selected column, chosen once per render instead of per row"""
+        labels = self.priority_labels
+        
+        def title(deadline):
+            text = deadline.title
+            return text[:27] + "..." if len(text) > 30 else text
+        
+        def due_date(deadline):
+            due = deadline.due_date
+            return f"{due.month:02d}/{due.day:02d}/{due.year}"
+        
+        def due_in(deadline):
+            days_until = (deadline.due_date - now).days
+            return f"Overdue {abs(days_until)}d" if days_until < 0 else f"In {days_until}d"
+        
+        getters = {
+            "id": attrgetter("id"),
+            "priority": lambda deadline: labels.get(deadline.priority) or Priority.get_name(deadline.priority),
+            "due_date": due_date,
+            "status": attrgetter("status"),
+            "category": attrgetter("category"),
+            "title": title,
+            "due_in": due_in,
+        }
+        return [getters[column] for column in self.columns]
+    
+    def render(self, deadlines, title: str) -> int:
+        """Write the table for `deadlines` (a list or any iterator) and return the number of rows written"""
+        out = self.out or sys.stdout
+        deadlines = iter(deadlines)
+        first = next(deadlines, None)
+        if first is None:
+            out.write(f"No {title} found!\n")
+            return 0
+        
+        now = datetime.now()
+        rule = "=" * 100
+        heading = f"{rule}\n{self._header}\n{rule}\n"
+        row_format = self._format.format
+        getters = self._getters(now)
+        buffer, size, count = [f"\n{title}\n", heading], 0, 0
+        
+        for deadline in chain([first], deadlines):
+            if self.page_size and count and count % self.page_size == 0:
+                out.write("".join(buffer))
+                out.flush()
+                buffer, size = [], 0
+                if self.pause is not None and self.pause() is False:
+                    return count
+                buffer.append(heading)
+            line = row_format(*[getter(deadline) for getter in getters]) + "\n"
+            buffer.append(line)
+            size += len(line)
+            count += 1
+            if size >= self.chunk_size:
+                out.write("".join(buffer))
+                buffer, size = [], 0
+        out.write("".join(buffer))
+        out.flush()
+        return count
+
+def _prompt_next_page() -> bool:
+    """Pause between table pages on a terminal; 'q' stops the listing"""
+    try:
+        return input("-- more (Enter to continue, q to quit) --").strip().lower() != "q"
+    except EOFError:
+        return False
+
+def display_deadlines_table(deadlines, title, **options):
+    """Display deadlines in a nice table format; accepts a list or any iterator.
+
+    Keyword options (columns, plain, page_size, out, pause) are passed to TableRenderer.
+    """
+    return TableRenderer(**options).render(deadlines, title)
+
+def _parse_status(value: str) -> str:
+    """Accept a status name case-insensitively, with '-' or '_' for spaces"""
+    wanted = value.strip().lower().replace("-", " ").replace("_", " ")
+    for status in Status.ALL:
+        if status.lower() == wanted:
+            return status
+    raise argparse.ArgumentTypeError(f"invalid status {value!r} (choose from {', '.join(Status.ALL)})")
+
+def _parse_priority(value: str) -> int:
+    try:
+        return Priority.parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _parse_cli_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r} (use YYYY-MM-DD or YYYY-MM-DDTHH:MM)")
+
+def _parse_table_columns(value: str):
+    columns = [column.strip() for column in value.split(",") if column.strip()]
+    unknown = [column for column in columns if column not in TableRenderer.COLUMNS]
+    if unknown or not columns:
+        raise argparse.ArgumentTypeError(f"invalid columns {value!r} (choose from {', '.join(TableRenderer.COLUMNS)})")
+    return columns
+
+def _parse_deadline_id(value: str):
+    """A deadline ID, or an occurrence ID such as R12:3"""
+    if parse_occurrence_id(value) is not None:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ID {value!r} (use a number or R<rule>:<index>)")
+
+def _parse_keyset(value: str):
+    due, _, deadline_id = value.rpartition(",")
+    try:
+        return datetime.fromisoformat(due), _parse_deadline_id(deadline_id)
+    except (ValueError, argparse.ArgumentTypeError):
+        raise argparse.ArgumentTypeError(f"invalid cursor {value!r} (use DUE_DATE,ID)")
+
+def write_deadlines(deadlines, output_format: str, title: str, out=None, **table_options):
+    """Write deadlines as a table, CSV, a JSON array or JSON Lines, streaming row by row"""
+    out = out or sys.stdout
+    if output_format == "table":
+        display_deadlines_table(deadlines, title, out=out, **table_options)
+    elif output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=DEADLINE_COLUMNS)
+        writer.writeheader()
+        for deadline in deadlines:
+            writer.writerow(deadline.to_dict())
+    elif output_format == "jsonl":
+        for deadline in deadlines:
+            out.write(json.dumps(deadline.to_dict()) + "\n")
+    else:
+        out.write("[")
+        for i, deadline in enumerate(deadlines):
+            out.write(("," if i else "") + json.dumps(deadline.to_dict()))
+        out.write("]\n")
+
+def _cli_add(reminder, args):
+    deadline_id = reminder.add_deadline(args.title, args.due, args.priority, args.category, args.description)
+    return deadline_id > 0, {"id": deadline_id}
+
+def _cli_recur(reminder, args):
+    recurrence_id = reminder.add_recurrence(args.title, args.due, args.every, args.priority, args.category,
+                                            args.description, args.interval, args.until, args.count)
+    return recurrence_id > 0, {"id": recurrence_id}
+
+def _cli_reschedule(reminder, args):
+    return reminder.reschedule_occurrence(args.id, args.due), {"rescheduled": args.id}
+
+def _cli_list(reminder, args):
+    return True, reminder.iter_deadlines(include_completed=args.all, category=args.category,
+                                         after=args.after, limit=args.limit)
+
+def _cli_upcoming(reminder, args):
+    return True, reminder.iter_upcoming_deadlines(args.days, category=args.category, limit=args.limit)
+
+def _cli_overdue(reminder, args):
+    return True, reminder.iter_overdue_deadlines(category=args.category, limit=args.limit)
+
+def _cli_bulk_filters(args):
+    """Filter options of set-status/set-priority/delete, or None when only IDs were given"""
+    filters = {"category": args.category, "start": args.due_from, "end": args.due_to,
+               "current_status": args.current_status}
+    return None if all(value is None for value in filters.values()) else filters
+
+def _cli_set_status(reminder, args):
+    filters = _cli_bulk_filters(args)
+    if filters is None and not args.ids:
+        return False, {"error": "pass IDs or at least one filter"}
+    if filters is not None:
+        count = reminder.update_status_many(args.ids or None, args.status, **filters)
+        return count >= 0, {"updated": max(count, 0)}
+    updated = [deadline_id for deadline_id in args.ids if reminder.update_status(deadline_id, args.status)]
+    return len(updated) == len(args.ids), {"updated": updated}
+
+def _cli_set_priority(reminder, args):
+    filters = _cli_bulk_filters(args)
+    if filters is None and not args.ids:
+        return False, {"error": "pass IDs or at least one filter"}
+    if filters is not None:
+        count = reminder.update_priority_many(args.ids or None, args.priority, **filters)
+        return count >= 0, {"updated": max(count, 0)}
+    updated = [deadline_id for deadline_id in args.ids if reminder.update_priority(deadline_id, args.priority)]
+    return len(updated) == len(args.ids), {"updated": updated}
+
+def _cli_delete(reminder, args):
+    filters = _cli_bulk_filters(args)
+    if filters is None and not args.ids:
+        return False, {"error": "pass IDs or at least one filter"}
+    if filters is not None:
+        count = reminder.delete_many(args.ids or None, **filters)
+        return count >= 0, {"deleted": max(count, 0)}
+    deleted = [deadline_id for deadline_id in args.ids if reminder.delete_deadline(deadline_id)]
+    return len(deleted) == len(args.ids), {"deleted": deleted}
+
+def _cli_notify(reminder, args):
+    swept = reminder.sweep_overdue() if args.sweep else []
+    sinks = [FileSink(path, rate=args.rate) for path in args.log_file or ()]
+    sinks += [JsonlSpoolSink(directory, rate=args.rate) for directory in args.spool or ()]
+    sinks += [WebhookSink(url, rate=args.rate) for url in args.webhook or ()]
+    sinks += [MaildirSink(path, args.mail_to, rate=args.rate) for path in args.maildir or ()]
+    if sinks:
+        with NotificationDispatcher(sinks, batch_size=args.batch_size) as dispatcher:
+            queued = NotificationManager(reminder, dispatcher).deliver_notifications(args.days)
+        stats = dispatcher.stats()
+        return not any(counters["failed"] for counters in stats.values()), {"queued": queued, "sinks": stats}
+    if args.format == "table":
+        NotificationManager(reminder).check_upcoming_deadlines(args.days)
+        return True, None
+    return True, {
+        "swept": [deadline.id for deadline in swept],
+        "overdue": [deadline.to_dict() for deadline in reminder.iter_overdue_deadlines()],
+        "upcoming": [deadline.to_dict() for deadline in reminder.iter_upcoming_deadlines(args.days)],
+    }
+
+def _cli_import(reminder, args):
+    result = reminder.import_deadlines(args.path, args.input_format, args.chunk_size)
+    return not result.errors, {"inserted": result.inserted, "id_ranges": result.id_ranges,
+                               "errors": [{"row": row, "error": error} for row, error in result.errors]}
+
+def _cli_search(reminder, args):
+    return True, reminder.search(" ".join(args.query), status=args.status, start=args.start, end=args.end,
+                                 limit=args.limit, prefix=not args.exact, raw=args.raw)
+
+def _cli_reindex(reminder, args):
+    return reminder.rebuild_search_index(), {"rebuilt": True}
+
+def _cli_report(reminder, args):
+    if args.check:
+        drift = reminder.check_summary(repair=args.repair)
+        return not drift or args.repair, {"drift": [dict(zip(REPORT_FIELDS + ("summary", "actual"), row))
+                                                    for row in drift]}
+    if args.completion:
+        return True, {"completion": reminder.completion_stats(args.by or ())}
+    if args.summary:
+        return True, {"counts": reminder.summary_counts(args.by or ("category",), category=args.category,
+                                                        status=args.status, priority=args.priority)}
+    return True, {"counts": reminder.report_counts(args.by or ("status",))}
+
+def _cli_archive(reminder, args):
+    if args.vacuum and not reminder.enable_incremental_vacuum():
+        return False, {"error": "could not enable incremental vacuum"}
+    archived = reminder.run_maintenance(timedelta(days=args.days), args.batch_size)
+    return archived >= 0, {"archived": archived}
+
+def _parse_change_cursor(value: str):
+    """A change-feed cursor: one sequence number, or one per shard separated by commas"""
+    try:
+        positions = tuple(int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid cursor {value!r} (use SEQ or SEQ,SEQ,... per shard)")
+    return positions[0] if len(positions) == 1 else positions
+
+def _cli_changes(reminder, args):
+    if args.compact_days is not None:
+        removed = reminder.compact_changes(timedelta(days=args.compact_days))
+        return removed >= 0, {"compacted": removed}
+    if args.snapshot:
+        cursor, deadlines = reminder.snapshot()
+        return True, {"cursor": cursor, "deadlines": [deadline.to_dict() for deadline in deadlines]}
+    since = args.since
+    if isinstance(reminder, ShardedDeadlineReminder):
+        if isinstance(since, int):
+            since = (since,) * reminder.shard_count if since else None
+    elif isinstance(since, tuple):
+        return False, {"error": f"cursor {','.join(map(str, since))} has one position per shard; "
+                                f"pass --shards to use it"}
+    try:
+        changes, cursor = reminder.changes_since(since, args.limit)
+    except CursorExpiredError as e:
+        return False, {"error": str(e), "expired": True}
+    for change in changes:
+        change["deadline"] = change["deadline"] and change["deadline"].to_dict()
+    return True, {"changes": changes, "cursor": cursor}
+
+def _cli_batch(reminder, args, parser):
+    """Run one command per stdin line against one connection, grouping lines into transactions"""
+    ok = True
+    lines = enumerate(sys.stdin, start=1)
+    while True:
+        group = list(islice(lines, args.group_size))
+        if not group:
+            break
+        with reminder.transaction():
+            for line_number, line in group:
+                # shlex is slow; only pay for it when the line needs quoting rules
+                words = shlex.split(line, comments=True) if any(c in line for c in "'\"\\#") else line.split()
+                if not words:
+                    continue
+                record = {"line": line_number, "command": words[0]}
+                try:
+                    command_args = parser.parse_args(words)
+                    if command_args.handler is None:
+                        raise ValueError("batch commands cannot be nested")
+                    command_args.format = "json"
+                    # A savepoint per command keeps one failure from undoing the group
+                    with reminder.transaction():
+                        record["ok"], result = command_args.handler(reminder, command_args)
+                    if result is not None and not isinstance(result, dict):
+                        result = [deadline.to_dict() for deadline in result]
+                    record["result"] = result
+                except SystemExit:
+                    record.update(ok=False, error="invalid command")
+                except Exception as e:
+                    record.update(ok=False, error=str(e))
+                ok = ok and record["ok"]
+                sys.stdout.write(json.dumps(record) + "\n")
+    return ok
+
+def _add_bulk_filter_arguments(command):
+    """Filters that switch set-status/set-priority/delete to a single bulk statement"""
+    command.add_argument("--category")
+    command.add_argument("--due-from", type=_parse_cli_datetime, help="due on or after this date")
+    command.add_argument("--due-to", type=_parse_cli_datetime, help="due before this date")
+    command.add_argument("--current-status", type=_parse_status, action="append",
+                         help="only deadlines currently in this status (repeatable)")
+
+def build_cli_parser() -> argparse.ArgumentParser:
+    """Argument parser for the non-interactive subcommand CLI"""
+    parser = argparse.ArgumentParser(prog="main.py", description="Deadline reminder command line interface")
+    parser.add_argument("--db", default="deadlines.db", help="SQLite database file (default: deadlines.db)")
+    parser.add_argument("--format", choices=("table", "json", "jsonl", "csv"), default="table",
+                        help="output format (default: table)")
+    parser.add_argument("--page-size", type=int, help="table rows per page; pauses between pages on a terminal")
+    parser.add_argument("--columns", type=_parse_table_columns,
+                        help=f"comma-separated table columns ({','.join(TableRenderer.COLUMNS)})")
+    parser.add_argument("--plain", action="store_true", help="no emoji in table output, e.g. for pipes")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="spread the store over this many files (<db>-0.db, <db>-1.db, ...)")
+    parser.add_argument("--verbose", action="store_true", help="log every operation to stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    add = commands.add_parser("add", help="add a deadline")
+    add.add_argument("title")
+    add.add_argument("--due", type=_parse_cli_datetime, required=True, help="YYYY-MM-DD[THH:MM]")
+    add.add_argument("--priority", type=_parse_priority, default=Priority.MEDIUM, help="1-4 or LOW..URGENT")
+    add.add_argument("--category", required=True)
+    add.add_argument("--description", default="")
+    add.set_defaults(handler=_cli_add)
+    
+    recur = commands.add_parser("recur", help="add a recurring deadline")
+    recur.add_argument("title")
+    recur.add_argument("--due", type=_parse_cli_datetime, required=True, help="first occurrence, YYYY-MM-DD[THH:MM]")
+    recur.add_argument("--every", choices=RecurrenceRule.FREQUENCIES, required=True)
+    recur.add_argument("--interval", type=int, default=1, help="repeat every N days/weeks/months (default 1)")
+    recur.add_argument("--until", type=_parse_cli_datetime, help="no occurrences after this date")
+    recur.add_argument("--count", type=int, help="stop after this many occurrences")
+    recur.add_argument("--priority", type=_parse_priority, default=Priority.MEDIUM, help="1-4 or LOW..URGENT")
+    recur.add_argument("--category", required=True)
+    recur.add_argument("--description", default="")
+    recur.set_defaults(handler=_cli_recur)
+    
+    reschedule = commands.add_parser("reschedule", help="move one occurrence of a recurring deadline")
+    reschedule.add_argument("id", type=_parse_deadline_id, help="occurrence ID such as R12:3")
+    reschedule.add_argument("--due", type=_parse_cli_datetime, required=True)
+    reschedule.set_defaults(handler=_cli_reschedule)
+    
+    listing = commands.add_parser("list", help="list deadlines ordered by due date")
+    listing.add_argument("--all", action="store_true", help="include completed deadlines")
+    listing.add_argument("--category")
+    listing.add_argument("--limit", type=int)
+    listing.add_argument("--after", type=_parse_keyset, help="resume after DUE_DATE,ID of the last row seen")
+    listing.set_defaults(handler=_cli_list)
+    
+    upcoming = commands.add_parser("upcoming", help="list deadlines due in the next N days")
+    upcoming.add_argument("--days", type=int, default=7)
+    upcoming.add_argument("--category")
+    upcoming.add_argument("--limit", type=int)
+    upcoming.set_defaults(handler=_cli_upcoming)
+    
+    overdue = commands.add_parser("overdue", help="list overdue deadlines")
+    overdue.add_argument("--category")
+    overdue.add_argument("--limit", type=int)
+    overdue.set_defaults(handler=_cli_overdue)
+    
+    set_status = commands.add_parser("set-status", help="change the status of deadlines")
+    set_status.add_argument("status", type=_parse_status)
+    set_status.add_argument("ids", type=_parse_deadline_id, nargs="*")
+    _add_bulk_filter_arguments(set_status)
+    set_status.set_defaults(handler=_cli_set_status)
+    
+    set_priority = commands.add_parser("set-priority", help="change the priority of deadlines")
+    set_priority.add_argument("priority", type=_parse_priority)
+    set_priority.add_argument("ids", type=_parse_deadline_id, nargs="*")
+    _add_bulk_filter_arguments(set_priority)
+    set_priority.set_defaults(handler=_cli_set_priority)
+    
+    delete = commands.add_parser("delete", help="delete deadlines")
+    delete.add_argument("ids", type=_parse_deadline_id, nargs="*")
+    _add_bulk_filter_arguments(delete)
+    delete.set_defaults(handler=_cli_delete)
+    
+    notify = commands.add_parser("notify", help="report overdue and upcoming deadlines")
+    notify.add_argument("--days", type=int, default=3)
+    notify.add_argument("--sweep", action="store_true", help="persist the Overdue status first")
+    notify.add_argument("--log-file", action="append", help="deliver new notifications to a text file (repeatable)")
+    notify.add_argument("--spool", action="append", help="deliver to a JSON Lines spool directory (repeatable)")
+    notify.add_argument("--webhook", action="append", help="POST batches to this URL (repeatable)")
+    notify.add_argument("--maildir", action="append", help="deliver as email into this Maildir (repeatable)")
+    notify.add_argument("--mail-to", default="me@localhost", help="recipient for --maildir")
+    notify.add_argument("--rate", type=float, help="max notifications per second per sink")
+    notify.add_argument("--batch-size", type=int, default=500)
+    notify.set_defaults(handler=_cli_notify)
+    
+    importer = commands.add_parser("import", help="bulk import a CSV or JSON Lines file")
+    importer.add_argument("path")
+    importer.add_argument("--input-format", choices=("csv", "jsonl"), help="default: from the file extension")
+    importer.add_argument("--chunk-size", type=int, default=5000)
+    importer.set_defaults(handler=_cli_import)
+    
+    search = commands.add_parser("search", help="full-text search over titles, descriptions and categories")
+    search.add_argument("query", nargs="+")
+    search.add_argument("--status", type=_parse_status, action="append", help="repeatable")
+    search.add_argument("--from", dest="start", type=_parse_cli_datetime, help="due on or after")
+    search.add_argument("--to", dest="end", type=_parse_cli_datetime, help="due before")
+    search.add_argument("--limit", type=int, default=50)
+    search.add_argument("--exact", action="store_true", help="match whole words instead of prefixes")
+    search.add_argument("--raw", action="store_true", help="pass the query to FTS5 unchanged")
+    search.set_defaults(handler=_cli_search)
+    
+    reindex = commands.add_parser("reindex", help="rebuild the full-text search index")
+    reindex.set_defaults(handler=_cli_reindex)
+    
+    report = commands.add_parser("report", help="aggregate counts and completion latency")
+    report.add_argument("--by", action="append", choices=REPORT_FIELDS, help="group by field (repeatable)")
+    report.add_argument("--completion", action="store_true", help="completion latency instead of counts")
+    report.add_argument("--summary", action="store_true", help="read counts from the summary table")
+    report.add_argument("--category")
+    report.add_argument("--status", type=_parse_status)
+    report.add_argument("--priority", type=_parse_priority)
+    report.add_argument("--check", action="store_true", help="check the summary table for drift")
+    report.add_argument("--repair", action="store_true", help="with --check, rebuild on drift")
+    report.set_defaults(handler=_cli_report)
+    
+    archive = commands.add_parser("archive", help="archive old completed deadlines, then vacuum and analyze")
+    archive.add_argument("--days", type=float, default=90, help="archive rows completed over N days ago (default 90)")
+    archive.add_argument("--batch-size", type=int, default=1000, help="rows moved per transaction")
+    archive.add_argument("--vacuum", action="store_true",
+                         help="first rewrite the file once so later runs can reclaim free pages")
+    archive.set_defaults(handler=_cli_archive)
+    
+    changes = commands.add_parser("changes", help="incremental change feed for mirroring deadlines")
+    changes.add_argument("--since", type=_parse_change_cursor, default=0, help="cursor from the previous call")
+    changes.add_argument("--limit", type=int, default=1000)
+    changes.add_argument("--snapshot", action="store_true", help="all deadlines plus the cursor to follow from")
+    changes.add_argument("--compact-days", type=float, help="drop change entries older than N days")
+    changes.set_defaults(handler=_cli_changes)
+    
+    batch = commands.add_parser("batch", help="run many commands read from stdin, one per line")
+    batch.add_argument("--group-size", type=int, default=1000, help="commands per transaction (default 1000)")
+    batch.set_defaults(handler=None)
+    return parser
+
+def run_cli(argv) -> int:
+    """Run one CLI command (or a stdin batch) and return the process exit code"""
+    parser = build_cli_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    store = ShardedDeadlineReminder(args.db, shards=args.shards) if args.shards else DeadlineReminder(args.db)
+    with store as reminder:
+        if args.command == "batch":
+            return 0 if _cli_batch(reminder, args, parser) else 1
+        ok, result = args.handler(reminder, args)
+        if isinstance(result, dict):
+            sys.stdout.write(json.dumps(result) + "\n")
+        elif result is not None:
+            # Only pause between pages when someone is there to press Enter
+            interactive = sys.stdin.isatty() and sys.stdout.isatty()
+            write_deadlines(result, args.format, args.command.upper(), columns=args.columns, plain=args.plain,
+                            page_size=args.page_size, pause=_prompt_next_page if interactive else None)
+        return 0 if ok else 1
+
+def main():
+    """Main function to run the deadline reminder application"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    print("📅 DEADLINE REMINDER & TRACKING SYSTEM")
+    print("=" * 60)
+    
+    # Initialize reminder and notifier
+    reminder = DeadlineReminder(cache_size=256)
+    notifier = NotificationManager(reminder)
+    reminder.start_overdue_sweeper()
+    
+    # Ask if user wants sample data
+    try:
+        add_samples = input("Do you want to load sample data for testing? (y/n): ").strip().lower()
+        if add_samples == 'y':
+            add_sample_data(reminder)
+    except:
+        pass
+    
+    while True:
+        print("\n" + "=" * 60)
+        print("📅 DEADLINE REMINDER MENU")
+        print("=" * 60)
+        print("1. Add New Deadline")
+        print("2. View All Deadlines")
+        print("3. View Upcoming Deadlines")
+        print("4. View Overdue Deadlines")
+        print("5. Update Deadline Status")
+        print("6. Update Deadline Priority")
+        print("7. Delete Deadline")
+        print("8. Check Notifications")
+        print("9. Exit")
+        print("-" * 60)
+        
+        try:
+            choice = input("Enter your choice (1-9): ").strip()
+            
+            if choice == '1':
+                print("\n➕ ADD NEW DEADLINE")
+                try:
+                    title = input("Enter title: ").strip()
+                    if not title:
+                        print("❌ Title cannot be empty!")
+                        continue
+                    
+                    due_date_str = input("Enter due date (YYYY-MM-DD): ").strip()
+                    due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
+                    
+                    print("\nPriority Levels:")
+                    print("  1. LOW 🟢")
+                    print("  2. MEDIUM 🟡") 
+                    print("  3. HIGH 🟠")
+                    print("  4. URGENT 🔴")
+                    
+                    priority_choice = int(input("Enter priority (1-4): "))
+                    if priority_choice not in [1, 2, 3, 4]:
+                        print("❌ Invalid priority! Please enter 1-4.")
+                        continue
+                    
+                    category = input("Enter category: ").strip()
+                    description = input("Enter description (optional): ").strip()
+                    
+                    reminder.add_deadline(title, due_date, priority_choice, category, description)
+                    
+                except ValueError as e:
+                    print(f"❌ Invalid input: {e}")
+                except Exception as e:
+                    print(f"❌ Error adding deadline: {e}")
+            
+            elif choice == '2':
+                print("\n📋 ALL DEADLINES")
+                include_completed = input("Include completed deadlines? (y/n): ").strip().lower() == 'y'
+                deadlines = reminder.iter_deadlines(include_completed)
+                display_deadlines_table(deadlines, "ALL DEADLINES")
+            
+            elif choice == '3':
+                print("\n📅 UPCOMING DEADLINES")
+                try:
+                    days = int(input("Enter number of days to look ahead (default 7): ") or "7")
+                    deadlines = reminder.iter_upcoming_deadlines(days)
+                    display_deadlines_table(deadlines, f"UPCOMING DEADLINES (Next {days} days)")
+                except ValueError:
+                    print("❌ Invalid number of days!")
+            
+            elif choice == '4':
+                print("\n❌ OVERDUE DEADLINES")
+                deadlines = reminder.iter_overdue_deadlines()
+                display_deadlines_table(deadlines, "OVERDUE DEADLINES")
+            
+            elif choice == '5':
+                print("\n🔄 UPDATE DEADLINE STATUS")
+                try:
+                    deadline_id = int(input("Enter deadline ID: "))
+                    deadline = reminder.get_deadline(deadline_id)
+                    
+                    if not deadline:
+                        print("❌ Deadline not found!")
+                        continue
+                    
+                    print(f"\nCurrent status: {deadline.status}")
+                    print("Available statuses:")
+                    print(f"  1. {Status.PENDING}")
+                    print(f"  2. {Status.IN_PROGRESS}")
+                    print(f"  3. {Status.COMPLETED}")
+                    
+                    status_choice = input("Enter status (1-3 or type the status name): ").strip()
+                    
+                    if status_choice == "1":
+                        new_status = Status.PENDING
+                    elif status_choice == "2":
+                        new_status = Status.IN_PROGRESS
+                    elif status_choice == "3":
+                        new_status = Status.COMPLETED
+                    else:
+                        new_status = status_choice
+                    
+                    # Validate status
+                    valid_statuses = [Status.PENDING, Status.IN_PROGRESS, Status.COMPLETED, Status.OVERDUE]
+                    if new_status not in valid_statuses:
+                        print("❌ Invalid status!")
+                        continue
+                    
+                    reminder.update_status(deadline_id, new_status)
+                    
+                except (ValueError, KeyError):
+                    print("❌ Invalid deadline ID or status!")
+            
+            elif choice == '6':
+                print("\n🎯 UPDATE DEADLINE PRIORITY")
+                try:
+                    deadline_id = int(input("Enter deadline ID: "))
+                    deadline = reminder.get_deadline(deadline_id)
+                    
+                    if not deadline:
+                        print("❌ Deadline not found!")
+                        continue
+                    
+                    print(f"\nCurrent priority: {Priority.get_name(deadline.priority)}")
+                    print("Available priorities:")
+                    print("  1. LOW 🟢")
+                    print("  2. MEDIUM 🟡")
+                    print("  3. HIGH 🟠")
+                    print("  4. URGENT 🔴")
+                    
+                    new_priority = int(input("Enter new priority (1-4): "))
+                    if new_priority not in [1, 2, 3, 4]:
+                        print("❌ Invalid priority! Please enter 1-4.")
+                        continue
+                    
+                    reminder.update_priority(deadline_id, new_priority)
+                    
+                except (ValueError, KeyError):
+                    print("❌ Invalid deadline ID or priority!")
+            
+            elif choice == '7':
+                print("\n🗑️ DELETE DEADLINE")
+                try:
+                    deadline_id = int(input("Enter deadline ID to delete: "))
+                    deadline = reminder.get_deadline(deadline_id)
+                    
+                    if not deadline:
+                        print("❌ Deadline not found!")
+                        continue
+                    
+                    confirm = input(f"Are you sure you want to delete '{deadline.title}'? (y/n): ").strip().lower()
+                    if confirm == 'y':
+                        reminder.delete_deadline(deadline_id)
+                    else:
+                        print("Deletion cancelled.")
+                        
+                except ValueError:
+                    print("❌ Invalid deadline ID!")
+            
+            elif choice == '8':
+                print("\n🔔 NOTIFICATIONS")
+                try:
+                    days = int(input("Enter days to check for upcoming deadlines (default 3): ") or "3")
+                    notifier.check_upcoming_deadlines(days)
+                except ValueError:
+                    print("❌ Invalid number of days!")
+            
+            elif choice == '9':
+                print("\n👋 Thank you for using Deadline Reminder! Stay productive! 🚀")
+                break
+            
+            else:
+                print("❌ Invalid choice! Please enter a number between 1-9.")
+                
+        except KeyboardInterrupt:
+            print("\n\n👋 Program interrupted by user. Goodbye!")
+            break
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+    
+    reminder.close()
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
\ No newline at end of file
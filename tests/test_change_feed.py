@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import CursorExpiredError, DeadlineReminder, Priority, Status
+
+
+def _row(deadline):
+    return (deadline.id, deadline.title, deadline.due_date, deadline.priority, deadline.status, deadline.category)
+
+
+class ChangeFeedTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reminder = DeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"))
+        self.due = datetime.now().replace(microsecond=0) + timedelta(days=3)
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def _add(self, title):
+        return self.reminder.add_deadline(title, self.due, Priority.LOW, "Work")
+
+    def test_compacted_cursor_raises(self):
+        for i in range(3):
+            self._add(f"Task {i}")
+        changes, cursor = self.reminder.changes_since(0)
+        self.assertEqual([change["op"] for change in changes], ["insert"] * 3)
+
+        self._add("Later")
+        # A negative age puts every entry written so far behind the cutoff
+        self.assertEqual(self.reminder.compact_changes(timedelta(seconds=-5)), 4)
+        with self.assertRaises(CursorExpiredError):
+            self.reminder.changes_since(cursor)
+        with self.assertRaises(ValueError):
+            list(self.reminder.iter_changes(0))
+
+        # A fresh snapshot gives a cursor that is still valid
+        cursor, deadlines = self.reminder.snapshot()
+        self.assertEqual(len(deadlines), 4)
+        self.assertEqual(self.reminder.changes_since(cursor), ([], cursor))
+
+    def test_snapshot_plus_changes_reproduces_the_table(self):
+        ids = [self._add(f"Task {i}") for i in range(6)]
+        self.reminder.update_status(ids[0], Status.COMPLETED)
+        cursor, deadlines = self.reminder.snapshot()
+        mirror = {deadline.id: _row(deadline) for deadline in deadlines}
+        self.assertEqual(sorted(mirror), sorted(ids))
+
+        new_id = self._add("New")
+        self.reminder.update_priority(ids[1], Priority.URGENT)
+        self.reminder.update_status(ids[2], Status.COMPLETED)
+        self.reminder.delete_deadline(ids[3])
+        self.assertEqual(self.reminder.archive_completed(timedelta(0), now=datetime.now() + timedelta(seconds=5)), 2)
+
+        ops = set()
+        for change in self.reminder.iter_changes(cursor, batch_size=2):
+            ops.add(change["op"])
+            if change["op"] in ("insert", "update") and change["deadline"] is not None:
+                mirror[change["id"]] = _row(change["deadline"])
+            else:
+                mirror.pop(change["id"], None)
+
+        self.assertEqual(ops, {"insert", "update", "delete", "archive"})
+        live = {deadline.id: _row(deadline) for deadline in self.reminder.get_all_deadlines(include_completed=True,
+                                                                                          include_archived=False)}
+        self.assertEqual(mirror, live)
+        self.assertEqual(sorted(live), sorted([ids[1], ids[4], ids[5], new_id]))
+        self.assertEqual(mirror[ids[1]][3], Priority.URGENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import DeadlineReminder, Priority
+
+
+class InterleavedIteratorsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reminder = DeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"))
+        now = datetime.now()
+        self.ids = [self.reminder.add_deadline(f"Task {i}", now + timedelta(days=i), Priority.LOW, "Work")
+                    for i in range(10)]
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def test_generators_finishing_out_of_order_keep_the_connection_usable(self):
+        first = self.reminder.iter_deadlines(batch_size=2)
+        second = self.reminder.iter_deadlines(batch_size=2)
+        seen_first = [next(first).id]
+        seen_second = [next(second).id]
+        # The generator that checked the connection out first finishes first
+        seen_first.extend(deadline.id for deadline in first)
+        seen_second.extend(deadline.id for deadline in second)
+
+        self.assertEqual(seen_first, self.ids)
+        self.assertEqual(seen_second, self.ids)
+        self.assertEqual(len(self.reminder.get_all_deadlines()), len(self.ids))
+        self.assertEqual(self.reminder.get_deadline(self.ids[0]).id, self.ids[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import main
+from main import DeadlineReminder, SCHEMA_MIGRATIONS
+
+
+def _broken_step(conn):
+    raise sqlite3.OperationalError("simulated upgrade failure")
+
+
+class FailedMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "deadlines.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_failed_step_stops_startup_and_rolls_back_its_version(self):
+        latest = SCHEMA_MIGRATIONS[-1][0]
+        broken = SCHEMA_MIGRATIONS + [(latest + 1, "Broken upgrade", ["CREATE TABLE half_done (x)", _broken_step])]
+        with mock.patch.object(main, "SCHEMA_MIGRATIONS", broken):
+            with self.assertRaises(sqlite3.OperationalError):
+                DeadlineReminder(self.path)
+
+        conn = sqlite3.connect(self.path)
+        try:
+            version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+            leftover = conn.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(version, latest)
+        self.assertIsNone(leftover)
+
+        # The last good version still opens normally
+        with DeadlineReminder(self.path) as reminder:
+            self.assertEqual(reminder.get_schema_version(), latest)
+
+
+if __name__ == "__main__":
+    unittest.main()
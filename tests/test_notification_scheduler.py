@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import DeadlineReminder, NotificationScheduler, Priority
+
+
+class SchedulerTimingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reminder = DeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"))
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def test_sub_second_due_times_fire_on_time(self):
+        fired = {}
+        done = threading.Event()
+
+        def on_reminder(deadline, offset):
+            fired["reminder"] = time.time()
+
+        def on_overdue(deadline):
+            fired["overdue"] = time.time()
+            done.set()
+
+        # Half a second into a whole second, so truncating due_ts would fire early
+        start = time.time()
+        due = datetime.fromtimestamp(int(start) + 2.5)
+        self.reminder.add_deadline("Soon", due, Priority.HIGH, "Work")
+        scheduler = NotificationScheduler(self.reminder, offsets=(timedelta(seconds=1),),
+                                          on_reminder=on_reminder, on_overdue=on_overdue).start()
+        try:
+            self.assertTrue(done.wait(5))
+        finally:
+            scheduler.stop()
+
+        self.assertIn("reminder", fired)
+        self.assertGreaterEqual(fired["reminder"], due.timestamp() - 1)
+        self.assertGreaterEqual(fired["overdue"], due.timestamp())
+        self.assertLess(fired["overdue"], due.timestamp() + 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
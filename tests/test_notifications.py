@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import DeadlineReminder, NotificationDispatcher, NotificationManager, NotificationSink, Priority
+
+
+class FlakySink(NotificationSink):
+    """Fails every batch until `broken` is cleared, then records what it receives"""
+    def __init__(self):
+        super().__init__(name="flaky")
+        self.broken = True
+        self.received = []
+
+    def deliver(self, batch):
+        if self.broken:
+            raise ConnectionError("sink unavailable")
+        self.received.extend(batch)
+
+
+class FailedDeliveryRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reminder = DeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"))
+        self.deadline_id = self.reminder.add_deadline("Report", datetime.now() + timedelta(days=1), Priority.HIGH,
+                                                      "Work")
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def test_sink_fails_then_a_later_cycle_delivers(self):
+        sink = FlakySink()
+        with NotificationDispatcher([sink], workers=1, max_retries=0, backoff=0) as dispatcher:
+            manager = NotificationManager(self.reminder, dispatcher)
+
+            self.assertEqual(manager.deliver_notifications(), 1)
+            dispatcher.flush()
+            self.assertEqual(dispatcher.stats()["flaky"]["failed"], 1)
+            self.assertEqual(sink.received, [])
+
+            sink.broken = False
+            self.assertEqual(manager.deliver_notifications(), 1)
+            dispatcher.flush()
+            self.assertEqual([item["deadline_id"] for item in sink.received], [self.deadline_id])
+
+            # Delivered claims stay put, so nothing is sent a third time
+            self.assertEqual(manager.deliver_notifications(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
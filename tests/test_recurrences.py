@@ -0,0 +1,67 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import DeadlineReminder, Priority, Status, occurrence_id
+
+
+class RecurrenceExpansionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reminder = DeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"))
+        self.first = datetime(2030, 1, 6, 9, 0)
+        self.window = (self.first, self.first + timedelta(days=30))
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def _expand(self, **options):
+        return [(deadline.id, deadline.due_date) for deadline in self.reminder.iter_occurrences(*self.window,
+                                                                                                 **options)]
+
+    def test_count_limits_the_occurrences(self):
+        rid = self.reminder.add_recurrence("Standup", self.first, "daily", Priority.LOW, "Work", count=5)
+        self.assertEqual(self._expand(), [(occurrence_id(rid, k), self.first + timedelta(days=k)) for k in range(5)])
+
+        # A window inside the series starts at the first occurrence due at or after its start
+        inner = list(self.reminder.iter_occurrences(self.first + timedelta(days=2, hours=1),
+                                                    self.first + timedelta(days=4)))
+        self.assertEqual([deadline.id for deadline in inner], [occurrence_id(rid, 3)])
+
+    def test_overrides_move_skip_and_complete_occurrences(self):
+        rid = self.reminder.add_recurrence("Standup", self.first, "daily", Priority.LOW, "Work", count=5)
+        moved_to = self.first + timedelta(days=10)
+        self.assertTrue(self.reminder.reschedule_occurrence(occurrence_id(rid, 1), moved_to))
+        self.assertTrue(self.reminder.delete_deadline(occurrence_id(rid, 2)))
+        self.assertTrue(self.reminder.update_status(occurrence_id(rid, 3), Status.COMPLETED))
+
+        expected = [(occurrence_id(rid, 0), self.first),
+                    (occurrence_id(rid, 4), self.first + timedelta(days=4)),
+                    (occurrence_id(rid, 1), moved_to)]
+        self.assertEqual(self._expand(), expected)
+
+        with_completed = self._expand(include_completed=True)
+        self.assertIn((occurrence_id(rid, 3), self.first + timedelta(days=3)), with_completed)
+        self.assertNotIn(occurrence_id(rid, 2), [deadline_id for deadline_id, _ in with_completed])
+
+        completed = self.reminder.get_deadline(occurrence_id(rid, 3))
+        self.assertEqual(completed.status, Status.COMPLETED)
+        # The skipped and completed occurrences are passed over
+        self.assertEqual(self.reminder.next_occurrence(occurrence_id(rid, 1)).id, occurrence_id(rid, 4))
+
+    def test_monthly_rule_keeps_the_day_of_month(self):
+        first = datetime(2030, 1, 31, 9, 0)
+        rid = self.reminder.add_recurrence("Rent", first, "monthly", Priority.HIGH, "Home", count=3)
+        occurrences = list(self.reminder.iter_occurrences(first, first + timedelta(days=90)))
+        self.assertEqual([deadline.due_date for deadline in occurrences],
+                         [first, datetime(2030, 2, 28, 9, 0), datetime(2030, 3, 31, 9, 0)])
+        self.assertEqual([deadline.id for deadline in occurrences], [occurrence_id(rid, k) for k in range(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import Priority, ShardedDeadlineReminder, Status
+
+CATEGORIES = ["Work", "Home", "School", "Health", "Travel", "Finance"]
+
+
+class ShardedStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = ShardedDeadlineReminder(os.path.join(self.tmpdir.name, "deadlines.db"), shards=3, processes=0)
+        base = datetime.now().replace(microsecond=0) + timedelta(days=1)
+        self.added = {}
+        for i in range(40):
+            category = CATEGORIES[i % len(CATEGORIES)]
+            # Few distinct due dates, so pages often split between equal ones
+            due = base + timedelta(hours=i % 5)
+            self.added[self.store.add_deadline(f"Task {i}", due, Priority.MEDIUM, category)] = (f"Task {i}", due,
+                                                                                               category)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_categories_spread_over_several_shards(self):
+        self.assertGreater(len({self.store.shard_for(category) for category in CATEGORIES}), 1)
+        self.assertEqual(len(self.added), 40)
+
+    def test_global_ids_route_to_the_owning_shard(self):
+        for deadline_id, (title, due, category) in self.added.items():
+            self.assertEqual(deadline_id % self.store.shard_count, self.store.shard_for(category))
+            deadline = self.store.get_deadline(deadline_id)
+            self.assertEqual((deadline.id, deadline.title, deadline.due_date), (deadline_id, title, due))
+
+        target = next(iter(self.added))
+        self.assertTrue(self.store.update_status(target, Status.COMPLETED))
+        self.assertEqual(self.store.get_deadline(target).status, Status.COMPLETED)
+        others = [deadline_id for deadline_id in self.added if deadline_id != target]
+        self.assertTrue(all(self.store.get_deadline(deadline_id).status != Status.COMPLETED for deadline_id in others))
+
+        self.assertTrue(self.store.delete_deadline(target))
+        self.assertIsNone(self.store.get_deadline(target))
+        self.assertEqual(len(self.store.get_all_deadlines()), 39)
+
+    def test_keyset_pages_cover_every_deadline_in_order(self):
+        expected = sorted(self.added, key=lambda deadline_id: (self.added[deadline_id][1], deadline_id))
+        self.assertEqual([deadline.id for deadline in self.store.iter_deadlines()], expected)
+
+        seen, after = [], None
+        while True:
+            page = list(self.store.iter_deadlines(after=after, limit=7))
+            if not page:
+                break
+            self.assertLessEqual(len(page), 7)
+            seen.extend(deadline.id for deadline in page)
+            after = (page[-1].due_date, page[-1].id)
+        self.assertEqual(seen, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from main import DeadlineReminder, Priority, Status
+
+
+class WriteBehindTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "deadlines.db")
+        self.reminder = DeadlineReminder(self.path)
+        self.due = datetime.now().replace(microsecond=0) + timedelta(days=2)
+
+    def tearDown(self):
+        self.reminder.close()
+        self.tmpdir.cleanup()
+
+    def _add(self, title):
+        return self.reminder.add_deadline(title, self.due, Priority.MEDIUM, "Work")
+
+    def test_futures_resolve_with_the_method_results(self):
+        self.reminder.start_write_behind()
+        futures = [self._add(f"Task {i}") for i in range(20)]
+        ids = [future.result(5) for future in futures]
+        self.assertEqual(len(set(ids)), 20)
+        self.assertTrue(all(isinstance(deadline_id, int) and deadline_id > 0 for deadline_id in ids))
+
+        self.assertTrue(self.reminder.update_status(ids[0], Status.COMPLETED).result(5))
+        self.assertFalse(self.reminder.update_status(10 ** 9, Status.COMPLETED).result(5))
+        self.assertTrue(self.reminder.delete_deadline(ids[1]).result(5))
+        self.assertEqual(self.reminder.get_deadline(ids[0]).status, Status.COMPLETED)
+        self.assertIsNone(self.reminder.get_deadline(ids[1]))
+
+    def test_flush_commits_every_queued_write(self):
+        self.reminder.start_write_behind(max_delay=1.0)
+        futures = [self._add(f"Task {i}") for i in range(50)]
+        self.reminder.flush(5)
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(len(self.reminder.get_all_deadlines()), 50)
+
+    def test_close_keeps_every_acknowledged_write(self):
+        self.reminder.start_write_behind(max_delay=1.0)
+        futures = [self._add(f"Task {i}") for i in range(200)]
+        self.reminder.close()
+        ids = [future.result(0) for future in futures]
+
+        conn = sqlite3.connect(self.path)
+        try:
+            stored = [row[0] for row in conn.execute("SELECT id FROM deadlines ORDER BY id")]
+        finally:
+            conn.close()
+        self.assertEqual(stored, sorted(ids))
+
+    def test_full_queue_applies_backpressure_without_losing_writes(self):
+        self.reminder.start_write_behind(max_batch=3, max_pending=2)
+        futures = [self._add(f"Task {i}") for i in range(30)]
+        self.reminder.stop_write_behind()
+        self.assertEqual(len({future.result(0) for future in futures}), 30)
+        # Write methods are synchronous again
+        self.assertIsInstance(self._add("After"), int)
+        self.assertEqual(len(self.reminder.get_all_deadlines()), 31)
+
+    def test_listeners_run_after_the_group_commits(self):
+        seen = []
+        observed = threading.Event()
+
+        def listener(event, deadline_id, due_ts, status):
+            # A fresh connection only sees the row once the group has committed
+            conn = sqlite3.connect(self.path)
+            try:
+                seen.append(conn.execute("SELECT COUNT(*) FROM deadlines WHERE id = ?",
+                                         (deadline_id,)).fetchone()[0])
+            finally:
+                conn.close()
+            observed.set()
+
+        self.reminder.add_listener(listener)
+        self.reminder.start_write_behind()
+        self._add("Task").result(5)
+        self.assertTrue(observed.wait(5))
+        self.assertEqual(seen, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()